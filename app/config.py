@@ -23,6 +23,8 @@ class Directories:
     LOGS = BASE_DIR / "logs"
     TEMP = BASE_DIR / "temp"
     BACKUPS = DATA / "backups"
+    JOBS = DATA / "jobs"
+    PROMPT_CACHE = DATA / "prompt_cache"
 
 
 # 파일 경로 설정
@@ -31,6 +33,10 @@ class Files:
     CONFIRM = Directories.DATA / "confirmed_questions.json"
     TRASH = Directories.DATA / "trash.json"
     CONFIG = Directories.DATA / "config.json"
+    JOURNAL = Directories.DATA / "storage_journal.jsonl"
+    SQLITE = Directories.DATA / "topik.sqlite3"
+    WARM_POOL = Directories.DATA / "warm_pool.json"
+    USAGE_LOG = Directories.DATA / "usage_log.jsonl"
 
 
 # AI 모델 설정
@@ -39,6 +45,10 @@ class AIConfig:
     # OpenAI API 키 (환경 변수에서 가져오거나 기본값 사용)
     API_KEY = os.getenv("OPENAI_API_KEY")
     
+    # OpenAI 호환 API 주소 (기본값: None이면 api.openai.com)
+    # 예: 로컬 스텁 서버(benchmarks/stub_openai.py) http://127.0.0.1:8001/v1
+    BASE_URL = os.getenv("OPENAI_BASE_URL") or None
+    
     # 모델 설정
     MODEL = os.getenv("GPT_MODEL", "gpt-3.5-turbo")
     
@@ -46,6 +56,41 @@ class AIConfig:
     TEMPERATURE = float(os.getenv("GPT_TEMPERATURE", "0.7"))
     MAX_TOKENS = int(os.getenv("GPT_MAX_TOKENS", "1500"))
     
+    # 유형별 출력 토큰 예산 (템플릿 길이 목표로 시작해 사용량 기록의 출력 토큰 백분위수로 조정)
+    # MAX_TOKENS가 상한이며, 응답이 잘리면(finish_reason "length") 예산을 늘려 다시 호출
+    OUTPUT_BUDGET_ENABLED = os.getenv("OUTPUT_BUDGET_ENABLED", "True").lower() in ("true", "1", "yes")
+    OUTPUT_BUDGET_MIN = int(os.getenv("OUTPUT_BUDGET_MIN", "256"))
+    OUTPUT_BUDGET_PERCENTILE = float(os.getenv("OUTPUT_BUDGET_PERCENTILE", "99"))
+    OUTPUT_BUDGET_HEADROOM = float(os.getenv("OUTPUT_BUDGET_HEADROOM", "1.25"))
+    OUTPUT_BUDGET_MIN_SAMPLES = int(os.getenv("OUTPUT_BUDGET_MIN_SAMPLES", "20"))
+    OUTPUT_BUDGET_WINDOW = int(os.getenv("OUTPUT_BUDGET_WINDOW", "500"))
+    TRUNCATION_RETRIES = int(os.getenv("GPT_TRUNCATION_RETRIES", "2"))
+    
+    # 한 번의 호출로 생성할 후보 수 (1보다 크면 로컬 점수가 가장 높은 후보를 사용하고 나머지는 웜 풀에 보관)
+    GENERATION_CANDIDATES = int(os.getenv("GPT_GENERATION_CANDIDATES", "1"))
+    
+    # HTTP 연결 풀 설정 (애플리케이션 전체에서 공유하는 AsyncOpenAI 클라이언트)
+    HTTP_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "100"))
+    HTTP_MAX_KEEPALIVE = int(os.getenv("OPENAI_MAX_KEEPALIVE", "20"))
+    HTTP_KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "30"))
+    REQUEST_TIMEOUT = float(os.getenv("OPENAI_REQUEST_TIMEOUT", "120"))
+    
+    # 구조화된 출력 방식 ("json_schema": 유형별 스키마, "json_object": JSON 모드, "off": 사용 안 함)
+    # 모델/백엔드가 지원하지 않으면 json_schema → json_object → off 순서로 자동 전환
+    RESPONSE_FORMAT = os.getenv("GPT_RESPONSE_FORMAT", "json_schema").lower()
+    
+    # 업스트림 속도 제한 (분당 요청 수/토큰 수, 0이면 제한 없음) 및 재시도 설정
+    RATE_LIMIT_RPM = int(os.getenv("OPENAI_RPM_LIMIT", "500"))
+    RATE_LIMIT_TPM = int(os.getenv("OPENAI_TPM_LIMIT", "200000"))
+    MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "5"))
+    RETRY_BASE_DELAY = float(os.getenv("OPENAI_RETRY_BASE_DELAY", "1.0"))
+    RETRY_MAX_DELAY = float(os.getenv("OPENAI_RETRY_MAX_DELAY", "60"))
+    
+    # 재생성 프롬프트 토큰 예산 (0이면 제한 없음) 및 초과 시 처리 방식
+    # ("shorten": 가장 긴 필드부터 줄임, "reject": 재생성 거부)
+    REGENERATE_PROMPT_TOKEN_BUDGET = int(os.getenv("REGENERATE_PROMPT_TOKEN_BUDGET", "3000"))
+    REGENERATE_TRUNCATION = os.getenv("REGENERATE_TRUNCATION", "shorten").lower()
+    
     @classmethod
     def is_configured(cls) -> bool:
         """API 키가 설정되어 있는지 확인"""
@@ -64,6 +109,63 @@ class AppConfig:
     MAX_BACKUPS = int(os.getenv("MAX_BACKUPS", "30"))
     AUTO_BACKUP = os.getenv("AUTO_BACKUP", "True").lower() in ("true", "1", "yes")
     
+    # 목록 페이지 크기 (/confirmed 한 페이지당 항목 수)
+    PAGE_SIZE = int(os.getenv("PAGE_SIZE", "50"))
+    
+    # 저장소 백엔드 설정 ("json" 또는 "sqlite")
+    STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "json").lower()
+    
+    # 저장소 저널 설정 (변경 사항을 JSONL로 추가 기록하고 임계값 초과 시 스냅샷으로 압축)
+    STORAGE_JOURNAL = os.getenv("STORAGE_JOURNAL", "False").lower() in ("true", "1", "yes")
+    JOURNAL_MAX_RECORDS = int(os.getenv("JOURNAL_MAX_RECORDS", "1000"))
+    JOURNAL_MAX_BYTES = int(os.getenv("JOURNAL_MAX_BYTES", str(4 * 1024 * 1024)))
+    JOURNAL_FSYNC = os.getenv("JOURNAL_FSYNC", "False").lower() in ("true", "1", "yes")
+    
+    # 지연 쓰기 설정 (변경을 모아 WRITE_BEHIND_WINDOW_MS 또는 WRITE_BEHIND_MAX_PENDING건마다 한 번에 저장)
+    STORAGE_WRITE_BEHIND = os.getenv("STORAGE_WRITE_BEHIND", "False").lower() in ("true", "1", "yes")
+    WRITE_BEHIND_WINDOW_MS = int(os.getenv("WRITE_BEHIND_WINDOW_MS", "200"))
+    WRITE_BEHIND_MAX_PENDING = int(os.getenv("WRITE_BEHIND_MAX_PENDING", "50"))
+    
+    # 저장소 디스크 작업용 스레드 풀 크기
+    STORAGE_IO_WORKERS = int(os.getenv("STORAGE_IO_WORKERS", "4"))
+    
+    # 일괄 생성 설정 (기본/최대 동시 생성 수, 요청당 최대 생성 개수)
+    BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "8"))
+    BATCH_MAX_CONCURRENCY = int(os.getenv("BATCH_MAX_CONCURRENCY", "32"))
+    BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "500"))
+    
+    # 백그라운드 작업 설정 (동시 실행 작업 수, 진행 상황 기록 간격(초), 작업당 최대 생성 개수)
+    JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+    JOB_PERSIST_INTERVAL = float(os.getenv("JOB_PERSIST_INTERVAL", "1.0"))
+    JOB_MAX_ITEMS = int(os.getenv("JOB_MAX_ITEMS", "5000"))
+    
+    # 끝난 작업(완료/실패) 보관 설정 (보관 기간(시간), 최대 보관 수, 0이면 제한 없음)
+    JOB_RETENTION_HOURS = float(os.getenv("JOB_RETENTION_HOURS", "72"))
+    JOB_MAX_FINISHED = int(os.getenv("JOB_MAX_FINISHED", "100"))
+    
+    # 웜 풀 설정 (유형×레벨별로 미리 생성해 둘 개수, 다시 채우기 시작하는 최소 수량, 동시 생성 수)
+    # WARM_POOL_SIZES로 유형별 크기 지정 가능 (예: "dialogue=5,lecture=2")
+    WARM_POOL_ENABLED = os.getenv("WARM_POOL_ENABLED", "False").lower() in ("true", "1", "yes")
+    WARM_POOL_SIZE = int(os.getenv("WARM_POOL_SIZE", "3"))
+    WARM_POOL_SIZES = os.getenv("WARM_POOL_SIZES", "")
+    WARM_POOL_LOW_WATER = int(os.getenv("WARM_POOL_LOW_WATER", "1"))
+    WARM_POOL_CONCURRENCY = int(os.getenv("WARM_POOL_CONCURRENCY", "2"))
+    WARM_POOL_CHECK_INTERVAL = float(os.getenv("WARM_POOL_CHECK_INTERVAL", "30"))
+    WARM_POOL_RETRY_DELAY = float(os.getenv("WARM_POOL_RETRY_DELAY", "60"))
+    
+    # 프롬프트 응답 캐시 설정 (메모리 LRU 항목 수, 디스크 최대 크기, 유효 시간(초, 0이면 만료 없음))
+    PROMPT_CACHE_ENABLED = os.getenv("PROMPT_CACHE_ENABLED", "True").lower() in ("true", "1", "yes")
+    PROMPT_CACHE_MEMORY_ITEMS = int(os.getenv("PROMPT_CACHE_MEMORY_ITEMS", "256"))
+    PROMPT_CACHE_DISK_MAX_BYTES = int(os.getenv("PROMPT_CACHE_DISK_MAX_BYTES", str(50 * 1024 * 1024)))
+    PROMPT_CACHE_TTL = float(os.getenv("PROMPT_CACHE_TTL", "3600"))
+    
+    # 동일 요청 병합 설정 (같은 프롬프트로 진행 중인 GPT 호출 공유, 공유 호출 제한 시간(초, 0이면 제한 없음))
+    SINGLE_FLIGHT_ENABLED = os.getenv("SINGLE_FLIGHT_ENABLED", "True").lower() in ("true", "1", "yes")
+    SINGLE_FLIGHT_TIMEOUT = float(os.getenv("SINGLE_FLIGHT_TIMEOUT", "180"))
+    
+    # GPT 호출 사용량(토큰, 지연 시간, 결과) 기록 여부
+    USAGE_LOG_ENABLED = os.getenv("USAGE_LOG_ENABLED", "True").lower() in ("true", "1", "yes")
+    
     # 사용자 설정 로드
     @classmethod
     def load_user_config(cls) -> Dict[str, Any]:
@@ -112,7 +214,9 @@ def ensure_directories() -> None:
         Directories.DATA,
         Directories.LOGS,
         Directories.TEMP,
-        Directories.BACKUPS
+        Directories.BACKUPS,
+        Directories.JOBS,
+        Directories.PROMPT_CACHE
     ]:
         os.makedirs(dir_path, exist_ok=True)
         logger.debug(f"디렉토리 확인/생성: {dir_path}")
@@ -4,29 +4,84 @@ FastAPI 애플리케이션 및 라우팅
 TOPIK 문제 생성기의 웹 인터페이스와 API 엔드포인트를 정의합니다.
 """
 
+import asyncio
 import json
 import re
 import functools
+from urllib.parse import urlencode
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Form, Request, HTTPException, Depends
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from typing import Dict, Any, Optional, List, Callable
 
-from app.config import AppConfig
-from app.services import create_content_generator, create_content_storage
+from app.config import AIConfig, AppConfig
+from app.services import create_async_content_storage, create_shared_content_generator
+from app.services.batch import expand_jobs, generate_batch
+from app.services.jobs import JobManager
+from app.services.warm_pool import WarmPool
+from app.templates import get_regenerable_fields, get_template
 from app.utils.logger import logger
 from app.utils.json_debug import safely_parse_json
+from app.utils.models import BatchGenerateRequest, PartialRegenerateRequest
 
 
 # 서비스 인스턴스를 생성하는 의존성 함수
-def get_content_generator():
-    """ContentGenerator 인스턴스를 제공하는 의존성 함수"""
-    return create_content_generator()
-
-def get_content_storage():
-    """ContentStorage 인스턴스를 제공하는 의존성 함수"""
-    return create_content_storage()
+def get_content_generator(request: Request):
+    """
+    프로세스 전역 ContentGenerator 인스턴스를 제공하는 의존성 함수
+    
+    요청마다 클라이언트를 만들지 않고 lifespan에서 만든 공유 연결 풀을 사용합니다.
+    """
+    generator = getattr(request.app.state, "content_generator", None)
+    if generator is None:
+        # lifespan 없이 실행된 경우 (테스트 등) 최초 요청 시 생성
+        generator = create_shared_content_generator()
+        request.app.state.content_generator = generator
+    return generator
+
+async def get_content_storage(request: Request):
+    """
+    프로세스 전역 AsyncContentStorage 인스턴스를 제공하는 의존성 함수
+    
+    요청마다 파일을 다시 읽지 않고, 다른 프로세스가 파일을 변경한 경우에만
+    다시 로드합니다. 디스크 작업은 저장소 스레드 풀에서 실행됩니다.
+    """
+    storage = getattr(request.app.state, "content_storage", None)
+    if storage is None:
+        # lifespan 없이 실행된 경우 (테스트 등) 최초 요청 시 생성
+        storage = create_async_content_storage()
+        request.app.state.content_storage = storage
+    
+    await storage.refresh()
+    return storage
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 시작 시 공유 서비스 인스턴스를 생성하고, 종료 시 정리합니다."""
+    app.state.content_storage = create_async_content_storage()
+    logger.info("공유 ContentStorage 초기화 완료")
+    app.state.content_generator = create_shared_content_generator()
+    logger.info("공유 ContentGenerator 초기화 완료")
+    app.state.job_manager = JobManager(app.state.content_generator, app.state.content_storage)
+    await app.state.job_manager.start()
+    app.state.warm_pool = None
+    if AppConfig.WARM_POOL_ENABLED:
+        app.state.warm_pool = WarmPool(app.state.content_generator)
+        await app.state.warm_pool.start()
+    yield
+    
+    # 실행 중인 작업은 중지 후 다음 시작 때 이어서 진행
+    await app.state.job_manager.stop()
+    if app.state.warm_pool is not None:
+        await app.state.warm_pool.stop()
+    
+    # 지연 쓰기로 대기 중인 변경을 종료 전에 저장
+    app.state.content_storage.close()
+    logger.info("공유 ContentStorage 종료 완료")
+    await app.state.content_generator.aclose()
 
 
 # 라우트 오류 처리 데코레이터
@@ -38,7 +93,7 @@ def handle_route_errors(func):
             return await func(*args, **kwargs)
         except ValueError as e:
             logger.error(f"값 오류: {str(e)}")
-            request = next((arg for arg in args if isinstance(arg, Request)), None)
+            request = next((arg for arg in (*args, *kwargs.values()) if isinstance(arg, Request)), None)
             return templates.TemplateResponse(
                 "generator.html", 
                 {
@@ -50,7 +105,7 @@ def handle_route_errors(func):
             )
         except Exception as e:
             logger.error(f"처리 중 예외 발생: {str(e)}")
-            request = next((arg for arg in args if isinstance(arg, Request)), None)
+            request = next((arg for arg in (*args, *kwargs.values()) if isinstance(arg, Request)), None)
             return templates.TemplateResponse(
                 "generator.html", 
                 {
@@ -71,11 +126,13 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    lifespan=lifespan,
 )
 
 # 정적 파일 및 템플릿 설정
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
+templates.env.globals["regenerable_fields"] = get_regenerable_fields
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -90,6 +147,7 @@ async def generate_content(
     request: Request, 
     qtype: str = Form(...), 
     level: str = Form(...),
+    reuse: bool = Form(False),
     generator = Depends(get_content_generator)
 ):
     """
@@ -99,12 +157,26 @@ async def generate_content(
         request: FastAPI 요청 객체
         qtype: 콘텐츠 유형 (dialogue, lecture 등)
         level: 학습자 레벨 (초급, 중급, 고급 등)
+        reuse: 같은 프롬프트의 캐시된 응답을 재사용할지 여부 (기본값: False, 매번 새로 생성)
         generator: ContentGenerator 인스턴스 (의존성 주입)
     """
     logger.info(f"콘텐츠 생성 요청: {qtype} / {level}")
     
-    # 콘텐츠 생성
-    content_data = generator.generate(qtype, level)
+    # 웜 풀에 미리 생성된 콘텐츠가 있으면 사용하고, 없으면 바로 생성
+    pool = getattr(request.app.state, "warm_pool", None)
+    content_data = await pool.pop(qtype, level) if pool is not None else None
+    if content_data is None:
+        # 후보 여러 개를 한 번에 생성하여 가장 좋은 후보를 사용하고, 나머지는 웜 풀에 보관
+        # (다시 누를 때마다 새 후보를 받도록 reuse를 요청한 경우에만 캐시 조회)
+        candidates = await generator.generate_candidates_async(
+            qtype, level, AIConfig.GENERATION_CANDIDATES, use_cache=reuse
+        )
+        content_data = candidates[0]
+        if pool is not None:
+            for spare in candidates[1:]:
+                await pool.put(qtype, level, spare)
+    else:
+        logger.info(f"웜 풀에서 콘텐츠 사용: {qtype} / {level}")
     
     # JSON 문자열로 변환
     raw_content = json.dumps(content_data, ensure_ascii=False)
@@ -120,12 +192,90 @@ async def generate_content(
     )
 
 
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Server-Sent Events 형식의 이벤트 문자열을 만듭니다."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@app.get("/generate/stream")
+async def generate_content_stream(
+    request: Request,
+    qtype: str,
+    level: str,
+    reuse: bool = False,
+    generator = Depends(get_content_generator)
+):
+    """
+    콘텐츠를 스트리밍으로 생성하여 Server-Sent Events로 전송합니다.
+    
+    응답 조각마다 delta 이벤트(text, 부분 content)를 보내고,
+    생성이 끝나면 검증/보정된 콘텐츠를 done 이벤트로 보냅니다.
+    
+    Args:
+        request: FastAPI 요청 객체
+        qtype: 콘텐츠 유형 (dialogue, lecture 등)
+        level: 학습자 레벨 (초급, 중급, 고급 등)
+        reuse: 같은 프롬프트의 캐시된 응답을 재사용할지 여부 (기본값: False, 매번 새로 생성)
+        generator: ContentGenerator 인스턴스 (의존성 주입)
+    """
+    if not get_template(qtype):
+        raise HTTPException(status_code=400, detail=f"알 수 없는 콘텐츠 유형: {qtype}")
+    logger.info(f"콘텐츠 스트리밍 생성 요청: {qtype} / {level}")
+    
+    # 웜 풀에 미리 생성된 콘텐츠가 있으면 바로 완료 이벤트 전송
+    pool = getattr(request.app.state, "warm_pool", None)
+    pooled = await pool.pop(qtype, level) if pool is not None else None
+    
+    async def stream_events():
+        if pooled is not None:
+            yield _sse_event("done", {"content": pooled, "validation_error": None})
+            return
+        async for event in generator.generate_stream(qtype, level, use_cache=reuse):
+            yield _sse_event(event.pop("event"), event)
+    
+    return StreamingResponse(
+        stream_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.post("/generate/result", response_class=HTMLResponse)
+@handle_route_errors
+async def show_generated_content(
+    request: Request,
+    content: str = Form(...)
+):
+    """
+    스트리밍으로 생성이 끝난 콘텐츠를 편집 화면으로 표시합니다.
+    
+    Args:
+        request: FastAPI 요청 객체
+        content: 생성된 콘텐츠 JSON
+    """
+    if not content or content.isspace():
+        raise ValueError("콘텐츠 데이터가 비어있습니다.")
+    
+    content_data = safely_parse_json(content)
+    
+    return templates.TemplateResponse(
+        "generator.html",
+        {
+            "request": request,
+            "content": json.dumps(content_data, ensure_ascii=False),
+            "parsed": content_data
+        }
+    )
+
+
 @app.post("/regenerate", response_class=HTMLResponse)
 @handle_route_errors
 async def regenerate_content(
     request: Request, 
     content: str = Form(...), 
     user_comment: str = Form(...),
+    fresh: bool = Form(False),
+    fields: List[str] = Form([]),
     generator = Depends(get_content_generator)
 ):
     """
@@ -135,9 +285,11 @@ async def regenerate_content(
         request: FastAPI 요청 객체
         content: 원본 콘텐츠 JSON
         user_comment: 사용자의 추가 요구사항
+        fresh: 캐시된 응답 대신 새로 생성할지 여부
+        fields: 다시 작성할 필드 (비어 있으면 콘텐츠 전체 재생성)
         generator: ContentGenerator 인스턴스 (의존성 주입)
     """
-    logger.info(f"콘텐츠 재생성 요청: 코멘트 길이 {len(user_comment)}")
+    logger.info(f"콘텐츠 재생성 요청: 코멘트 길이 {len(user_comment)}, 대상 필드 {fields or '전체'}")
     
     # 입력 데이터 유효성 검사
     if not content or content.isspace():
@@ -146,8 +298,12 @@ async def regenerate_content(
     # 콘텐츠 파싱
     content_data = safely_parse_json(content)
     
-    # 재생성 요청
-    regenerated_data = generator.regenerate(content_data, user_comment)
+    # 재생성 요청 (필드를 선택한 경우 해당 필드만 다시 작성)
+    if fields:
+        regenerated_data = await generator.regenerate_fields_async(content_data, fields, user_comment,
+                                                                   use_cache=not fresh)
+    else:
+        regenerated_data = await generator.regenerate_async(content_data, user_comment, use_cache=not fresh)
     
     # JSON 문자열로 변환
     raw_regenerated = json.dumps(regenerated_data, ensure_ascii=False)
@@ -164,6 +320,161 @@ async def regenerate_content(
     )
 
 
+@app.post("/api/regenerate/fields")
+async def regenerate_fields_api(
+    body: PartialRegenerateRequest,
+    generator = Depends(get_content_generator)
+):
+    """
+    콘텐츠의 일부 필드만 사용자 요구사항에 맞게 다시 작성합니다.
+    
+    대상 필드만 응답받아 서버에서 원본 콘텐츠에 합친 결과를 반환합니다.
+    재생성에 실패하면 원본 콘텐츠에 error 필드를 추가하여 반환합니다.
+    
+    Args:
+        body: 부분 재생성 요청 (content, fields, user_comment, fresh)
+        generator: ContentGenerator 인스턴스 (의존성 주입)
+    """
+    content_type = body.content.get("type", "")
+    regenerable = get_regenerable_fields(content_type)
+    invalid = [field for field in body.fields if field not in regenerable]
+    if not body.fields or invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"'{content_type}' 유형에서 다시 작성할 수 있는 필드: {', '.join(regenerable) or '없음'}"
+        )
+    
+    logger.info(f"부분 재생성 요청: {content_type} / {', '.join(body.fields)}")
+    return await generator.regenerate_fields_async(body.content, body.fields, body.user_comment,
+                                                   use_cache=not body.fresh)
+
+
+def _check_batch_request(batch: BatchGenerateRequest, max_items: int) -> int:
+    """
+    일괄 생성 요청의 유형과 개수를 검증하고 적용할 동시 생성 수를 반환합니다.
+    
+    Args:
+        batch: 일괄 생성 요청
+        max_items: 허용하는 최대 생성 개수
+        
+    Returns:
+        동시 생성 수
+        
+    Raises:
+        HTTPException: 알 수 없는 유형이거나 개수가 너무 많은 경우 (400)
+    """
+    unknown_types = sorted({item.qtype for item in batch.items if not get_template(item.qtype)})
+    if unknown_types:
+        raise HTTPException(status_code=400, detail=f"알 수 없는 콘텐츠 유형: {', '.join(unknown_types)}")
+    
+    total = batch.total_count()
+    if total > max_items:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {max_items}개까지 생성할 수 있습니다. (요청: {total}개)"
+        )
+    
+    return min(batch.concurrency or AppConfig.BATCH_CONCURRENCY, AppConfig.BATCH_MAX_CONCURRENCY)
+
+
+@app.post("/api/generate/batch")
+async def generate_batch_api(
+    batch: BatchGenerateRequest,
+    generator = Depends(get_content_generator),
+    storage = Depends(get_content_storage)
+):
+    """
+    여러 유형/레벨의 콘텐츠를 한 번에 생성합니다.
+    
+    결과는 완료되는 순서대로 한 줄에 하나씩 JSON(NDJSON)으로 스트리밍되며,
+    마지막 줄은 {"done": true, ...} 요약입니다.
+    
+    Args:
+        batch: 일괄 생성 요청 ({qtype, level, count} 목록, auto_save, concurrency)
+        generator: ContentGenerator 인스턴스 (의존성 주입)
+        storage: AsyncContentStorage 인스턴스 (의존성 주입)
+    """
+    concurrency = _check_batch_request(batch, AppConfig.BATCH_MAX_ITEMS)
+    logger.info(f"일괄 생성 요청: {batch.total_count()}개, 동시 {concurrency}개, 자동 저장 {batch.auto_save}")
+    
+    async def stream_results():
+        jobs = expand_jobs(batch.items)
+        async for result in generate_batch(generator, jobs, concurrency,
+                                           storage if batch.auto_save else None):
+            yield json.dumps(result, ensure_ascii=False) + "\n"
+    
+    return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+
+async def get_job_manager(request: Request):
+    """
+    프로세스 전역 JobManager 인스턴스를 제공하는 의존성 함수
+    """
+    manager = getattr(request.app.state, "job_manager", None)
+    if manager is None:
+        # lifespan 없이 실행된 경우 (테스트 등) 최초 요청 시 생성
+        manager = JobManager(get_content_generator(request), await get_content_storage(request))
+        await manager.start()
+        request.app.state.job_manager = manager
+    return manager
+
+
+@app.post("/api/jobs", status_code=202)
+async def submit_job(
+    batch: BatchGenerateRequest,
+    manager = Depends(get_job_manager)
+):
+    """
+    일괄 생성 작업을 백그라운드 작업으로 등록합니다.
+    
+    요청은 바로 반환되며, 진행 상황은 /api/jobs/{job_id}로 조회합니다.
+    
+    Args:
+        batch: 일괄 생성 요청 ({qtype, level, count} 목록, auto_save, concurrency)
+        manager: JobManager 인스턴스 (의존성 주입)
+    """
+    concurrency = _check_batch_request(batch, AppConfig.JOB_MAX_ITEMS)
+    items = [item.dict() for item in batch.items]
+    return await manager.submit(items, auto_save=batch.auto_save, concurrency=concurrency)
+
+
+@app.get("/api/jobs")
+async def list_jobs(
+    status: Optional[str] = None,
+    limit: int = 50,
+    manager = Depends(get_job_manager)
+):
+    """
+    최근 작업 목록을 반환합니다.
+    
+    Args:
+        status: 상태 필터 (queued, running, completed, failed)
+        limit: 최대 개수 (기본값: 50)
+        manager: JobManager 인스턴스 (의존성 주입)
+    """
+    return {"jobs": manager.list(status=status, limit=max(1, min(limit, 500)))}
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(
+    job_id: str,
+    include_results: bool = True,
+    manager = Depends(get_job_manager)
+):
+    """
+    작업 상태와 결과를 반환합니다.
+    
+    Args:
+        job_id: 작업 ID
+        include_results: 항목별 결과 포함 여부 (기본값: True)
+        manager: JobManager 인스턴스 (의존성 주입)
+    """
+    job = manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return job if include_results else manager.summarize(job)
+
+
 @app.post("/confirm", response_class=HTMLResponse)
 @handle_route_errors
 async def confirm_content(
@@ -177,7 +488,7 @@ async def confirm_content(
     Args:
         request: FastAPI 요청 객체
         content: 저장할 콘텐츠 JSON
-        storage: ContentStorage 인스턴스 (의존성 주입)
+        storage: AsyncContentStorage 인스턴스 (의존성 주입)
     """
     logger.info(f"콘텐츠 저장 요청: 데이터 길이 {len(content)}")
     
@@ -189,7 +500,7 @@ async def confirm_content(
     parsed = safely_parse_json(content)
     
     # 저장
-    content_id = storage.save_content(parsed)
+    content_id = await storage.save_content(parsed)
     logger.info(f"콘텐츠 저장 완료: {content_id}")
     
     return templates.TemplateResponse(
@@ -209,42 +520,81 @@ async def show_confirmed(
     search: Optional[str] = None,
     type_filter: Optional[str] = None,
     level_filter: Optional[str] = None,
+    sort: str = "created_at",
+    order: str = "desc",
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
     storage = Depends(get_content_storage)
 ):
     """
-    저장된 모든 콘텐츠를 표시합니다.
+    저장된 콘텐츠를 페이지 단위로 표시합니다.
     
     Args:
         request: FastAPI 요청 객체
         search: 검색어 (선택 사항)
         type_filter: 콘텐츠 유형 필터 (선택 사항)
         level_filter: 콘텐츠 레벨 필터 (선택 사항)
-        storage: ContentStorage 인스턴스 (의존성 주입)
-    """
-    # 콘텐츠 검색
-    data = storage.search_contents(search, type_filter, level_filter)
-    
-    # 사용 가능한 유형 및 레벨 목록 수집
-    types = set()
-    levels = set()
-    for item in storage.get_all():
-        if isinstance(item, dict):
-            if "type" in item and item["type"]:
-                types.add(item["type"])
-            if "level" in item and item["level"]:
-                levels.add(item["level"])
-    
-    logger.info(f"저장된 콘텐츠 페이지 로드: {len(data)}개 항목")
+        sort: 정렬 기준 (created_at, updated_at, type, level)
+        order: 정렬 방향 (asc 또는 desc)
+        cursor: 다음 페이지 커서 (선택 사항)
+        limit: 페이지 크기 (기본값: AppConfig.PAGE_SIZE)
+        storage: AsyncContentStorage 인스턴스 (의존성 주입)
+    """
+    limit = max(1, min(limit or AppConfig.PAGE_SIZE, 500))
+    page = await storage.search_page(
+        search, type_filter, level_filter,
+        sort=sort, descending=(order != "asc"), limit=limit, cursor=cursor
+    )
+    data = page["items"]
+    
+    # 현재 검색 조건을 유지하는 페이지 링크
+    query_params = {
+        key: value for key, value in {
+            "search": search,
+            "type_filter": type_filter,
+            "level_filter": level_filter,
+            "sort": sort,
+            "order": order,
+            "limit": limit if limit != AppConfig.PAGE_SIZE else None,
+        }.items() if value
+    }
+    first_url = f"/confirmed?{urlencode(query_params)}" if cursor else None
+    next_url = None
+    if page["next_cursor"]:
+        next_url = f"/confirmed?{urlencode({**query_params, 'cursor': page['next_cursor']})}"
+    
+    # 사용 가능한 유형 및 레벨 목록과 항목 수 (저장소가 유지하는 패싯 집계)
+    facets = await storage.facets()
+    if level_filter:
+        type_counts = {
+            content_type: levels.get(level_filter, 0)
+            for content_type, levels in facets["type_levels"].items()
+        }
+    else:
+        type_counts = facets["types"]
+    if type_filter:
+        level_counts = facets["type_levels"].get(type_filter, {})
+    else:
+        level_counts = facets["levels"]
+    
+    logger.info(f"저장된 콘텐츠 페이지 로드: {len(data)}/{page['total']}개 항목")
     return templates.TemplateResponse(
         "confirmed.html", 
         {
             "request": request,
             "data": data,
+            "total": page["total"],
+            "next_url": next_url,
+            "first_url": first_url,
             "search": search,
             "type_filter": type_filter,
             "level_filter": level_filter,
-            "types": sorted(types),
-            "levels": sorted(levels)
+            "sort": sort,
+            "order": order,
+            "types": list(facets["types"]),
+            "levels": list(facets["levels"]),
+            "type_counts": type_counts,
+            "level_counts": level_counts
         }
     )
 
@@ -262,9 +612,9 @@ async def get_content(
     Args:
         request: FastAPI 요청 객체
         content_id: 콘텐츠 ID
-        storage: ContentStorage 인스턴스 (의존성 주입)
+        storage: AsyncContentStorage 인스턴스 (의존성 주입)
     """
-    item = storage.get_by_id(content_id)
+    item = await storage.get_by_id(content_id)
     
     if not item:
         logger.warning(f"존재하지 않는 콘텐츠 ID: {content_id}")
@@ -300,9 +650,9 @@ async def delete_content(
     Args:
         request: FastAPI 요청 객체
         content_id: 삭제할 콘텐츠 ID
-        storage: ContentStorage 인스턴스 (의존성 주입)
+        storage: AsyncContentStorage 인스턴스 (의존성 주입)
     """
-    if storage.delete(content_id):
+    if await storage.delete(content_id):
         logger.info(f"콘텐츠 삭제 성공: {content_id}")
         return RedirectResponse(url="/confirmed", status_code=303)
     else:
@@ -330,9 +680,9 @@ async def trash_content(
     Args:
         request: FastAPI 요청 객체
         content_id: 이동할 콘텐츠 ID
-        storage: ContentStorage 인스턴스 (의존성 주입)
+        storage: AsyncContentStorage 인스턴스 (의존성 주입)
     """
-    if storage.trash(content_id):
+    if await storage.trash(content_id):
         logger.info(f"콘텐츠 휴지통 이동 성공: {content_id}")
         return RedirectResponse(url="/confirmed", status_code=303)
     else:
@@ -358,9 +708,9 @@ async def show_trash(
     
     Args:
         request: FastAPI 요청 객체
-        storage: ContentStorage 인스턴스 (의존성 주입)
+        storage: AsyncContentStorage 인스턴스 (의존성 주입)
     """
-    data = storage.get_trash()
+    data = await storage.get_trash()
     
     logger.info(f"휴지통 페이지 로드: {len(data)}개 항목")
     return templates.TemplateResponse(
@@ -385,9 +735,9 @@ async def restore_content(
     Args:
         request: FastAPI 요청 객체
         content_id: 복원할 콘텐츠 ID
-        storage: ContentStorage 인스턴스 (의존성 주입)
+        storage: AsyncContentStorage 인스턴스 (의존성 주입)
     """
-    if storage.restore(content_id):
+    if await storage.restore(content_id):
         logger.info(f"콘텐츠 복원 성공: {content_id}")
         return RedirectResponse(url="/trash", status_code=303)
     else:
@@ -413,9 +763,9 @@ async def empty_trash(
     
     Args:
         request: FastAPI 요청 객체
-        storage: ContentStorage 인스턴스 (의존성 주입)
+        storage: AsyncContentStorage 인스턴스 (의존성 주입)
     """
-    count = storage.empty_trash()
+    count = await storage.empty_trash()
     logger.info(f"휴지통 비우기 완료: {count}개 항목 삭제")
     
     return RedirectResponse(url="/trash", status_code=303)
@@ -432,13 +782,13 @@ async def backup_data(
     
     Args:
         request: FastAPI 요청 객체
-        storage: ContentStorage 인스턴스 (의존성 주입)
+        storage: AsyncContentStorage 인스턴스 (의존성 주입)
     """
     from fastapi.responses import FileResponse
     import os
     
     # 수동 백업 생성
-    backup_path = storage.create_manual_backup(storage.get_all())
+    backup_path = await storage.create_manual_backup()
     
     if not backup_path or not os.path.exists(backup_path):
         return templates.TemplateResponse(
@@ -455,4 +805,117 @@ async def backup_data(
         path=backup_path,
         filename=os.path.basename(backup_path),
         media_type="application/json"
-    )
\ No newline at end of file
+    )
+
+
+@app.get("/api/warm-pool")
+async def warm_pool_stats(request: Request):
+    """
+    웜 풀의 조합별 준비 수량과 적중/실패 카운터를 반환합니다.
+    
+    Args:
+        request: FastAPI 요청 객체
+    """
+    pool = getattr(request.app.state, "warm_pool", None)
+    if pool is None:
+        return {"enabled": False}
+    return {"enabled": True, **pool.stats()}
+
+
+@app.get("/api/prompt-cache")
+async def prompt_cache_stats(generator = Depends(get_content_generator)):
+    """
+    GPT 응답 캐시의 계층별 적중 수와 크기를 반환합니다.
+    
+    Args:
+        generator: ContentGenerator 인스턴스 (의존성 주입)
+    """
+    if generator.cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **generator.cache.stats()}
+
+
+@app.get("/api/usage")
+async def usage_stats(
+    days: Optional[int] = None,
+    generator = Depends(get_content_generator)
+):
+    """
+    GPT 호출 사용량의 합계와 백분위수를 유형/레벨/날짜별로 반환합니다.
+    
+    Args:
+        days: 최근 며칠의 기록만 집계 (기본값: 전체)
+        generator: ContentGenerator 인스턴스 (의존성 주입)
+    """
+    if generator.usage_log is None:
+        return {"enabled": False}
+    usage = await asyncio.to_thread(generator.usage_log.aggregate, days)
+    return {"enabled": True, **usage}
+
+
+@app.get("/usage", response_class=HTMLResponse)
+@handle_route_errors
+async def show_usage(
+    request: Request,
+    days: Optional[int] = None,
+    generator = Depends(get_content_generator)
+):
+    """
+    GPT 호출 사용량 페이지를 표시합니다.
+    
+    Args:
+        request: FastAPI 요청 객체
+        days: 최근 며칠의 기록만 집계 (기본값: 전체)
+        generator: ContentGenerator 인스턴스 (의존성 주입)
+    """
+    usage = None
+    if generator.usage_log is not None:
+        usage = await asyncio.to_thread(generator.usage_log.aggregate, days)
+    return templates.TemplateResponse(
+        "usage.html",
+        {
+            "request": request,
+            "enabled": usage is not None,
+            "usage": usage,
+            "days": days
+        }
+    )
+
+
+@app.get("/api/rate-limit")
+async def rate_limit_stats(generator = Depends(get_content_generator)):
+    """
+    GPT 호출 스케줄러의 호출/재시도 횟수와 대기열 상태를 반환합니다.
+    
+    Args:
+        generator: ContentGenerator 인스턴스 (의존성 주입)
+    """
+    if generator.scheduler is None:
+        return {"enabled": False}
+    return {"enabled": True, **generator.scheduler.stats()}
+
+
+@app.get("/api/output-budget")
+async def output_budget_stats(generator = Depends(get_content_generator)):
+    """
+    유형별 출력 토큰 예산(max_tokens)과 관측한 출력 토큰 백분위수, 잘린 응답 수를 반환합니다.
+    
+    Args:
+        generator: ContentGenerator 인스턴스 (의존성 주입)
+    """
+    if generator.output_budget is None:
+        return {"enabled": False, "max_tokens": AIConfig.MAX_TOKENS}
+    return {"enabled": True, **generator.output_budget.stats()}
+
+
+@app.get("/api/single-flight")
+async def single_flight_stats(generator = Depends(get_content_generator)):
+    """
+    동일 요청 병합기의 호출/병합/오류 횟수와 진행 중인 호출 수를 반환합니다.
+    
+    Args:
+        generator: ContentGenerator 인스턴스 (의존성 주입)
+    """
+    if generator.single_flight is None:
+        return {"enabled": False}
+    return {"enabled": True, **generator.single_flight.stats()}
@@ -6,10 +6,50 @@ TOPIK 문제 생성기의 핵심 서비스 모듈을 제공합니다.
 """
 
 # 내부 임포트 순환 참조 방지를 위해 런타임에 임포트
-from app.services.generator import ContentGenerator
+from app.services.generator import ContentGenerator, create_async_openai_client
 from app.services.storage import ContentStorage
+from app.services.sqlite_storage import SqliteContentStorage, migrate_json_to_sqlite
+from app.services.async_storage import AsyncContentStorage
+from app.services.prompt_cache import PromptCache
+from app.services.rate_limiter import Priority, RateLimitScheduler
+from app.services.output_budget import OutputBudget
+from app.services.single_flight import SingleFlight
+from app.services.usage import UsageLog
+from app.config import AIConfig, AppConfig
+
+# 프로세스 전체에서 공유하는 속도 제한 스케줄러 (get_rate_limiter()로 생성)
+_rate_limiter = None
+
+# 프로세스 전체에서 공유하는 사용량 로그 (get_usage_log()로 생성)
+_usage_log = None
+
+# 프로세스 전체에서 공유하는 출력 토큰 예산 (get_output_budget()으로 생성)
+_output_budget = None
 
 # 서비스 팩토리 함수
+def _fill_generator_defaults(kwargs):
+    """
+    ContentGenerator 인자 중 전달되지 않은 공유 서비스만 기본값으로 채웁니다.
+    (전달된 인자가 있으면 기본 인스턴스를 만들지 않음)
+    
+    Args:
+        kwargs: ContentGenerator 생성자에 전달할 인자 (직접 수정됨)
+        
+    Returns:
+        기본값을 채운 kwargs
+    """
+    defaults = {
+        "cache": create_prompt_cache,
+        "scheduler": get_rate_limiter,
+        "usage_log": get_usage_log,
+        "single_flight": create_single_flight,
+        "output_budget": get_output_budget,
+    }
+    for name, factory in defaults.items():
+        if name not in kwargs:
+            kwargs[name] = factory()
+    return kwargs
+
 def create_content_generator(**kwargs):
     """
     ContentGenerator 인스턴스를 생성합니다.
@@ -20,24 +60,140 @@ def create_content_generator(**kwargs):
     Returns:
         생성된 ContentGenerator 인스턴스
     """
-    return ContentGenerator(**kwargs)
+    return ContentGenerator(**_fill_generator_defaults(kwargs))
+
+def create_shared_content_generator(**kwargs):
+    """
+    공유 AsyncOpenAI 클라이언트(연결 풀)를 사용하는 ContentGenerator를 생성합니다.
+    애플리케이션 시작 시 한 번만 호출합니다.
+    
+    Args:
+        **kwargs: ContentGenerator 생성자에 전달할 인자
+        
+    Returns:
+        생성된 ContentGenerator 인스턴스
+    """
+    if "async_client" not in kwargs:
+        kwargs["async_client"] = create_async_openai_client(kwargs.get("api_key"))
+    return ContentGenerator(**_fill_generator_defaults(kwargs))
+
+def get_rate_limiter():
+    """
+    프로세스 전체에서 공유하는 RateLimitScheduler를 반환합니다.
+    모든 ContentGenerator가 같은 RPM/TPM 한도를 나눠 쓰도록 한 번만 생성합니다.
+    
+    Returns:
+        공유 RateLimitScheduler 인스턴스
+    """
+    global _rate_limiter
+    if _rate_limiter is None:
+        _rate_limiter = RateLimitScheduler()
+    return _rate_limiter
+
+def get_usage_log():
+    """
+    프로세스 전체에서 공유하는 UsageLog를 반환합니다.
+    
+    Returns:
+        UsageLog 인스턴스 또는 None (AppConfig.USAGE_LOG_ENABLED가 꺼진 경우)
+    """
+    global _usage_log
+    if not AppConfig.USAGE_LOG_ENABLED:
+        return None
+    if _usage_log is None:
+        _usage_log = UsageLog()
+    return _usage_log
+
+def get_output_budget():
+    """
+    프로세스 전체에서 공유하는 OutputBudget을 반환합니다.
+    처음 생성할 때 사용량 로그(설정된 경우)의 출력 토큰 기록을 읽어 옵니다.
+    
+    Returns:
+        OutputBudget 인스턴스 또는 None (AIConfig.OUTPUT_BUDGET_ENABLED가 꺼진 경우)
+    """
+    global _output_budget
+    if not AIConfig.OUTPUT_BUDGET_ENABLED:
+        return None
+    if _output_budget is None:
+        _output_budget = OutputBudget(get_usage_log())
+    return _output_budget
+
+def create_prompt_cache(**kwargs):
+    """
+    GPT 응답 캐시를 생성합니다.
+    
+    Args:
+        **kwargs: PromptCache 생성자에 전달할 인자
+        
+    Returns:
+        생성된 PromptCache 인스턴스 또는 None (AppConfig.PROMPT_CACHE_ENABLED가 꺼진 경우)
+    """
+    if not AppConfig.PROMPT_CACHE_ENABLED:
+        return None
+    return PromptCache(**kwargs)
+
+def create_single_flight(**kwargs):
+    """
+    동일 요청 병합기를 생성합니다.
+    
+    Args:
+        **kwargs: SingleFlight 생성자에 전달할 인자
+        
+    Returns:
+        생성된 SingleFlight 인스턴스 또는 None (AppConfig.SINGLE_FLIGHT_ENABLED가 꺼진 경우)
+    """
+    if not AppConfig.SINGLE_FLIGHT_ENABLED:
+        return None
+    return SingleFlight(**kwargs)
 
 def create_content_storage(**kwargs):
     """
-    ContentStorage 인스턴스를 생성합니다.
+    설정된 백엔드(AppConfig.STORAGE_BACKEND)의 저장소 인스턴스를 생성합니다.
     
     Args:
-        **kwargs: ContentStorage 생성자에 전달할 인자
+        **kwargs: 저장소 생성자에 전달할 인자
         
     Returns:
-        생성된 ContentStorage 인스턴스
+        생성된 ContentStorage 또는 SqliteContentStorage 인스턴스
     """
+    if AppConfig.STORAGE_BACKEND == "sqlite":
+        return SqliteContentStorage(**kwargs)
     return ContentStorage(**kwargs)
 
+def create_async_content_storage(**kwargs):
+    """
+    설정된 백엔드의 저장소를 AsyncContentStorage로 감싸서 생성합니다.
+    
+    Args:
+        **kwargs: 저장소 생성자에 전달할 인자
+        
+    Returns:
+        생성된 AsyncContentStorage 인스턴스
+    """
+    return AsyncContentStorage(create_content_storage(**kwargs))
+
 # 외부에서 import 가능한 모든 심볼 정의
 __all__ = [
     "ContentGenerator",
     "ContentStorage",
+    "SqliteContentStorage",
+    "AsyncContentStorage",
+    "PromptCache",
+    "Priority",
+    "RateLimitScheduler",
+    "OutputBudget",
+    "SingleFlight",
+    "UsageLog",
+    "migrate_json_to_sqlite",
     "create_content_generator",
-    "create_content_storage"
+    "create_shared_content_generator",
+    "create_async_openai_client",
+    "create_prompt_cache",
+    "create_single_flight",
+    "get_rate_limiter",
+    "get_usage_log",
+    "get_output_budget",
+    "create_content_storage",
+    "create_async_content_storage"
 ]
\ No newline at end of file
@@ -0,0 +1,150 @@
+"""
+비동기 저장소 서비스
+
+동기 저장소(ContentStorage, SqliteContentStorage)를 감싸서 파일/DB 작업을
+제한된 스레드 풀에서 실행합니다. 이벤트 루프에서 직접 디스크 작업을 하지
+않으므로 느린 쓰기가 같은 워커의 다른 요청을 막지 않습니다.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from app.config import AppConfig
+from app.utils.logger import get_logger
+
+# 모듈 로거 설정
+logger = get_logger("async_storage")
+
+T = TypeVar("T")
+
+
+class AsyncContentStorage:
+    """
+    동기 저장소의 비동기 파사드
+
+    읽기는 스레드 풀에서 바로 실행하고, 변경 작업은 asyncio 잠금으로
+    직렬화한 뒤 스레드 풀에서 실행합니다. 변경 작업끼리 스레드 풀을
+    모두 차지하지 않으므로 변경이 몰려도 읽기 요청은 계속 처리됩니다.
+    """
+
+    def __init__(self, storage: Any, max_workers: Optional[int] = None):
+        """
+        AsyncContentStorage 초기화
+
+        Args:
+            storage: 감쌀 동기 저장소 인스턴스
+            max_workers: 스레드 풀 크기 (기본값: AppConfig.STORAGE_IO_WORKERS)
+        """
+        self.storage = storage
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or AppConfig.STORAGE_IO_WORKERS,
+            thread_name_prefix="storage-io",
+        )
+        self._write_lock: Optional[asyncio.Lock] = None
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        동기 함수를 스레드 풀에서 실행합니다.
+
+        Args:
+            func: 실행할 함수
+            *args: 위치 인자
+            **kwargs: 키워드 인자
+
+        Returns:
+            함수 반환값
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def run_write(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        변경 작업을 직렬화하여 스레드 풀에서 실행합니다.
+
+        Args:
+            func: 실행할 함수
+            *args: 위치 인자
+            **kwargs: 키워드 인자
+
+        Returns:
+            함수 반환값
+        """
+        if self._write_lock is None:
+            self._write_lock = asyncio.Lock()
+        async with self._write_lock:
+            return await self.run(func, *args, **kwargs)
+
+    # 읽기 작업
+
+    async def refresh(self) -> bool:
+        """외부에서 변경된 파일이 있으면 다시 로드합니다."""
+        return await self.run(self.storage.refresh)
+
+    async def get_all(self) -> List[Dict[str, Any]]:
+        """모든 항목을 반환합니다."""
+        return await self.run(self.storage.get_all)
+
+    async def get_by_id(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """ID로 항목을 조회합니다."""
+        return await self.run(self.storage.get_by_id, item_id)
+
+    async def search_contents(self, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+        """콘텐츠를 검색합니다. (인자는 저장소의 search_contents와 동일)"""
+        return await self.run(self.storage.search_contents, *args, **kwargs)
+
+    async def search_page(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """콘텐츠 목록의 한 페이지를 반환합니다. (인자는 저장소의 search_page와 동일)"""
+        return await self.run(self.storage.search_page, *args, **kwargs)
+
+    async def facets(self) -> Dict[str, Any]:
+        """유형별, 레벨별 콘텐츠 수를 반환합니다."""
+        return await self.run(self.storage.facets)
+
+    async def get_trash(self) -> List[Dict[str, Any]]:
+        """휴지통 항목을 반환합니다."""
+        return await self.run(self.storage.get_trash)
+
+    async def get_backups(self) -> List[Dict[str, Any]]:
+        """백업 파일 목록을 반환합니다."""
+        return await self.run(self.storage.get_backups)
+
+    # 변경 작업
+
+    async def save_content(self, content: Dict[str, Any]) -> str:
+        """콘텐츠를 저장하고 ID를 반환합니다."""
+        return await self.run_write(self.storage.save_content, content)
+
+    async def delete(self, item_id: str) -> bool:
+        """항목을 영구 삭제합니다."""
+        return await self.run_write(self.storage.delete, item_id)
+
+    async def trash(self, content_id: str) -> bool:
+        """콘텐츠를 휴지통으로 이동합니다."""
+        return await self.run_write(self.storage.trash, content_id)
+
+    async def restore(self, content_id: str) -> bool:
+        """휴지통에서 콘텐츠를 복원합니다."""
+        return await self.run_write(self.storage.restore, content_id)
+
+    async def empty_trash(self) -> int:
+        """휴지통을 비우고 삭제된 항목 수를 반환합니다."""
+        return await self.run_write(self.storage.empty_trash)
+
+    async def restore_from_backup(self, backup_path: str) -> Tuple[int, str]:
+        """백업 파일에서 데이터를 복원합니다."""
+        return await self.run_write(self.storage.restore_from_backup, backup_path)
+
+    async def create_manual_backup(self) -> Optional[str]:
+        """현재 데이터로 수동 백업을 생성하고 백업 파일 경로를 반환합니다."""
+        return await self.run_write(lambda: self.storage.create_manual_backup(self.storage.get_all()))
+
+    async def flush(self) -> bool:
+        """대기 중인 지연 쓰기를 저장합니다."""
+        return await self.run_write(self.storage.flush)
+
+    def close(self) -> None:
+        """스레드 풀을 종료하고 저장소를 정리합니다. (대기 중인 작업 완료 후)"""
+        self._executor.shutdown(wait=True)
+        self.storage.close()
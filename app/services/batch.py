@@ -0,0 +1,109 @@
+"""
+일괄 생성 서비스
+
+여러 (유형, 레벨, 개수) 요청을 동시 실행 수를 제한하여 생성하고,
+완료되는 순서대로 결과를 돌려줍니다.
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from app.services.rate_limiter import Priority
+from app.utils.logger import get_logger
+from app.utils.models import validate_content
+
+# 모듈 로거 설정
+logger = get_logger("batch")
+
+
+def expand_jobs(items: List[Any]) -> List[Tuple[str, str]]:
+    """
+    {qtype, level, count} 요청 목록을 (유형, 레벨) 작업 목록으로 펼칩니다.
+    
+    Args:
+        items: qtype, level, count 속성을 가진 요청 항목 목록
+        
+    Returns:
+        (유형, 레벨) 튜플 목록
+    """
+    return [(item.qtype, item.level) for item in items for _ in range(item.count)]
+
+
+async def generate_batch(generator: Any, jobs: List[Tuple[str, str]], concurrency: int,
+                         storage: Optional[Any] = None) -> AsyncIterator[Dict[str, Any]]:
+    """
+    작업 목록을 동시에 최대 concurrency개씩 생성하고 완료 순서대로 결과를 반환합니다.
+    
+    마지막에는 전체 요약 결과({"done": true, ...})를 반환합니다. 호출자가 순회를
+    중단하면(클라이언트 연결 종료 등) 진행 중인 생성도 취소됩니다.
+    
+    Args:
+        generator: ContentGenerator 인스턴스 (generate_async 사용)
+        jobs: (유형, 레벨) 작업 목록
+        concurrency: 동시 생성 수
+        storage: 유효한 결과를 저장할 AsyncContentStorage (기본값: None, 저장 안 함)
+        
+    Returns:
+        항목별 결과 딕셔너리 이터레이터
+    """
+    started = time.monotonic()
+    queue: asyncio.Queue = asyncio.Queue()
+    for index, job in enumerate(jobs):
+        queue.put_nowait((index, job))
+    results: asyncio.Queue = asyncio.Queue()
+    
+    async def run_job(index: int, content_type: str, level: str) -> Dict[str, Any]:
+        """작업 하나를 생성하고 검증한 뒤 필요하면 저장합니다."""
+        result: Dict[str, Any] = {"index": index, "qtype": content_type, "level": level}
+        try:
+            # 같은 프롬프트로 여러 개를 만들므로 캐시된 응답을 쓰지 않음
+            content = await generator.generate_async(content_type, level, use_cache=False,
+                                                     priority=Priority.BACKGROUND)
+        except Exception as e:
+            logger.error(f"일괄 생성 작업 오류 ({index}): {str(e)}")
+            return {**result, "status": "error", "error": str(e)}
+        
+        result["content"] = content
+        error = validate_content(content)
+        if error:
+            return {**result, "status": "error", "error": error}
+        
+        result["status"] = "ok"
+        if storage is not None:
+            try:
+                result["saved_id"] = await storage.save_content(content)
+            except Exception as e:
+                logger.error(f"일괄 생성 결과 저장 오류 ({index}): {str(e)}")
+                result["save_error"] = str(e)
+        return result
+    
+    async def worker() -> None:
+        while True:
+            try:
+                index, (content_type, level) = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await results.put(await run_job(index, content_type, level))
+    
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, min(concurrency, len(jobs))))]
+    summary = {"succeeded": 0, "failed": 0, "saved": 0}
+    try:
+        for _ in range(len(jobs)):
+            result = await results.get()
+            if result["status"] == "ok":
+                summary["succeeded"] += 1
+            else:
+                summary["failed"] += 1
+            if "saved_id" in result:
+                summary["saved"] += 1
+            yield result
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+    
+    elapsed = time.monotonic() - started
+    logger.info(f"일괄 생성 완료: {len(jobs)}개 중 성공 {summary['succeeded']}개, "
+                f"저장 {summary['saved']}개 ({elapsed:.1f}초)")
+    yield {"done": True, "total": len(jobs), **summary, "elapsed": round(elapsed, 2)}
@@ -4,36 +4,112 @@
 GPT 모델을 사용하여 한국어 학습 콘텐츠를 생성하는 서비스를 제공합니다.
 """
 
+import asyncio
 import json
-from typing import Dict, Any, Optional, List, Union
-import re
+import math
+import time
+from typing import AsyncIterator, Callable, Dict, Any, Optional, List, Sequence, Tuple, Union
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, BadRequestError, OpenAI, UnprocessableEntityError
 from app.config import AIConfig
-from app.templates import get_template, build_regenerate_prompt, TemplateType
+from app.services.prompt_cache import PromptCache, make_cache_key
+from app.services.rate_limiter import Priority, RateLimitScheduler, count_text_tokens, estimate_tokens
+from app.services.output_budget import OutputBudget, next_max_tokens
+from app.services.scoring import score_content
+from app.services.single_flight import SingleFlight
+from app.services.usage import UsageLog, UsageOutcome
+from app.templates import (
+    get_template, get_content_fields, build_regenerate_prompt, build_partial_regenerate_prompt,
+    expand_regenerate_fields, get_context_fields, TemplateType
+)
 from app.utils.logger import get_logger
-from app.utils.json_debug import safely_parse_json, fix_common_json_errors
+from app.utils.json_debug import safely_parse_json, scan_json_object
+from app.utils.models import content_json_schema, partial_json_schema, validate_content
+from app.utils.partial_json import PartialJSONParser
 
 # 모듈 로거 설정
 logger = get_logger("generator")
 
+# GPT 시스템 메시지
+GENERATION_SYSTEM_MESSAGE = "당신은 한국어 교육용 콘텐츠를 생성하는 AI입니다. 응답은 JSON 형식으로 반환합니다."
+REGENERATION_SYSTEM_MESSAGE = "당신은 한국어 교육용 콘텐츠를 생성하는 AI입니다. 응답은 항상 순수한 JSON 형식으로만 반환합니다."
+
+# 재생성 과정에서 기록되는 필드 (프롬프트에 보내지 않고, 결과에 원본 값을 복원하지도 않음)
+REGENERATION_FIELDS = ("regenerated", "regenerated_fields", "user_comment", "original_prompt",
+                       "original_content", "error", "raw", "raw_regenerated")
+
+# 구조화된 출력 방식을 지원하지 않는 모델/백엔드에서 전환할 다음 방식
+RESPONSE_FORMAT_FALLBACK = {"json_schema": "json_object", "json_object": "off"}
+
+# 콘텐츠 필드를 알 수 없는 유형에서 프롬프트에 보내지 않는 메타데이터 필드
+METADATA_FIELDS = ("id", "created_at", "updated_at") + REGENERATION_FIELDS
+
+
+def create_async_openai_client(api_key: Optional[str] = None) -> Optional[AsyncOpenAI]:
+    """
+    연결 풀 설정이 적용된 AsyncOpenAI 클라이언트를 생성합니다.
+    
+    애플리케이션 전체에서 하나만 만들어 공유하므로 요청마다 새 연결을
+    맺지 않고 keep-alive 연결을 재사용합니다.
+    
+    Args:
+        api_key: OpenAI API 키 (기본값: config의 API_KEY)
+        
+    Returns:
+        AsyncOpenAI 클라이언트 또는 None (API 키가 없는 경우)
+    """
+    api_key = api_key or AIConfig.API_KEY
+    if not api_key:
+        logger.warning("API 키가 설정되지 않았습니다.")
+        return None
+    
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=AIConfig.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=AIConfig.HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=AIConfig.HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(AIConfig.REQUEST_TIMEOUT, connect=10.0),
+    )
+    # 재시도는 RateLimitScheduler가 담당하므로 SDK 자체 재시도는 끔
+    return AsyncOpenAI(api_key=api_key, base_url=AIConfig.BASE_URL, http_client=http_client, max_retries=0)
+
 
 class ContentGenerator:
     """
     GPT를 사용하여 한국어 학습 콘텐츠를 생성하는 서비스
     """
     
-    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None,
+                 async_client: Optional[AsyncOpenAI] = None, cache: Optional[PromptCache] = None,
+                 scheduler: Optional[RateLimitScheduler] = None, usage_log: Optional[UsageLog] = None,
+                 single_flight: Optional[SingleFlight] = None,
+                 output_budget: Optional[OutputBudget] = None):
         """
         ContentGenerator 초기화
         
         Args:
             api_key: OpenAI API 키 (기본값: config의 API_KEY)
             model: 사용할 GPT 모델 (기본값: config의 MODEL)
+            async_client: 비동기 메서드가 사용할 공유 AsyncOpenAI 클라이언트
+                (기본값: None이면 API 호출마다 동기 클라이언트를 스레드에서 실행)
+            cache: GPT 응답 캐시 (기본값: None, 캐시 사용 안 함)
+            scheduler: 속도 제한/재시도 스케줄러 (기본값: None, 바로 호출)
+            usage_log: GPT 호출 사용량 로그 (기본값: None, 기록 안 함)
+            single_flight: 동일 요청 병합기 (기본값: None, 병합 안 함)
+            output_budget: 유형별 출력 토큰 예산 (기본값: None, 항상 AIConfig.MAX_TOKENS 사용)
         """
         self.api_key = api_key or AIConfig.API_KEY
         self.model = model or AIConfig.MODEL
+        self.scheduler = scheduler
         self.client = self._create_client()
+        self.async_client = async_client
+        self.cache = cache
+        self.usage_log = usage_log
+        self.single_flight = single_flight
+        self.output_budget = output_budget
+        self.response_format = AIConfig.RESPONSE_FORMAT
         
     def _create_client(self) -> Optional[OpenAI]:
         """OpenAI 클라이언트 생성"""
@@ -42,61 +118,241 @@ class ContentGenerator:
             return None
         
         try:
-            return OpenAI(api_key=self.api_key)
+            return OpenAI(api_key=self.api_key, base_url=AIConfig.BASE_URL,
+                          max_retries=0 if self.scheduler is not None else 2)
         except Exception as e:
             logger.error(f"OpenAI 클라이언트 생성 중 오류: {str(e)}")
             return None
         
-    def generate(self, content_type: str, level: str) -> Dict[str, Any]:
+    async def generate_async(self, content_type: str, level: str, use_cache: bool = False,
+                             priority: int = Priority.INTERACTIVE, n: int = 1) -> Dict[str, Any]:
         """
-        지정된 유형과 레벨로 콘텐츠를 생성합니다.
+        지정된 유형과 레벨로 콘텐츠를 비동기로 생성합니다.
+        
+        공유 AsyncOpenAI 클라이언트를 사용하므로 생성 중에도 이벤트 루프가
+        다른 요청을 처리할 수 있습니다.
         
         Args:
             content_type: 생성할 콘텐츠 유형 (dialogue, lecture 등)
             level: 학습자 레벨 (초급, 중급, 고급 등)
+            use_cache: 캐시된 응답 사용 여부 (기본값: False, 생성은 매번 새로 하고 응답은 캐시에 저장)
+            priority: 속도 제한 대기열 우선순위 (기본값: Priority.INTERACTIVE)
+            n: 한 번의 호출로 생성할 후보 수 (1보다 크면 점수가 가장 높은 후보 반환, 기본값: 1)
             
         Returns:
             생성된 콘텐츠의 딕셔너리
         """
-        if not self.client:
+        if n > 1:
+            return (await self.generate_candidates_async(content_type, level, n, use_cache, priority))[0]
+        
+        if not self.client and not self.async_client:
             logger.warning("API 키가 설정되지 않아 모의 콘텐츠를 반환합니다.")
             return self._generate_mock_content(content_type, level)
-            
+        
+        usage = self._new_usage("generate", content_type, level)
+        response = None
         try:
             logger.info(f"콘텐츠 생성 시작: {content_type} / {level}")
             
-            # 템플릿 가져오기
-            template = get_template(content_type)
-            if not template:
-                raise ValueError(f"알 수 없는 콘텐츠 유형: {content_type}")
-            
             # 프롬프트 생성
-            prompt = template.format(level=level)
+            prompt = self._build_generation_prompt(content_type, level)
             
             # GPT 호출
-            response = self._call_gpt(
-                system_message="당신은 한국어 교육용 콘텐츠를 생성하는 AI입니다.",
-                user_message=prompt
+            response = await self._call_gpt_async(
+                system_message=GENERATION_SYSTEM_MESSAGE,
+                user_message=prompt,
+                use_cache=use_cache,
+                priority=priority,
+                usage=usage,
+                content_type=content_type
             )
             
-            # 결과 처리 및 반환
-            return self._process_generation_result(response, content_type, level, prompt)
+            # 결과 처리
+            result = self._process_generation_result(response, content_type, level, prompt)
                 
         except Exception as e:
-            logger.error(f"콘텐츠 생성 중 오류: {str(e)}")
-            return {
-                "error": f"콘텐츠 생성 중 오류가 발생했습니다: {str(e)}",
-                "type": content_type,
-                "level": level
-            }
+            result = self._generation_error(e, content_type, level)
+        
+        await self._record_usage_async(usage, response, result)
+        return result
+    
+    async def generate_candidates_async(self, content_type: str, level: str, n: Optional[int] = None,
+                                        use_cache: bool = False,
+                                        priority: int = Priority.INTERACTIVE) -> List[Dict[str, Any]]:
+        """
+        한 번의 호출로 후보 n개를 비동기로 생성하고 로컬 점수(score_content) 순으로 정렬합니다.
+        
+        Args:
+            content_type: 생성할 콘텐츠 유형 (dialogue, lecture 등)
+            level: 학습자 레벨 (초급, 중급, 고급 등)
+            n: 후보 수 (기본값: AIConfig.GENERATION_CANDIDATES)
+            use_cache: 캐시된 응답 사용 여부 (기본값: False, 캐시 적중이면 후보 없이 캐시된 응답 하나만 반환,
+                캐시에는 가장 좋은 후보만 저장)
+            priority: 속도 제한 대기열 우선순위 (기본값: Priority.INTERACTIVE)
+            
+        Returns:
+            후보 콘텐츠 목록 (첫 번째가 가장 좋은 후보, 나머지는 모델 검증을 통과한 후보만 포함)
+        """
+        n = n or AIConfig.GENERATION_CANDIDATES
+        if n <= 1:
+            return [await self.generate_async(content_type, level, use_cache, priority)]
+        if not self.client and not self.async_client:
+            logger.warning("API 키가 설정되지 않아 모의 콘텐츠를 반환합니다.")
+            return [self._generate_mock_content(content_type, level)]
+        
+        usage = self._new_usage("generate", content_type, level)
+        response = None
+        try:
+            logger.info(f"콘텐츠 후보 {n}개 생성 시작: {content_type} / {level}")
+            
+            # 프롬프트 생성
+            prompt = self._build_generation_prompt(content_type, level)
+            
+            # GPT 호출 (후보 n개)
+            responses, cache_key = await self._call_gpt_choices_async(
+                system_message=GENERATION_SYSTEM_MESSAGE,
+                user_message=prompt,
+                n=n,
+                use_cache=use_cache,
+                priority=priority,
+                usage=usage,
+                content_type=content_type
+            )
+            
+            # 후보 점수 계산 및 정렬
+            ranked = self._rank_candidates(responses, content_type, level, prompt, usage)
+            response = ranked[0][1]
+            if cache_key and ranked[0][2]["valid"]:
+                await asyncio.to_thread(self.cache.set, cache_key, response)
+            results = [result for result, _, _ in ranked]
+        
+        except Exception as e:
+            results = [self._generation_error(e, content_type, level)]
+        
+        await self._record_usage_async(usage, response, results[0])
+        return results
+    
+    def _rank_candidates(self, responses: List[str], content_type: str, level: str, prompt: str,
+                         usage: Dict[str, Any]) -> List[Tuple[Dict[str, Any], str, Dict[str, Any]]]:
+        """
+        후보 응답을 처리하여 점수 순으로 정렬합니다. (점수가 같으면 먼저 나온 후보 우선)
+        
+        Args:
+            responses: 후보 응답 텍스트 목록
+            content_type: 콘텐츠 유형
+            level: 콘텐츠 레벨
+            prompt: 사용된 프롬프트
+            usage: 후보 점수를 기록할 사용량 기록
+            
+        Returns:
+            (콘텐츠, 응답 텍스트, 점수) 튜플 목록 (첫 번째는 항상 포함, 나머지는 모델 검증을 통과한 후보만)
+        """
+        scored = []
+        for response in responses:
+            result = self._process_generation_result(response, content_type, level, prompt)
+            scored.append((result, response, score_content(result)))
+        
+        ranked = sorted(scored, key=lambda item: (item[2]["valid"], item[2]["score"]), reverse=True)
+        usage["candidate_scores"] = [score["score"] for _, _, score in scored]
+        best = ranked[0][2]
+        logger.info(f"후보 {len(scored)}개 중 점수 {best['score']}인 후보 선택"
+                    + (f" (감점: {'; '.join(best['issues'])})" if best["issues"] else ""))
+        return ranked[:1] + [item for item in ranked[1:] if item[2]["valid"]]
+    
+    async def generate_stream(self, content_type: str, level: str, use_cache: bool = False,
+                              priority: int = Priority.INTERACTIVE) -> AsyncIterator[Dict[str, Any]]:
+        """
+        콘텐츠를 스트리밍으로 생성하며 진행 이벤트를 차례로 반환합니다.
+        
+        응답 조각마다 {"event": "delta", "text", "content"} 이벤트를 반환하며,
+        content는 지금까지 받은 부분 JSON이 바뀐 경우에만 포함됩니다.
+        마지막에는 검증/보정을 마친 {"event": "done", "content", "validation_error"}
+        이벤트를 반환합니다.
+        
+        Args:
+            content_type: 생성할 콘텐츠 유형 (dialogue, lecture 등)
+            level: 학습자 레벨 (초급, 중급, 고급 등)
+            use_cache: 캐시된 응답 사용 여부 (기본값: False, 생성은 매번 새로 하고 응답은 캐시에 저장)
+            priority: 속도 제한 대기열 우선순위 (기본값: Priority.INTERACTIVE)
+            
+        Yields:
+            진행 이벤트 딕셔너리
+        """
+        if not self.client and not self.async_client:
+            logger.warning("API 키가 설정되지 않아 모의 콘텐츠를 반환합니다.")
+            content = self._generate_mock_content(content_type, level)
+            yield {"event": "done", "content": content, "validation_error": validate_content(content)}
+            return
+        
+        usage = self._new_usage("generate_stream", content_type, level)
+        response = None
+        try:
+            logger.info(f"콘텐츠 스트리밍 생성 시작: {content_type} / {level}")
+            prompt = self._build_generation_prompt(content_type, level)
+            
+            parser = PartialJSONParser()
+            chunks: List[str] = []
+            async for text in self._stream_gpt_async(
+                system_message=GENERATION_SYSTEM_MESSAGE,
+                user_message=prompt,
+                use_cache=use_cache,
+                priority=priority,
+                usage=usage,
+                content_type=content_type
+            ):
+                chunks.append(text)
+                event = {"event": "delta", "text": text}
+                partial = parser.feed(text)
+                if isinstance(partial, dict):
+                    event["content"] = partial
+                yield event
+            
+            # 스트리밍이 끝나면 전체 응답으로 일반 생성과 같은 파싱/보정 수행
+            response = "".join(chunks).strip()
+            content = self._process_generation_result(response, content_type, level, prompt)
+        except Exception as e:
+            content = self._generation_error(e, content_type, level)
+        
+        await self._record_usage_async(usage, response, content)
+        yield {"event": "done", "content": content, "validation_error": validate_content(content)}
     
-    def regenerate(self, content_data: Union[Dict[str, Any], str], user_comment: str) -> Dict[str, Any]:
+    def _build_generation_prompt(self, content_type: str, level: str) -> str:
         """
-        기존 콘텐츠와 사용자 요구사항을 기반으로 콘텐츠를 재생성합니다.
+        생성 프롬프트를 구성합니다.
+        
+        Args:
+            content_type: 콘텐츠 유형
+            level: 학습자 레벨
+            
+        Returns:
+            구성된 프롬프트
+        """
+        template = get_template(content_type)
+        if not template:
+            raise ValueError(f"알 수 없는 콘텐츠 유형: {content_type}")
+        
+        return template.format(level=level)
+    
+    def _generation_error(self, error: Exception, content_type: str, level: str) -> Dict[str, Any]:
+        """생성 실패 시 반환할 오류 콘텐츠를 만듭니다."""
+        logger.error(f"콘텐츠 생성 중 오류: {str(error)}")
+        return {
+            "error": f"콘텐츠 생성 중 오류가 발생했습니다: {str(error)}",
+            "type": content_type,
+            "level": level
+        }
+    
+    async def regenerate_async(self, content_data: Union[Dict[str, Any], str],
+                               user_comment: str, use_cache: bool = True,
+                               priority: int = Priority.INTERACTIVE) -> Dict[str, Any]:
+        """
+        기존 콘텐츠와 사용자 요구사항을 기반으로 콘텐츠를 비동기로 재생성합니다.
         
         Args:
             content_data: 기존 콘텐츠 데이터 (딕셔너리 또는 JSON 문자열)
             user_comment: 사용자의 추가 요구사항
+            use_cache: 캐시된 응답 사용 여부 (False면 새로 생성, 기본값: True)
+            priority: 속도 제한 대기열 우선순위 (기본값: Priority.INTERACTIVE)
             
         Returns:
             재생성된 콘텐츠의 딕셔너리
@@ -104,70 +360,586 @@ class ContentGenerator:
         # 입력 데이터 전처리
         content_data = self._prepare_content_data(content_data)
         
-        if not self.client:
+        if not self.client and not self.async_client:
             logger.warning("API 키가 설정되지 않아 모의 재생성 콘텐츠를 반환합니다.")
             content_data["regenerated"] = True
             content_data["user_comment"] = user_comment
             return content_data
             
+        usage = self._new_usage("regenerate", content_data.get("type"), content_data.get("level"))
+        response = None
         try:
-            # 콘텐츠 정보 추출
-            content_type = content_data.get("type", "")
-            level = content_data.get("level", "")
-            
-            logger.info(f"콘텐츠 재생성 시작: {content_type} / {level}")
+            logger.info(f"콘텐츠 재생성 시작: {content_data.get('type', '')} / {content_data.get('level', '')}")
             
             # 재생성 프롬프트 구성
             prompt = self._build_regenerate_prompt(content_data, user_comment)
             
             # GPT 호출
-            response = self._call_gpt(
-                system_message="당신은 한국어 교육용 콘텐츠를 생성하는 AI입니다. 응답은 항상 순수한 JSON 형식으로만 반환합니다.",
+            response = await self._call_gpt_async(
+                system_message=REGENERATION_SYSTEM_MESSAGE,
                 user_message=prompt,
-                temperature=0.7
+                temperature=0.7,
+                use_cache=use_cache,
+                priority=priority,
+                usage=usage,
+                content_type=content_data.get("type")
             )
             
-            # 결과 처리 및 반환
-            return self._process_regeneration_result(response, content_data, user_comment)
+            # 결과 처리
+            result = self._process_regeneration_result(response, content_data, user_comment)
                 
         except Exception as e:
-            logger.error(f"콘텐츠 재생성 중 오류: {str(e)}")
-            # 오류 시 원본 콘텐츠에 오류 정보 추가
-            content_data["error"] = f"콘텐츠 재생성 중 오류가 발생했습니다: {str(e)}"
+            result = self._regeneration_error(e, content_data, user_comment)
+        
+        await self._record_usage_async(usage, response, result)
+        return result
+    
+    async def regenerate_fields_async(self, content_data: Union[Dict[str, Any], str], fields: Sequence[str],
+                                      user_comment: str, use_cache: bool = True,
+                                      priority: int = Priority.INTERACTIVE) -> Dict[str, Any]:
+        """
+        기존 콘텐츠의 일부 필드만 사용자 요구사항에 맞게 비동기로 다시 작성합니다.
+        
+        Args:
+            content_data: 기존 콘텐츠 데이터 (딕셔너리 또는 JSON 문자열)
+            fields: 다시 작성할 필드 목록
+            user_comment: 사용자의 추가 요구사항
+            use_cache: 캐시된 응답 사용 여부 (False면 새로 생성, 기본값: True)
+            priority: 속도 제한 대기열 우선순위 (기본값: Priority.INTERACTIVE)
+            
+        Returns:
+            대상 필드를 다시 작성한 콘텐츠의 딕셔너리
+        """
+        # 입력 데이터 전처리
+        content_data = self._prepare_content_data(content_data)
+        
+        if not self.client and not self.async_client:
+            logger.warning("API 키가 설정되지 않아 모의 재생성 콘텐츠를 반환합니다.")
+            content_data["regenerated"] = True
             content_data["user_comment"] = user_comment
             return content_data
+        
+        usage = self._new_usage("regenerate_fields", content_data.get("type"), content_data.get("level"))
+        response = None
+        try:
+            content_type = content_data.get("type", "")
+            targets = expand_regenerate_fields(content_type, fields)
+            usage["fields"] = list(targets)
+            logger.info(f"콘텐츠 부분 재생성 시작: {content_type} / {content_data.get('level', '')} / {', '.join(targets)}")
+            
+            # 부분 재생성 프롬프트 구성
+            prompt = self._build_partial_regenerate_prompt(content_data, targets, user_comment)
+            
+            # GPT 호출
+            response = await self._call_gpt_async(
+                system_message=REGENERATION_SYSTEM_MESSAGE,
+                user_message=prompt,
+                temperature=0.7,
+                use_cache=use_cache,
+                priority=priority,
+                usage=usage,
+                content_type=content_type,
+                fields=targets
+            )
+            
+            # 결과 병합
+            result = self._process_partial_regeneration_result(response, content_data, targets, user_comment)
+        
+        except Exception as e:
+            result = self._regeneration_error(e, content_data, user_comment)
+        
+        await self._record_usage_async(usage, response, result)
+        return result
+    
+    def _regeneration_error(self, error: Exception, content_data: Dict[str, Any],
+                            user_comment: str) -> Dict[str, Any]:
+        """재생성 실패 시 원본 콘텐츠에 오류 정보를 추가하여 반환합니다."""
+        logger.error(f"콘텐츠 재생성 중 오류: {str(error)}")
+        content_data["error"] = f"콘텐츠 재생성 중 오류가 발생했습니다: {str(error)}"
+        content_data["user_comment"] = user_comment
+        return content_data
             
-    def _call_gpt(self, system_message: str, user_message: str, 
-                 temperature: Optional[float] = None) -> str:
+    async def _call_gpt_async(self, system_message: str, user_message: str,
+                              temperature: Optional[float] = None, use_cache: bool = True,
+                              priority: int = Priority.INTERACTIVE,
+                              usage: Optional[Dict[str, Any]] = None,
+                              content_type: Optional[str] = None,
+                              fields: Optional[Tuple[str, ...]] = None) -> str:
         """
-        GPT 모델을 호출하여 응답을 생성합니다.
+        GPT 모델을 비동기로 호출하여 응답을 생성합니다.
+        
+        캐시가 설정된 경우 같은 호출 인자의 응답을 재사용하고, 새 응답은 캐시에 저장합니다.
+        캐시의 디스크 계층 조회와 저장은 스레드에서 실행합니다.
         
         Args:
             system_message: 시스템 메시지
             user_message: 사용자 메시지
             temperature: 생성 온도 (기본값: AIConfig.TEMPERATURE)
+            use_cache: 캐시된 응답 사용 여부 (False여도 새 응답은 캐시에 저장, 기본값: True)
+            priority: 속도 제한 대기열 우선순위 (기본값: Priority.INTERACTIVE)
+            usage: 모델, 토큰 사용량, 지연 시간을 채워 넣을 사용량 기록 (선택)
+            content_type: 구조화된 출력 스키마를 적용할 콘텐츠 유형 (선택)
+            fields: 일부 필드만 응답받는 경우 그 필드 목록 (선택)
             
         Returns:
             GPT 응답 텍스트
         """
-        if not self.client:
-            raise ValueError("OpenAI 클라이언트가 초기화되지 않았습니다.")
+        usage = usage if usage is not None else {}
+        started = time.monotonic()
+        params = self._completion_params(system_message, user_message, temperature, content_type, fields)
+        usage["model"] = params["model"]
+        cache_key = make_cache_key(params) if self.cache is not None else None
+        cached = await self._cached_response(cache_key, use_cache, usage, started)
+        if cached is not None:
+            return cached
         
+        response = None
+        leader = True
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_message},
-                    {"role": "user", "content": user_message}
-                ],
-                temperature=temperature or AIConfig.TEMPERATURE,
-                max_tokens=AIConfig.MAX_TOKENS
-            )
+            if use_cache and self.single_flight is not None:
+                # 같은 호출 인자로 진행 중인 요청이 있으면 그 upstream 호출의 결과를 함께 사용
+                (result, response), leader = await self.single_flight.do(
+                    cache_key or make_cache_key(params),
+                    lambda: self._fetch_async(params, priority, cache_key, content_type, fields)
+                )
+            else:
+                result, response = await self._fetch_async(params, priority, cache_key, content_type, fields)
+        except Exception as e:
+            logger.error(f"GPT 호출 중 오류: {str(e)}")
+            raise ValueError(f"GPT 호출 실패: {str(e)}")
+        finally:
+            # 공유받은 응답의 토큰은 직접 호출한 요청에만 기록
+            self._fill_usage(usage, started, getattr(response, "usage", None) if leader else None,
+                             coalesced=not leader, finish_reason=self._finish_reason(response))
+        return result
+    
+    async def _fetch_async(self, params: Dict[str, Any], priority: int, cache_key: Optional[str],
+                           content_type: Optional[str] = None,
+                           fields: Optional[Tuple[str, ...]] = None) -> Tuple[str, Any]:
+        """
+        GPT를 호출하고 캐시 가능한 응답은 캐시에 저장합니다.
+        
+        Args:
+            params: chat.completions.create 호출 인자
+            priority: 속도 제한 대기열 우선순위
+            cache_key: 응답을 저장할 캐시 키 (None이면 저장 안 함)
+            content_type: 출력 토큰 예산에 반영할 콘텐츠 유형 (선택)
+            fields: 일부 필드만 응답받는 경우 그 필드 목록 (선택)
+            
+        Returns:
+            (응답 텍스트, 원본 응답) 튜플
+        """
+        response = await self._request_async(params, priority, content_type, fields)
+        result = response.choices[0].message.content.strip()
+        if cache_key and not self._is_truncated(response) and self._is_cacheable(result):
+            await asyncio.to_thread(self.cache.set, cache_key, result)
+        return result, response
+    
+    async def _call_gpt_choices_async(self, system_message: str, user_message: str, n: int,
+                                      use_cache: bool = True, priority: int = Priority.INTERACTIVE,
+                                      usage: Optional[Dict[str, Any]] = None,
+                                      content_type: Optional[str] = None) -> Tuple[List[str], Optional[str]]:
+        """
+        GPT 모델을 비동기로 한 번 호출하여 후보 응답 n개를 생성합니다.
+        
+        캐시된 응답이 있으면 그 응답 하나만 반환합니다. 후보 중 어느 것을 캐시할지는
+        호출한 쪽이 점수를 매긴 뒤 정하므로 여기서는 저장하지 않습니다.
+        후보마다 결과가 다르므로 동일 요청 공유(single-flight)는 사용하지 않습니다.
+        
+        Args:
+            system_message: 시스템 메시지
+            user_message: 사용자 메시지
+            n: 후보 수
+            use_cache: 캐시된 응답 사용 여부 (기본값: True)
+            priority: 속도 제한 대기열 우선순위 (기본값: Priority.INTERACTIVE)
+            usage: 모델, 토큰 사용량, 지연 시간을 채워 넣을 사용량 기록 (선택)
+            content_type: 구조화된 출력 스키마를 적용할 콘텐츠 유형 (선택)
             
-            return response.choices[0].message.content.strip()
+        Returns:
+            (후보 응답 텍스트 목록, 가장 좋은 후보를 저장할 캐시 키) 튜플 (캐시 적중이면 캐시 키는 None)
+        """
+        usage = usage if usage is not None else {}
+        started = time.monotonic()
+        params = {**self._completion_params(system_message, user_message, None, content_type), "n": n}
+        usage["model"] = params["model"]
+        usage["n"] = n
+        cache_key = make_cache_key(params) if self.cache is not None else None
+        cached = await self._cached_response(cache_key, use_cache, usage, started)
+        if cached is not None:
+            return [cached], None
+        
+        response = None
+        try:
+            response = await self._request_async(params, priority, content_type)
+            results = self._choice_texts(response)
         except Exception as e:
             logger.error(f"GPT 호출 중 오류: {str(e)}")
             raise ValueError(f"GPT 호출 실패: {str(e)}")
+        finally:
+            self._fill_usage(usage, started, getattr(response, "usage", None),
+                             finish_reason=self._finish_reason(response))
+        return results, cache_key
+    
+    def _choice_texts(self, response: Any) -> List[str]:
+        """
+        응답의 후보 텍스트 목록을 반환합니다.
+        
+        잘린 후보는 제외하되, 모든 후보가 잘렸으면 그대로 반환합니다. (결과 처리에서 보정 시도)
+        """
+        complete = [c for c in response.choices if getattr(c, "finish_reason", None) != "length"]
+        return [(c.message.content or "").strip() for c in complete or response.choices]
+    
+    async def _stream_gpt_async(self, system_message: str, user_message: str,
+                                temperature: Optional[float] = None, use_cache: bool = True,
+                                priority: int = Priority.INTERACTIVE,
+                                usage: Optional[Dict[str, Any]] = None,
+                                content_type: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        GPT 모델을 스트리밍 모드로 호출하여 응답 조각을 차례로 반환합니다.
+        
+        캐시된 응답이 있으면 한 번에 반환하고, 공유 AsyncOpenAI 클라이언트가 없으면
+        일반 호출 결과를 한 조각으로 반환합니다. 완성된 응답은 캐시에 저장합니다.
+        
+        Args:
+            system_message: 시스템 메시지
+            user_message: 사용자 메시지
+            temperature: 생성 온도 (기본값: AIConfig.TEMPERATURE)
+            use_cache: 캐시된 응답 사용 여부 (기본값: True)
+            priority: 속도 제한 대기열 우선순위 (기본값: Priority.INTERACTIVE)
+            usage: 모델, 토큰 사용량, 지연 시간을 채워 넣을 사용량 기록 (선택)
+            content_type: 구조화된 출력 스키마를 적용할 콘텐츠 유형 (선택)
+            
+        Yields:
+            응답 텍스트 조각
+        """
+        if not self.async_client:
+            yield await self._call_gpt_async(system_message, user_message, temperature, use_cache,
+                                             priority, usage, content_type)
+            return
+        
+        usage = usage if usage is not None else {}
+        started = time.monotonic()
+        params = self._completion_params(system_message, user_message, temperature, content_type)
+        usage["model"] = params["model"]
+        cache_key = make_cache_key(params) if self.cache is not None else None
+        cached = await self._cached_response(cache_key, use_cache, usage, started)
+        if cached is not None:
+            yield cached
+            return
+        
+        chunks: List[str] = []
+        stream_usage = None
+        finish_reason = None
+        try:
+            # 재시도는 스트림을 여는 단계까지만 적용 (조각을 보낸 뒤에는 재시도하지 않음)
+            # 사용량은 include_usage를 켜면 마지막 조각(choices 없음)에 담겨 옴
+            stream = await self._request_async(
+                {**params, "stream": True, "stream_options": {"include_usage": True}}, priority
+            )
+            # 클라이언트가 연결을 끊어 중단되어도 응답 연결이 닫히도록 컨텍스트로 사용
+            async with stream:
+                async for chunk in stream:
+                    if getattr(chunk, "usage", None) is not None:
+                        stream_usage = chunk.usage
+                    if not chunk.choices:
+                        continue
+                    finish_reason = chunk.choices[0].finish_reason or finish_reason
+                    text = chunk.choices[0].delta.content
+                    if text:
+                        chunks.append(text)
+                        yield text
+        except Exception as e:
+            logger.error(f"GPT 스트리밍 호출 중 오류: {str(e)}")
+            raise ValueError(f"GPT 호출 실패: {str(e)}")
+        finally:
+            self._fill_usage(usage, started, stream_usage, finish_reason=finish_reason)
+        
+        # 조각을 이미 보냈으므로 잘린 응답은 다시 호출하지 않고 다음 호출의 예산에만 반영
+        truncated = finish_reason == "length"
+        if self.output_budget is not None:
+            self.output_budget.observe(content_type, getattr(stream_usage, "completion_tokens", None), truncated)
+        if truncated:
+            logger.warning(f"스트리밍 응답이 최대 토큰 수({params['max_tokens']})에서 잘렸습니다.")
+        
+        result = "".join(chunks).strip()
+        if cache_key and not truncated and self._is_cacheable(result):
+            await asyncio.to_thread(self.cache.set, cache_key, result)
+    
+    async def _cached_response(self, cache_key: Optional[str], use_cache: bool,
+                               usage: Dict[str, Any], started: float) -> Optional[str]:
+        """
+        캐시된 응답을 조회합니다. (메모리 계층을 먼저 보고, 디스크 계층은 스레드에서 조회)
+        
+        Args:
+            cache_key: 캐시 키 (None이면 조회 안 함)
+            use_cache: 캐시된 응답 사용 여부
+            usage: 캐시 적중 시 채워 넣을 사용량 기록
+            started: 호출 시작 시각 (time.monotonic)
+            
+        Returns:
+            캐시된 응답 텍스트 또는 None
+        """
+        if not cache_key or not use_cache:
+            return None
+        cached = self.cache.get(cache_key, disk=False)
+        if cached is None:
+            cached = await asyncio.to_thread(self.cache.get, cache_key)
+        if cached is not None:
+            logger.info("캐시된 GPT 응답을 사용합니다.")
+            self._fill_usage(usage, started, None, cache_hit=True)
+        return cached
+    
+    async def _request_async(self, params: Dict[str, Any], priority: int = Priority.INTERACTIVE,
+                             content_type: Optional[str] = None,
+                             fields: Optional[Tuple[str, ...]] = None) -> Any:
+        """
+        스케줄러(설정된 경우)를 거쳐 API를 호출합니다.
+        
+        구조화된 출력을 지원하지 않아 거부되면 다음 방식으로 전환하여 다시 호출하고,
+        응답이 max_tokens에서 잘리면 예산을 늘려 다시 호출합니다. (스트리밍 제외)
+        """
+        truncation_retries = AIConfig.TRUNCATION_RETRIES
+        while True:
+            try:
+                response = await self._send_async(params, priority)
+            except (BadRequestError, UnprocessableEntityError) as e:
+                params = self._fallback_response_format(params, e)
+                continue
+            
+            if params.get("stream"):
+                return response
+            max_tokens = self._observe_output(params, response, content_type, fields)
+            if max_tokens is None or truncation_retries <= 0:
+                return response
+            truncation_retries -= 1
+            params = {**params, "max_tokens": max_tokens}
+    
+    def _observe_output(self, params: Dict[str, Any], response: Any, content_type: Optional[str],
+                        fields: Optional[Tuple[str, ...]] = None) -> Optional[int]:
+        """
+        응답의 출력 토큰 수를 예산에 반영하고, 잘린 응답이면 다시 호출할 max_tokens를 반환합니다.
+        
+        Args:
+            params: 호출 인자
+            response: API 응답
+            content_type: 콘텐츠 유형 (선택)
+            fields: 일부 필드만 응답받은 경우 그 필드 목록 (선택)
+            
+        Returns:
+            늘린 max_tokens 또는 None (잘리지 않았거나 이미 상한인 경우)
+        """
+        choices = getattr(response, "choices", None) or []
+        truncated = [getattr(c, "finish_reason", None) == "length" for c in choices]
+        if self.output_budget is not None:
+            # 후보가 여러 개면 출력 토큰은 후보 수로 나눈 평균을 관측값으로 사용
+            completion_tokens = getattr(getattr(response, "usage", None), "completion_tokens", None)
+            if completion_tokens and len(choices) > 1:
+                completion_tokens = math.ceil(completion_tokens / len(choices))
+            self.output_budget.observe(content_type, completion_tokens, any(truncated), fields)
+        # 잘리지 않은 후보가 하나라도 있으면 다시 호출하지 않음
+        if not truncated or not all(truncated):
+            return None
+        
+        max_tokens = next_max_tokens(params["max_tokens"])
+        if max_tokens is None:
+            logger.warning(f"응답이 최대 토큰 수 상한({params['max_tokens']})에서 잘렸습니다.")
+        else:
+            logger.warning(f"응답이 최대 토큰 수({params['max_tokens']})에서 잘려 {max_tokens}로 늘려 다시 호출합니다.")
+        return max_tokens
+    
+    async def _send_async(self, params: Dict[str, Any], priority: int) -> Any:
+        """
+        API를 한 번 호출합니다. (재시도는 스케줄러가 담당)
+        
+        공유 AsyncOpenAI 클라이언트가 없으면 동기 클라이언트 호출을 스레드에서 실행합니다.
+        """
+        def call():
+            if self.async_client is not None:
+                return self.async_client.chat.completions.create(**params)
+            return asyncio.to_thread(self.client.chat.completions.create, **params)
+        
+        if self.scheduler is None:
+            return await call()
+        
+        cost = estimate_tokens(params["messages"], params["max_tokens"] * params.get("n", 1))
+        # 구조화된 출력 거부는 _request_async가 다른 방식으로 전환하므로 실패로 집계하지 않음
+        response = await self.scheduler.run(
+            call, cost, priority, handled=lambda e: self._is_response_format_error(params, e)
+        )
+        self.scheduler.settle(cost, self._usage_total(response))
+        return response
+    
+    @staticmethod
+    def _is_response_format_error(params: Dict[str, Any], error: Exception) -> bool:
+        """
+        구조화된 출력 방식(response_format)이 거부되어 발생한 오류인지 확인합니다.
+        
+        Args:
+            params: 호출 인자
+            error: API 오류
+            
+        Returns:
+            response_format 거부 오류 여부
+        """
+        if not params.get("response_format"):
+            return False
+        if not isinstance(error, (BadRequestError, UnprocessableEntityError)):
+            return False
+        message = str(error)
+        return ("response_format" in message or "json_schema" in message
+                or getattr(error, "param", None) == "response_format")
+    
+    def _fallback_response_format(self, params: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """
+        구조화된 출력 방식이 거부된 경우 다음 방식으로 전환한 호출 인자를 반환합니다.
+        
+        전환한 방식은 이후 호출에도 적용됩니다.
+        
+        Args:
+            params: 거부된 호출 인자
+            error: API 오류
+            
+        Returns:
+            다음 방식의 response_format을 적용한 호출 인자
+            
+        Raises:
+            Exception: response_format과 관련 없는 오류이거나 더 전환할 방식이 없는 경우 원래 오류
+        """
+        if not self._is_response_format_error(params, error):
+            raise error
+        
+        response_format = params["response_format"]
+        message = str(error)
+        fallback = RESPONSE_FORMAT_FALLBACK[response_format["type"]]
+        logger.warning(f"모델이 구조화된 출력({response_format['type']})을 지원하지 않아 {fallback} 방식으로 전환합니다: {message}")
+        self.response_format = fallback
+        
+        params = {key: value for key, value in params.items() if key != "response_format"}
+        if fallback != "off":
+            params["response_format"] = {"type": fallback}
+        return params
+    
+    @staticmethod
+    def _finish_reason(response: Any) -> Optional[str]:
+        """응답의 종료 사유 (응답이 없으면 None)"""
+        choices = getattr(response, "choices", None)
+        return getattr(choices[0], "finish_reason", None) if choices else None
+    
+    def _is_truncated(self, response: Any) -> bool:
+        """응답이 max_tokens에서 잘렸는지 확인합니다."""
+        return self._finish_reason(response) == "length"
+    
+    @staticmethod
+    def _usage_total(response: Any) -> Optional[int]:
+        """응답의 전체 토큰 사용량 (스트리밍 응답 등 사용량이 없으면 None)"""
+        usage = getattr(response, "usage", None)
+        return getattr(usage, "total_tokens", None)
+    
+    def _new_usage(self, operation: str, content_type: Optional[str], level: Optional[str]) -> Dict[str, Any]:
+        """GPT 호출 한 번의 사용량 기록을 시작합니다."""
+        return {"operation": operation, "type": content_type, "level": level, "model": self.model}
+    
+    @staticmethod
+    def _fill_usage(usage: Dict[str, Any], started: float, response_usage: Any,
+                    cache_hit: bool = False, coalesced: bool = False,
+                    finish_reason: Optional[str] = None) -> None:
+        """응답의 토큰 사용량, 종료 사유와 지연 시간(속도 제한 대기, 재시도 포함)을 기록에 채웁니다."""
+        usage["latency_ms"] = round((time.monotonic() - started) * 1000, 1)
+        usage["cache_hit"] = cache_hit
+        usage["coalesced"] = coalesced
+        usage["finish_reason"] = finish_reason
+        details = getattr(response_usage, "prompt_tokens_details", None)
+        usage["prompt_tokens"] = getattr(response_usage, "prompt_tokens", None)
+        usage["completion_tokens"] = getattr(response_usage, "completion_tokens", None)
+        usage["total_tokens"] = getattr(response_usage, "total_tokens", None)
+        usage["cached_tokens"] = getattr(details, "cached_tokens", None)
+    
+    def _usage_record(self, usage: Dict[str, Any], response: Optional[str],
+                      result: Dict[str, Any]) -> Dict[str, Any]:
+        """결과(성공/보정/실패)를 판정하여 완성된 사용량 기록을 만듭니다."""
+        if response is None or result.get("error"):
+            outcome = UsageOutcome.FAILED
+        else:
+            try:
+                json.loads(response)
+                outcome = UsageOutcome.SUCCESS
+            except json.JSONDecodeError:
+                outcome = UsageOutcome.REPAIRED
+        return {**usage, "outcome": outcome}
+    
+    async def _record_usage_async(self, usage: Dict[str, Any], response: Optional[str],
+                                  result: Dict[str, Any]) -> None:
+        """사용량 기록을 로그에 추가합니다. (파일 쓰기는 스레드에서 실행)"""
+        if self.usage_log is not None:
+            await asyncio.to_thread(self.usage_log.record, self._usage_record(usage, response, result))
+    
+    def _is_cacheable(self, result: str) -> bool:
+        """JSON으로 파싱되는 응답만 캐시합니다. (잘못된 응답이 재시도 때 다시 반환되지 않도록)"""
+        try:
+            safely_parse_json(self._extract_json_from_result(result))
+            return True
+        except ValueError:
+            return False
+    
+    def _completion_params(self, system_message: str, user_message: str,
+                           temperature: Optional[float] = None,
+                           content_type: Optional[str] = None,
+                           fields: Optional[Tuple[str, ...]] = None) -> Dict[str, Any]:
+        """chat.completions.create 호출 인자를 구성합니다."""
+        params = {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": user_message}
+            ],
+            "temperature": temperature or AIConfig.TEMPERATURE,
+            "max_tokens": self._max_tokens(content_type, fields)
+        }
+        response_format = self._response_format(content_type, fields)
+        if response_format:
+            params["response_format"] = response_format
+        return params
+    
+    def _max_tokens(self, content_type: Optional[str], fields: Optional[Tuple[str, ...]] = None) -> int:
+        """콘텐츠 유형(과 필드)의 출력 토큰 예산 (예산을 사용하지 않으면 AIConfig.MAX_TOKENS)"""
+        if self.output_budget is None:
+            return AIConfig.MAX_TOKENS
+        return self.output_budget.max_tokens(content_type, fields)
+    
+    def _response_format(self, content_type: Optional[str],
+                         fields: Optional[Tuple[str, ...]] = None) -> Optional[Dict[str, Any]]:
+        """
+        현재 구조화된 출력 방식에 맞는 response_format 인자를 구성합니다.
+        
+        Args:
+            content_type: 콘텐츠 유형 (스키마가 없는 유형이면 JSON 모드 사용)
+            fields: 일부 필드만 응답받는 경우 그 필드 목록 (선택)
+            
+        Returns:
+            response_format 딕셔너리 또는 None (사용하지 않는 경우)
+        """
+        if self.response_format == "json_schema":
+            if not content_type:
+                schema = None
+            elif fields:
+                schema = partial_json_schema(content_type, tuple(fields))
+            else:
+                schema = content_json_schema(content_type)
+            if schema is not None:
+                name = f"{content_type}_fields" if fields else f"{content_type}_content"
+                return {
+                    "type": "json_schema",
+                    "json_schema": {"name": name, "strict": True, "schema": schema}
+                }
+            return {"type": "json_object"}
+        if self.response_format == "json_object":
+            return {"type": "json_object"}
+        return None
+    
+    async def aclose(self) -> None:
+        """공유 AsyncOpenAI 클라이언트의 연결 풀을 닫습니다."""
+        if self.async_client is not None:
+            await self.async_client.close()
     
     def _prepare_content_data(self, content_data: Union[Dict[str, Any], str]) -> Dict[str, Any]:
         """
@@ -193,42 +965,135 @@ class ContentGenerator:
         """
         재생성 프롬프트를 구성합니다.
         
+        유형별 콘텐츠 필드만 보내므로(id, 타임스탬프, 원본 프롬프트, 이전 재생성의
+        original_content 등 제외) 재생성을 반복해도 프롬프트 크기가 늘지 않습니다.
+        프롬프트가 AIConfig.REGENERATE_PROMPT_TOKEN_BUDGET을 넘으면
+        AIConfig.REGENERATE_TRUNCATION에 따라 가장 긴 필드부터 줄이거나 거부합니다.
+        
         Args:
             content_data: 기존 콘텐츠 데이터 
             user_comment: 사용자의 추가 요구사항
             
         Returns:
             구성된 프롬프트
+            
+        Raises:
+            ValueError: 토큰 예산을 넘고 처리 방식이 "reject"인 경우
         """
-        # 원본 콘텐츠를 JSON 문자열로 변환
-        try:
-            original_content_str = json.dumps(content_data, ensure_ascii=False)
-        except TypeError as e:
-            logger.error(f"JSON 직렬화 오류: {str(e)}")
-            # 직렬화할 수 없는 값 필터링
-            filtered_content = {}
-            for k, v in content_data.items():
-                try:
-                    json.dumps({k: v})
-                    filtered_content[k] = v
-                except (TypeError, OverflowError):
-                    filtered_content[k] = str(v)
-            original_content_str = json.dumps(filtered_content, ensure_ascii=False)
-        
-        # 원본 프롬프트 가져오기
-        original_prompt = content_data.get("original_prompt", "")
-        
-        # 원본 프롬프트가 없고 콘텐츠 타입이 있는 경우 템플릿에서 재구성
-        if not original_prompt and "type" in content_data:
-            template = get_template(content_data["type"])
-            if template and "level" in content_data:
-                original_prompt = template.format(level=content_data["level"])
-        
-        # 재생성 프롬프트 구성
-        return build_regenerate_prompt(
-            original_content=original_content_str,
+        content_type = content_data.get("type", "")
+        payload = {
+            key: value for key, value in content_data.items()
+            if self._is_prompt_field(content_type, key)
+        }
+        
+        # 직렬화할 수 없는 값은 문자열로 변환
+        return self._fit_prompt_budget(lambda: build_regenerate_prompt(
+            original_content=json.dumps(payload, ensure_ascii=False, default=str),
             user_comment=user_comment
-        )
+        ), payload)
+    
+    def _build_partial_regenerate_prompt(self, content_data: Dict[str, Any], fields: Tuple[str, ...],
+                                         user_comment: str) -> str:
+        """
+        부분 재생성 프롬프트를 구성합니다.
+        
+        문맥(type, level, topic, place와 대상이 아닌 유형별 필드)과 대상 필드의 현재 값만 보냅니다.
+        토큰 예산을 넘으면 문맥 필드만 줄입니다.
+        
+        Args:
+            content_data: 기존 콘텐츠 데이터
+            fields: 다시 작성할 필드 목록
+            user_comment: 사용자의 추가 요구사항
+            
+        Returns:
+            구성된 프롬프트
+            
+        Raises:
+            ValueError: 토큰 예산을 넘고 처리 방식이 "reject"인 경우
+        """
+        content_type = content_data.get("type", "")
+        context = {
+            key: content_data[key] for key in get_context_fields(content_type, fields)
+            if key in content_data
+        }
+        current = {key: content_data.get(key) for key in fields}
+        
+        return self._fit_prompt_budget(lambda: build_partial_regenerate_prompt(
+            context=json.dumps(context, ensure_ascii=False, default=str),
+            current=json.dumps(current, ensure_ascii=False, default=str),
+            fields=fields,
+            user_comment=user_comment
+        ), context)
+    
+    def _fit_prompt_budget(self, render: Callable[[], str], payload: Dict[str, Any]) -> str:
+        """
+        프롬프트가 AIConfig.REGENERATE_PROMPT_TOKEN_BUDGET 이하가 되도록 payload를 줄입니다.
+        
+        Args:
+            render: payload로 프롬프트를 만드는 함수
+            payload: 줄일 수 있는 콘텐츠 필드 (수정됨)
+            
+        Returns:
+            구성된 프롬프트
+            
+        Raises:
+            ValueError: 토큰 예산을 넘고 처리 방식이 "reject"인 경우
+        """
+        budget = AIConfig.REGENERATE_PROMPT_TOKEN_BUDGET
+        while True:
+            prompt = render()
+            over = count_text_tokens(prompt) - budget
+            if budget <= 0 or over <= 0:
+                return prompt
+            
+            if AIConfig.REGENERATE_TRUNCATION == "reject":
+                raise ValueError(f"재생성 프롬프트가 토큰 예산({budget})을 {over}토큰 초과합니다.")
+            if not self._shorten_largest_field(payload, over):
+                logger.warning(f"재생성 프롬프트를 토큰 예산({budget}) 이하로 줄일 수 없습니다: {over}토큰 초과")
+                return prompt
+    
+    @staticmethod
+    def _is_prompt_field(content_type: str, key: str) -> bool:
+        """재생성 프롬프트에 보낼 콘텐츠 필드인지 확인합니다."""
+        fields = get_content_fields(content_type)
+        if fields is not None:
+            return key in fields
+        return key not in METADATA_FIELDS
+    
+    @staticmethod
+    def _shorten_largest_field(payload: Dict[str, Any], over: int) -> bool:
+        """
+        토큰 수가 가장 큰 필드를 줄입니다.
+        
+        문자열은 초과분만큼 뒤를 잘라 "…"를 붙이고, 목록은 마지막 항목을 제거합니다.
+        
+        Args:
+            payload: 프롬프트에 보낼 콘텐츠 필드 (수정됨)
+            over: 초과한 토큰 수
+            
+        Returns:
+            줄일 수 있는 필드가 있었는지 여부
+        """
+        largest_key, largest_size = None, 0
+        for key, value in payload.items():
+            if key in ("type", "level"):
+                continue
+            if not (isinstance(value, str) and len(value) > 1) and not (isinstance(value, list) and len(value) > 1):
+                continue
+            size = count_text_tokens(json.dumps(value, ensure_ascii=False, default=str))
+            if size > largest_size:
+                largest_key, largest_size = key, size
+        
+        if largest_key is None:
+            return False
+        
+        value = payload[largest_key]
+        if isinstance(value, list):
+            payload[largest_key] = value[:-1]
+        else:
+            keep = min(len(value) - 1, int(len(value) * (largest_size - over - 1) / largest_size))
+            payload[largest_key] = value[:max(keep, 0)] + "…"
+        return True
     
     def _process_generation_result(self, result: str, content_type: str, 
                                   level: str, prompt: str) -> Dict[str, Any]:
@@ -286,12 +1151,8 @@ class ContentGenerator:
             처리된 콘텐츠 데이터
         """
         try:
-            # JSON 추출 시도
-            cleaned_result = self._extract_json_from_result(result)
-            
-            # JSON 파싱 시도
             try:
-                new_content_data = safely_parse_json(cleaned_result)
+                new_content_data = self._parse_result_json(result)
             except ValueError as e:
                 logger.error(f"재생성 결과 파싱 실패: {str(e)}")
                 # 오류 시 원본 콘텐츠에 오류 정보 추가
@@ -303,13 +1164,22 @@ class ContentGenerator:
             # 원본 정보 유지
             self._preserve_original_fields(new_content_data, original_content)
             
+            # 프롬프트에서 제외했던 메타데이터(id, 타임스탬프 등) 복원
+            content_type = original_content.get("type", "")
+            for key, value in original_content.items():
+                if (key not in new_content_data and key not in REGENERATION_FIELDS
+                        and not self._is_prompt_field(content_type, key)):
+                    new_content_data[key] = value
+            
             # 재생성 정보 추가
             new_content_data["regenerated"] = True
             new_content_data["user_comment"] = user_comment
             new_content_data["original_prompt"] = original_content.get("original_prompt", "")
             
-            # 원본 콘텐츠 저장 (재생성 비교용)
-            new_content_data["original_content"] = original_content
+            # 원본 콘텐츠 저장 (재생성 비교용, 이전 재생성의 원본은 제외하여 중첩되지 않도록 함)
+            new_content_data["original_content"] = {
+                key: value for key, value in original_content.items() if key != "original_content"
+            }
             
             # ID 보존 (있는 경우)
             if "id" in original_content:
@@ -326,38 +1196,95 @@ class ContentGenerator:
             original_content["user_comment"] = user_comment
             return original_content
     
-    def _extract_json_from_result(self, result: str) -> str:
+    def _process_partial_regeneration_result(self, result: str, original_content: Dict[str, Any],
+                                             fields: Tuple[str, ...], user_comment: str) -> Dict[str, Any]:
         """
-        결과 텍스트에서 JSON 부분을 추출합니다.
+        부분 재생성 결과의 대상 필드를 원본 콘텐츠에 합칩니다.
         
         Args:
             result: GPT 응답 텍스트
+            original_content: 원본 콘텐츠 데이터
+            fields: 다시 작성한 필드 목록
+            user_comment: 사용자 요청 사항
             
         Returns:
-            추출된 JSON 문자열
+            대상 필드만 바뀐 콘텐츠 데이터
         """
-        # 마크다운 코드 블록 제거
-        code_block_pattern = r'```(?:json)?\s*([\s\S]*?)\s*```'
-        code_block_match = re.search(code_block_pattern, result)
+        try:
+            new_fields = self._parse_result_json(result)
+            missing = [field for field in fields if field not in new_fields]
+            if missing:
+                raise ValueError(f"응답에 다시 작성한 필드가 없습니다: {', '.join(missing)}")
+        except ValueError as e:
+            logger.error(f"부분 재생성 결과 파싱 실패: {str(e)}")
+            # 오류 시 원본 콘텐츠에 오류 정보 추가
+            original_content["error"] = f"재생성 결과 파싱 실패: {str(e)}"
+            original_content["raw_regenerated"] = result
+            original_content["user_comment"] = user_comment
+            return original_content
         
-        if code_block_match:
-            # 마크다운 코드 블록에서 JSON 추출
-            cleaned_result = code_block_match.group(1).strip()
-            logger.info("마크다운 코드 블록에서 JSON 추출 성공")
-            return cleaned_result
+        # 원본에서 이전 재생성 기록을 빼고 대상 필드만 교체
+        new_content_data = {
+            key: value for key, value in original_content.items() if key not in REGENERATION_FIELDS
+        }
+        new_content_data.update({field: new_fields[field] for field in fields})
         
-        # JSON 객체 패턴 추출 시도
-        json_pattern = r'(\{[\s\S]*\})'
-        json_match = re.search(json_pattern, result)
+        # 재생성 정보 추가
+        new_content_data["regenerated"] = True
+        new_content_data["regenerated_fields"] = list(fields)
+        new_content_data["user_comment"] = user_comment
+        new_content_data["original_prompt"] = original_content.get("original_prompt", "")
         
-        if json_match:
-            cleaned_result = json_match.group(1).strip()
-            logger.info("JSON 객체 패턴으로 추출 성공")
-            return cleaned_result
+        # 원본 콘텐츠 저장 (재생성 비교용, 이전 재생성의 원본은 제외하여 중첩되지 않도록 함)
+        new_content_data["original_content"] = {
+            key: value for key, value in original_content.items() if key != "original_content"
+        }
         
-        # 추출 실패 시 원본 반환
-        logger.info("JSON 패턴 추출 실패, 원본 응답 사용")
-        return result
+        logger.info(f"콘텐츠 부분 재생성 성공: {new_content_data.get('type')} / {', '.join(fields)}")
+        return new_content_data
+    
+    def _parse_result_json(self, result: str) -> Dict[str, Any]:
+        """
+        GPT 응답 텍스트를 JSON 객체로 파싱합니다.
+        
+        구조화된 출력은 그대로 파싱되므로 추출/보정은 실패한 경우에만 수행합니다.
+        
+        Args:
+            result: GPT 응답 텍스트
+            
+        Returns:
+            파싱된 딕셔너리
+            
+        Raises:
+            ValueError: JSON 객체로 파싱할 수 없는 경우
+        """
+        try:
+            parsed = json.loads(result)
+        except json.JSONDecodeError:
+            parsed = None
+        if not isinstance(parsed, dict):
+            # JSON 추출 후 파싱 시도
+            parsed = safely_parse_json(self._extract_json_from_result(result))
+        if not isinstance(parsed, dict):
+            raise ValueError("응답이 JSON 객체가 아닙니다.")
+        return parsed
+    
+    def _extract_json_from_result(self, result: str) -> str:
+        """
+        결과 텍스트에서 JSON 부분을 추출합니다.
+        
+        Args:
+            result: GPT 응답 텍스트
+            
+        Returns:
+            추출된 JSON 문자열 (추출 실패 시 원본)
+        """
+        # 코드 블록 표시, 앞뒤 설명, 주석, 끝의 콤마 등을 한 번의 스캔으로 정리
+        cleaned_result = scan_json_object(result)
+        if cleaned_result is None:
+            logger.info("JSON 패턴 추출 실패, 원본 응답 사용")
+            return result
+        return cleaned_result
     
     def _preserve_original_fields(self, new_content: Dict[str, Any], 
                                  original_content: Dict[str, Any]) -> None:
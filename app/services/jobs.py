@@ -0,0 +1,398 @@
+"""
+백그라운드 생성 작업 서비스
+
+일괄 생성 요청을 작업(job)으로 등록하고 asyncio 워커 풀에서 실행합니다.
+작업 상태와 결과는 data/jobs/ 아래에 작업별 JSON 파일(상태)과 JSONL 파일(결과)로
+기록되므로, 요청을 보낸 브라우저가 연결을 끊거나 서버가 재시작되어도 이어서 진행됩니다.
+끝난 작업은 보관 기간(JOB_RETENTION_HOURS)과 최대 보관 수(JOB_MAX_FINISHED)에 따라 정리합니다.
+"""
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.config import AppConfig, Directories
+from app.services.batch import generate_batch
+from app.utils.logger import get_logger
+
+# 모듈 로거 설정
+logger = get_logger("jobs")
+
+
+class JobStatus:
+    """작업 상태"""
+    QUEUED = "queued"        # 대기 중
+    RUNNING = "running"      # 실행 중
+    COMPLETED = "completed"  # 완료 (일부 항목 실패 포함)
+    FAILED = "failed"        # 작업 자체 실패
+
+    UNFINISHED = (QUEUED, RUNNING)
+    FINISHED = (COMPLETED, FAILED)
+
+
+class JobStore:
+    """
+    작업별 파일 저장소
+
+    작업 상태(결과 목록 제외)는 ``{id}.json``에 통째로 다시 쓰고, 항목 결과는
+    ``{id}.results.jsonl``에 한 줄씩 추가합니다. 진행 상황을 기록할 때마다 전체
+    결과 목록을 다시 직렬화하지 않으므로 기록 비용은 새 결과 수에 비례합니다.
+    """
+
+    def __init__(self, directory: Optional[Path] = None):
+        """
+        JobStore 초기화
+
+        Args:
+            directory: 작업 파일 디렉토리 (기본값: Directories.JOBS)
+        """
+        self.directory = Path(directory or Directories.JOBS)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, job_id: str) -> Path:
+        return self.directory / f"{job_id}.json"
+
+    def _results_path(self, job_id: str) -> Path:
+        return self.directory / f"{job_id}.results.jsonl"
+
+    def write(self, job: Dict[str, Any], new_results: List[Dict[str, Any]]) -> None:
+        """
+        새 결과를 결과 파일에 추가한 뒤, 작업 상태를 임시 파일에 쓰고 교체합니다.
+
+        Args:
+            job: 작업 데이터 (id 필수, results는 기록하지 않음)
+            new_results: 마지막 기록 이후 추가된 결과 목록
+        """
+        if new_results:
+            lines = "".join(json.dumps(result, ensure_ascii=False) + "\n" for result in new_results)
+            with open(self._results_path(job["id"]), 'a', encoding='utf-8') as f:
+                f.write(lines)
+
+        payload = json.dumps({key: value for key, value in job.items() if key != "results"},
+                             ensure_ascii=False)
+        path = self._path(job["id"])
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+
+    def delete(self, job_id: str) -> None:
+        """
+        작업 상태 파일과 결과 파일을 삭제합니다. (없으면 무시)
+
+        Args:
+            job_id: 작업 ID
+        """
+        for path in (self._path(job_id), self._results_path(job_id)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _read_results(self, job: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        작업의 결과 목록을 읽습니다.
+
+        결과 파일이 없으면 이전 형식(작업 파일 안의 results)을 결과 파일로 옮깁니다.
+        같은 항목의 결과가 여러 번 기록되었으면(기록 재시도) 마지막 결과를 사용하며,
+        중간에 끊긴 줄은 건너뜁니다.
+        """
+        path = self._results_path(job["id"])
+        if not path.exists():
+            results = sorted(job.get("results") or [], key=lambda result: result.get("index", 0))
+            if results:
+                self.write(job, results)
+            return results
+
+        by_index: Dict[int, Dict[str, Any]] = {}
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    result = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(result, dict) and isinstance(result.get("index"), int):
+                    by_index[result["index"]] = result
+        return [by_index[index] for index in sorted(by_index)]
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        """
+        저장된 모든 작업을 읽습니다. 손상된 파일은 건너뜁니다.
+
+        Returns:
+            작업 목록
+        """
+        jobs = []
+        for path in sorted(self.directory.glob("*.json")):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    job = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                logger.warning(f"작업 파일을 읽을 수 없어 건너뜁니다: {path} ({str(e)})")
+                continue
+            if not isinstance(job, dict) or not job.get("id"):
+                continue
+            try:
+                job["results"] = self._read_results(job)
+            except OSError as e:
+                logger.warning(f"작업 결과 파일을 읽을 수 없어 건너뜁니다: {job['id']} ({str(e)})")
+                continue
+            jobs.append(job)
+        return jobs
+
+
+class JobManager:
+    """
+    백그라운드 생성 작업 관리자
+
+    작업은 JOB_WORKERS개의 워커가 동시에 처리하며, 각 작업 안에서는
+    일괄 생성과 같은 방식으로 항목을 동시에 생성합니다.
+    """
+
+    def __init__(self, generator: Any, storage: Any, store: Optional[JobStore] = None,
+                 workers: Optional[int] = None):
+        """
+        JobManager 초기화
+
+        Args:
+            generator: ContentGenerator 인스턴스 (generate_async 사용)
+            storage: 결과를 저장할 AsyncContentStorage 인스턴스
+            store: 작업 저장소 (기본값: JobStore())
+            workers: 동시에 실행할 작업 수 (기본값: AppConfig.JOB_WORKERS)
+        """
+        self.generator = generator
+        self.storage = storage
+        self.store = store or JobStore()
+        self.workers = max(1, workers or AppConfig.JOB_WORKERS)
+
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+        # 작업별 기록 잠금과 결과 파일에 기록된 결과 수
+        self._write_locks: Dict[str, asyncio.Lock] = {}
+        self._logged: Dict[str, int] = {}
+
+    async def start(self) -> None:
+        """저장된 작업을 불러오고, 끝나지 않은 작업을 다시 대기열에 넣은 뒤 워커를 시작합니다."""
+        self._queue = asyncio.Queue()
+
+        jobs = await asyncio.to_thread(self.store.load_all)
+        jobs.sort(key=lambda job: job.get("created_at", ""))
+        resumed = 0
+        for job in jobs:
+            self._jobs[job["id"]] = job
+            self._logged[job["id"]] = len(job["results"])
+            if job.get("status") in JobStatus.UNFINISHED:
+                job["status"] = JobStatus.QUEUED
+                self._queue.put_nowait(job["id"])
+                resumed += 1
+
+        await self._prune()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        logger.info(f"작업 관리자 시작: 작업 {len(jobs)}개 로드, {resumed}개 재개")
+
+    async def stop(self) -> None:
+        """워커를 중지합니다. 실행 중이던 작업은 다음 시작 때 이어서 진행됩니다."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        # 취소 직전까지의 진행 상황 기록
+        for job in self._jobs.values():
+            if job.get("status") == JobStatus.RUNNING:
+                await self._persist(job)
+        logger.info("작업 관리자 중지")
+
+    async def submit(self, items: List[Dict[str, Any]], auto_save: bool = False,
+                     concurrency: Optional[int] = None) -> Dict[str, Any]:
+        """
+        일괄 생성 작업을 등록합니다.
+
+        Args:
+            items: {qtype, level, count} 목록
+            auto_save: 유효한 결과를 저장소에 저장할지 여부
+            concurrency: 작업 안에서의 동시 생성 수 (기본값: AppConfig.BATCH_CONCURRENCY)
+
+        Returns:
+            등록된 작업 요약
+        """
+        now = datetime.now().isoformat()
+        job = {
+            "id": str(uuid.uuid4()),
+            "status": JobStatus.QUEUED,
+            "created_at": now,
+            "updated_at": now,
+            "started_at": None,
+            "finished_at": None,
+            "params": {
+                "items": items,
+                "auto_save": auto_save,
+                "concurrency": concurrency or AppConfig.BATCH_CONCURRENCY,
+            },
+            "total": sum(item["count"] for item in items),
+            "succeeded": 0,
+            "failed": 0,
+            "saved": 0,
+            "results": [],
+            "error": None,
+        }
+        self._jobs[job["id"]] = job
+        await self._persist(job)
+        self._queue.put_nowait(job["id"])
+
+        logger.info(f"작업 등록: {job['id']} ({job['total']}개)")
+        return self.summarize(job)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        ID로 작업을 조회합니다.
+
+        Args:
+            job_id: 작업 ID
+
+        Returns:
+            작업 데이터 (결과 포함) 또는 None (없을 경우)
+        """
+        return self._jobs.get(job_id)
+
+    def list(self, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        최근 작업부터 요약 목록을 반환합니다.
+
+        Args:
+            status: 상태 필터 (기본값: None, 전체)
+            limit: 최대 개수 (기본값: 50)
+
+        Returns:
+            작업 요약 목록 (결과 제외)
+        """
+        jobs = [job for job in self._jobs.values() if not status or job.get("status") == status]
+        jobs.sort(key=lambda job: job.get("created_at", ""), reverse=True)
+        return [self.summarize(job) for job in jobs[:limit]]
+
+    @staticmethod
+    def summarize(job: Dict[str, Any]) -> Dict[str, Any]:
+        """결과 목록을 제외한 작업 요약을 만듭니다."""
+        summary = {key: value for key, value in job.items() if key != "results"}
+        summary["processed"] = len(job.get("results", []))
+        return summary
+
+    async def _persist(self, job: Dict[str, Any]) -> None:
+        """
+        작업 상태와 마지막 기록 이후의 새 결과를 기록합니다.
+
+        직렬화와 파일 쓰기는 모두 스레드에서 실행하며, 같은 작업의 기록은 차례로 실행합니다.
+        """
+        job_id = job["id"]
+        job["updated_at"] = datetime.now().isoformat()
+        async with self._write_locks.setdefault(job_id, asyncio.Lock()):
+            logged = self._logged.get(job_id, 0)
+            new_results = job["results"][logged:]
+            # 스레드에서 직렬화하는 동안 바뀌지 않도록 상태는 얕은 복사본을 넘김
+            state = {key: value for key, value in job.items() if key != "results"}
+            try:
+                await asyncio.to_thread(self.store.write, state, new_results)
+            except Exception as e:
+                logger.error(f"작업 상태 기록 중 오류 ({job_id}): {str(e)}")
+                return
+            self._logged[job_id] = logged + len(new_results)
+
+    async def _prune(self) -> None:
+        """
+        보관 기간이 지났거나 최대 보관 수를 넘는 끝난 작업(완료/실패)을
+        메모리와 작업 디렉토리에서 삭제합니다. (오래된 작업부터)
+        """
+        finished = [job for job in self._jobs.values() if job.get("status") in JobStatus.FINISHED]
+        finished.sort(key=lambda job: job.get("finished_at") or job.get("created_at", ""), reverse=True)
+
+        expired = []
+        if AppConfig.JOB_MAX_FINISHED > 0:
+            expired.extend(finished[AppConfig.JOB_MAX_FINISHED:])
+            finished = finished[:AppConfig.JOB_MAX_FINISHED]
+        if AppConfig.JOB_RETENTION_HOURS > 0:
+            cutoff = (datetime.now() - timedelta(hours=AppConfig.JOB_RETENTION_HOURS)).isoformat()
+            expired.extend(job for job in finished
+                           if (job.get("finished_at") or job.get("created_at", "")) < cutoff)
+
+        for job in expired:
+            job_id = job["id"]
+            self._jobs.pop(job_id, None)
+            self._write_locks.pop(job_id, None)
+            self._logged.pop(job_id, None)
+            try:
+                await asyncio.to_thread(self.store.delete, job_id)
+            except OSError as e:
+                logger.error(f"작업 파일 삭제 중 오류 ({job_id}): {str(e)}")
+        if expired:
+            logger.info(f"끝난 작업 {len(expired)}개 정리")
+
+    async def _worker(self) -> None:
+        """대기열에서 작업을 꺼내 실행합니다."""
+        while True:
+            job_id = await self._queue.get()
+            job = self._jobs.get(job_id)
+            if job is None or job.get("status") not in JobStatus.UNFINISHED:
+                continue
+            try:
+                await self._run_job(job)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"작업 실행 중 오류 ({job_id}): {str(e)}")
+                job["status"] = JobStatus.FAILED
+                job["error"] = str(e)
+                job["finished_at"] = datetime.now().isoformat()
+                await self._persist(job)
+            await self._prune()
+
+    async def _run_job(self, job: Dict[str, Any]) -> None:
+        """작업에서 아직 끝나지 않은 항목만 생성합니다."""
+        params = job["params"]
+        tasks = [(item["qtype"], item["level"]) for item in params["items"] for _ in range(item["count"])]
+        done = {result["index"] for result in job["results"]}
+        pending = [index for index in range(len(tasks)) if index not in done]
+
+        job["status"] = JobStatus.RUNNING
+        job["started_at"] = job.get("started_at") or datetime.now().isoformat()
+        await self._persist(job)
+        if done:
+            logger.info(f"작업 재개: {job['id']} ({len(done)}/{len(tasks)}개 완료)")
+
+        storage = self.storage if params.get("auto_save") else None
+        last_persist = time.monotonic()
+        async for result in generate_batch(self.generator, [tasks[index] for index in pending],
+                                           params.get("concurrency") or AppConfig.BATCH_CONCURRENCY,
+                                           storage):
+            if result.get("done"):
+                continue
+
+            result["index"] = pending[result["index"]]
+            if "saved_id" in result:
+                # 저장된 항목은 저장소에서 조회할 수 있으므로 본문은 기록하지 않음
+                result.pop("content", None)
+                job["saved"] += 1
+            if result["status"] == "ok":
+                job["succeeded"] += 1
+            else:
+                job["failed"] += 1
+            job["results"].append(result)
+
+            # 진행 상황은 일정 간격으로 기록 (재시작 시 마지막 기록 이후 항목은 다시 생성)
+            # 저장된 항목은 재시작 후 중복 저장되지 않도록 바로 기록
+            if "saved_id" in result or time.monotonic() - last_persist >= AppConfig.JOB_PERSIST_INTERVAL:
+                await self._persist(job)
+                last_persist = time.monotonic()
+
+        job["status"] = JobStatus.COMPLETED
+        job["finished_at"] = datetime.now().isoformat()
+        await self._persist(job)
+        # 결과 파일에는 끝난 순서로 기록되며, 읽을 때 항목 순서로 정렬
+        job["results"].sort(key=lambda result: result["index"])
+        logger.info(f"작업 완료: {job['id']} (성공 {job['succeeded']}개, 실패 {job['failed']}개)")
@@ -0,0 +1,225 @@
+"""
+저장소 저널 서비스
+
+콘텐츠 저장소의 변경 사항을 추가 전용(JSONL) 저널에 기록합니다.
+항목 하나를 저장할 때 전체 파일을 다시 쓰는 대신 한 줄만 추가하고,
+저널이 커지면 스냅샷 파일로 압축(compaction)합니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from app.utils.logger import get_logger
+
+# 모듈 로거 설정
+logger = get_logger("journal")
+
+
+class JournalOp:
+    """저널 레코드 연산 유형"""
+    PUT = "put"                  # 항목 추가/수정 (전체 항목 저장)
+    DELETE = "delete"            # 항목 영구 삭제
+    TRASH = "trash"              # 항목을 휴지통으로 이동
+    RESTORE = "restore"          # 휴지통에서 항목 복원
+    PURGE = "purge"              # 휴지통에서 항목 영구 삭제
+    EMPTY_TRASH = "empty_trash"  # 휴지통 비우기
+
+
+class StorageJournal:
+    """
+    추가 전용 JSONL 저널
+
+    각 레코드는 ``{"op": ..., "ts": ..., ...}`` 형식의 한 줄 JSON입니다.
+    압축 중에는 현재 저널을 ``.compacting`` 파일로 교체(rotate)하여
+    압축과 동시에 들어오는 기록이 유실되지 않도록 합니다.
+    """
+
+    def __init__(self, path: Path, fsync: bool = False):
+        """
+        StorageJournal 초기화
+
+        Args:
+            path: 저널 파일 경로
+            fsync: 레코드마다 fsync 호출 여부
+        """
+        self.path = Path(path)
+        self.rotated_path = Path(f"{self.path}.compacting")
+        self.fsync = fsync
+
+        # 저널 추가와 교체를 직렬화하는 잠금
+        self.lock = threading.RLock()
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.record_count = 0
+        self.size_bytes = 0
+        self.refresh_stats()
+
+    def refresh_stats(self) -> None:
+        """저널 파일의 레코드 수와 크기를 다시 계산합니다."""
+        with self.lock:
+            self.record_count = self._count_records(self.path)
+            self.size_bytes = self._file_size(self.path)
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        """파일 크기를 반환합니다. 파일이 없으면 0"""
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _count_records(path: Path) -> int:
+        """저널 파일의 레코드(줄) 수를 셉니다."""
+        if not os.path.exists(path):
+            return 0
+        with open(path, 'rb') as f:
+            return sum(1 for line in f if line.strip())
+
+    def append(self, op: str, **payload: Any) -> bool:
+        """
+        레코드 한 줄을 저널에 추가합니다.
+
+        Args:
+            op: 연산 유형 (JournalOp)
+            **payload: 레코드에 포함할 데이터 (item, item_id 등)
+
+        Returns:
+            기록 성공 여부
+        """
+        record = {"op": op, "ts": datetime.now().isoformat(), **payload}
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n"
+        encoded = line.encode('utf-8')
+
+        with self.lock:
+            try:
+                with open(self.path, 'ab') as f:
+                    f.write(encoded)
+                    f.flush()
+                    if self.fsync:
+                        os.fsync(f.fileno())
+                self.record_count += 1
+                self.size_bytes += len(encoded)
+                return True
+            except Exception as e:
+                logger.error(f"저널 기록 중 오류 ({op}): {str(e)}")
+                return False
+
+    def _read_records(self, path: Path) -> Iterator[Dict[str, Any]]:
+        """저널 파일의 레코드를 순서대로 읽습니다. 손상된 줄은 건너뜁니다."""
+        if not os.path.exists(path):
+            return
+
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 비정상 종료로 마지막 줄이 잘린 경우 등
+                    logger.warning(f"손상된 저널 레코드를 건너뜁니다: {path}:{line_no}")
+                    continue
+                if isinstance(record, dict) and "op" in record:
+                    yield record
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """
+        재생할 레코드를 기록 순서대로 반환합니다.
+
+        압축 도중 종료되어 남은 ``.compacting`` 파일이 있으면 먼저 재생합니다.
+        레코드는 멱등적이므로 이미 스냅샷에 반영된 레코드를 다시 적용해도 안전합니다.
+
+        Returns:
+            저널 레코드 이터레이터
+        """
+        yield from self._read_records(self.rotated_path)
+        yield from self._read_records(self.path)
+
+    def needs_compaction(self, max_records: int, max_bytes: int) -> bool:
+        """
+        저널이 압축 임계값을 넘었는지 확인합니다.
+
+        Args:
+            max_records: 최대 레코드 수
+            max_bytes: 최대 파일 크기 (바이트)
+
+        Returns:
+            압축 필요 여부
+        """
+        return self.record_count >= max_records or self.size_bytes >= max_bytes
+
+    def rotate(self) -> bool:
+        """
+        현재 저널을 ``.compacting`` 파일로 교체하고 빈 저널을 시작합니다.
+
+        호출자는 ``lock``을 잡은 상태에서 스냅샷 복사와 함께 호출해야 합니다.
+
+        Returns:
+            교체된 저널이 있는지 여부
+        """
+        with self.lock:
+            if not os.path.exists(self.path):
+                return False
+
+            if os.path.exists(self.rotated_path):
+                # 이전 압축이 끝나지 못한 경우 기존 레코드를 이어 붙임
+                with open(self.rotated_path, 'ab') as dst, open(self.path, 'rb') as src:
+                    dst.write(src.read())
+                os.remove(self.path)
+            else:
+                os.replace(self.path, self.rotated_path)
+
+            self.record_count = 0
+            self.size_bytes = 0
+            return True
+
+    def discard_rotated(self) -> None:
+        """스냅샷에 반영된 ``.compacting`` 파일을 삭제합니다."""
+        try:
+            if os.path.exists(self.rotated_path):
+                os.remove(self.rotated_path)
+        except OSError as e:
+            logger.error(f"압축된 저널 삭제 중 오류: {str(e)}")
+
+
+def write_json_atomic(path: Path, data: Any, indent: Optional[int] = 2,
+                      fsync: bool = True) -> Tuple[int, int, str]:
+    """
+    JSON 데이터를 임시 파일에 쓴 뒤 rename으로 교체합니다.
+
+    쓰는 도중 종료되더라도 기존 파일이 반쯤 쓰인 상태로 남지 않습니다.
+
+    Args:
+        path: 대상 파일 경로
+        data: 저장할 데이터
+        indent: JSON 들여쓰기 (기본값: 2)
+        fsync: rename 전에 fsync 호출 여부
+
+    Returns:
+        기록한 파일의 (mtime_ns, 크기, 내용 SHA-256 해시)
+        (rename 이후 다른 프로세스가 파일을 바꿔도 우리 쓰기의 시그니처가 유지됨)
+    """
+    path = Path(path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    payload = json.dumps(data, ensure_ascii=False, indent=indent).encode('utf-8')
+
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+            stat = os.fstat(f.fileno())
+        os.replace(tmp_path, path)
+        return stat.st_mtime_ns, stat.st_size, hashlib.sha256(payload).hexdigest()
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -0,0 +1,226 @@
+"""
+출력 토큰 예산 서비스
+
+콘텐츠 유형별 max_tokens를 정합니다. 처음에는 템플릿의 길이 목표(글자 수)로
+예산을 잡고, 관측한 출력 토큰 수가 충분히 쌓이면 그 백분위수에 여유분을 곱한
+값을 사용합니다. 잘린 응답(finish_reason "length")은 예산을 늘리는 방향으로 반영합니다.
+"""
+
+import math
+import threading
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, Optional, Sequence
+
+from app.config import AIConfig
+from app.services.usage import UsageLog, percentile
+from app.templates import TemplateType, get_length_target
+from app.utils.logger import get_logger
+
+# 모듈 로거 설정
+logger = get_logger("output_budget")
+
+# 본문 외 필드(topic, place, keywords, situation 등)와 JSON 구문에 드는 토큰 수
+FIELD_OVERHEAD_TOKENS = 150
+
+# 한국어 본문 글자당 토큰 수 (토크나이저에 따라 1.0~1.5 사이이므로 큰 값 사용)
+TOKENS_PER_CHAR = 1.5
+
+# 잘린 응답 뒤 다시 호출할 때 예산을 늘리는 배수
+TRUNCATION_GROWTH = 2.0
+
+# 예산 관측에 사용하는 작업 (콘텐츠 전체를 출력하는 호출)
+OBSERVED_OPERATIONS = ("generate", "generate_stream", "regenerate")
+
+# 일부 필드만 출력하는 작업 (필드 조합별로 따로 관측)
+FIELD_OPERATIONS = ("regenerate_fields",)
+
+
+def budget_key(content_type: str, fields: Optional[Sequence[str]] = None) -> str:
+    """
+    예산을 관측하는 키를 만듭니다.
+
+    Args:
+        content_type: 콘텐츠 유형
+        fields: 일부 필드만 출력하는 경우 그 필드 목록 (선택)
+
+    Returns:
+        콘텐츠 전체는 유형, 일부 필드는 "유형/필드1,필드2" 형식의 키
+    """
+    if not fields:
+        return content_type
+    return f"{content_type}/{','.join(sorted(fields))}"
+
+
+def next_max_tokens(max_tokens: int, ceiling: Optional[int] = None) -> Optional[int]:
+    """
+    잘린 응답 뒤 다시 호출할 때 사용할 max_tokens를 계산합니다.
+
+    Args:
+        max_tokens: 잘린 호출의 max_tokens
+        ceiling: 상한 (기본값: AIConfig.MAX_TOKENS)
+
+    Returns:
+        늘린 max_tokens 또는 None (이미 상한인 경우)
+    """
+    ceiling = ceiling or AIConfig.MAX_TOKENS
+    if max_tokens >= ceiling:
+        return None
+    return min(ceiling, math.ceil(max_tokens * TRUNCATION_GROWTH))
+
+
+class OutputBudget:
+    """
+    콘텐츠 유형별 출력 토큰 예산
+
+    유형마다(부분 재생성은 유형과 필드 조합마다) 최근 출력 토큰 수를 window개까지
+    보관합니다. 동기 호출(스레드)과 비동기 호출에서 함께 사용할 수 있도록
+    내부 상태는 잠금으로 보호합니다.
+    """
+
+    def __init__(self, usage_log: Optional[UsageLog] = None, ceiling: Optional[int] = None,
+                 floor: Optional[int] = None, pct: Optional[float] = None,
+                 headroom: Optional[float] = None, min_samples: Optional[int] = None,
+                 window: Optional[int] = None):
+        """
+        OutputBudget 초기화
+
+        Args:
+            usage_log: 관측값을 미리 읽어 올 사용량 로그 (기본값: None, 템플릿 길이 목표로 시작)
+            ceiling: 예산 상한 (기본값: AIConfig.MAX_TOKENS)
+            floor: 예산 하한 (기본값: AIConfig.OUTPUT_BUDGET_MIN)
+            pct: 예산 기준 백분위 (기본값: AIConfig.OUTPUT_BUDGET_PERCENTILE)
+            headroom: 백분위수에 곱할 여유분 (기본값: AIConfig.OUTPUT_BUDGET_HEADROOM)
+            min_samples: 관측값으로 예산을 정하는 최소 표본 수 (기본값: AIConfig.OUTPUT_BUDGET_MIN_SAMPLES)
+            window: 유형별로 보관할 최근 관측값 수 (기본값: AIConfig.OUTPUT_BUDGET_WINDOW)
+        """
+        self.ceiling = ceiling or AIConfig.MAX_TOKENS
+        self.floor = min(floor or AIConfig.OUTPUT_BUDGET_MIN, self.ceiling)
+        self.pct = pct or AIConfig.OUTPUT_BUDGET_PERCENTILE
+        self.headroom = headroom or AIConfig.OUTPUT_BUDGET_HEADROOM
+        self.min_samples = min_samples or AIConfig.OUTPUT_BUDGET_MIN_SAMPLES
+        self.window = window or AIConfig.OUTPUT_BUDGET_WINDOW
+
+        self._samples: Dict[str, Deque[int]] = defaultdict(lambda: deque(maxlen=self.window))
+        self._truncated: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+        if usage_log is not None:
+            self._load(usage_log)
+
+    def max_tokens(self, content_type: Optional[str], fields: Optional[Sequence[str]] = None) -> int:
+        """
+        콘텐츠 유형의 현재 출력 토큰 예산을 반환합니다.
+
+        Args:
+            content_type: 콘텐츠 유형 (알 수 없는 유형이면 상한 사용)
+            fields: 일부 필드만 출력하는 경우 그 필드 목록 (선택)
+
+        Returns:
+            max_tokens 값
+        """
+        if get_length_target(content_type or "") is None:
+            return self.ceiling
+        with self._lock:
+            samples = sorted(self._samples.get(budget_key(content_type, fields), ()))
+        if len(samples) < self.min_samples:
+            return self.prior(content_type, fields)
+        return self._clamp(percentile(samples, self.pct) * self.headroom)
+
+    def prior(self, content_type: str, fields: Optional[Sequence[str]] = None) -> int:
+        """
+        템플릿 길이 목표로 계산한 초기 예산을 반환합니다.
+
+        일부 필드만 출력하는 경우 본문 필드가 포함되어 있으면 전체 예산을,
+        아니면 하한을 사용합니다.
+
+        Args:
+            content_type: 콘텐츠 유형
+            fields: 일부 필드만 출력하는 경우 그 필드 목록 (선택)
+
+        Returns:
+            max_tokens 값 (알 수 없는 유형이면 상한)
+        """
+        target = get_length_target(content_type)
+        if target is None:
+            return self.ceiling
+        body_field, _, max_chars = target
+        if fields and body_field not in fields:
+            return self.floor
+        return self._clamp((FIELD_OVERHEAD_TOKENS + max_chars * TOKENS_PER_CHAR) * self.headroom)
+
+    def observe(self, content_type: Optional[str], completion_tokens: Optional[int],
+                truncated: bool = False, fields: Optional[Sequence[str]] = None) -> None:
+        """
+        응답 한 건의 출력 토큰 수를 반영합니다.
+
+        잘린 응답은 실제 필요량을 알 수 없으므로 늘린 예산만큼을 관측값으로 기록합니다.
+
+        Args:
+            content_type: 콘텐츠 유형 (알 수 없는 유형이면 무시)
+            completion_tokens: 응답의 출력 토큰 수 (None이면 무시)
+            truncated: 응답이 max_tokens에서 잘렸는지 여부
+            fields: 일부 필드만 출력한 경우 그 필드 목록 (선택)
+        """
+        if not completion_tokens or get_length_target(content_type or "") is None:
+            return
+        if truncated:
+            completion_tokens = math.ceil(completion_tokens * TRUNCATION_GROWTH)
+        key = budget_key(content_type, fields)
+        with self._lock:
+            self._samples[key].append(completion_tokens)
+            if truncated:
+                self._truncated[key] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        유형별(부분 재생성은 필드 조합별) 현재 예산, 예산 출처, 관측 수,
+        출력 토큰 백분위수, 잘린 응답 수를 반환합니다.
+
+        Returns:
+            {"ceiling", "floor", "types": {유형: {...}}, "fields": {"유형/필드": {...}}} 형식의 딕셔너리
+        """
+        with self._lock:
+            field_keys = sorted(key for key in self._samples if "/" in key)
+        types = {t.value: self._key_stats(t.value, None) for t in TemplateType}
+        fields = {}
+        for key in field_keys:
+            content_type, names = key.split("/", 1)
+            fields[key] = self._key_stats(content_type, names.split(","))
+        return {"ceiling": self.ceiling, "floor": self.floor, "types": types, "fields": fields}
+
+    def _key_stats(self, content_type: str, fields: Optional[Sequence[str]]) -> Dict[str, Any]:
+        """키 하나의 예산 통계를 계산합니다."""
+        key = budget_key(content_type, fields)
+        with self._lock:
+            samples = sorted(self._samples.get(key, ()))
+            truncated = self._truncated.get(key, 0)
+        return {
+            "max_tokens": self.max_tokens(content_type, fields),
+            "source": "observed" if len(samples) >= self.min_samples else "template",
+            "prior": self.prior(content_type, fields),
+            "samples": len(samples),
+            "p50": percentile(samples, 50),
+            "p99": percentile(samples, 99),
+            "truncated": truncated,
+        }
+
+    def _clamp(self, tokens: float) -> int:
+        """예산을 하한과 상한 사이로 맞춥니다."""
+        return max(self.floor, min(self.ceiling, math.ceil(tokens)))
+
+    def _load(self, usage_log: UsageLog) -> None:
+        """사용량 로그에서 유형별 최근 출력 토큰 수를 읽어 옵니다."""
+        try:
+            entries = usage_log.read()
+        except OSError as e:
+            logger.error(f"사용량 기록을 읽는 중 오류: {str(e)}")
+            return
+
+        for entry in entries:
+            operation = entry.get("operation")
+            if operation in OBSERVED_OPERATIONS:
+                self.observe(entry.get("type"), entry.get("completion_tokens"),
+                             entry.get("finish_reason") == "length")
+            elif operation in FIELD_OPERATIONS and entry.get("fields"):
+                self.observe(entry.get("type"), entry.get("completion_tokens"),
+                             entry.get("finish_reason") == "length", entry["fields"])
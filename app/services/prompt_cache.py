@@ -0,0 +1,238 @@
+"""
+프롬프트 응답 캐시 서비스
+
+같은 프롬프트로 GPT를 다시 호출하지 않도록 응답을 캐시합니다.
+메모리 LRU 계층과 디스크 계층(TTL, 용량 기반 제거)으로 구성되며,
+프로세스가 재시작되어도 디스크 계층의 응답은 재사용됩니다.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import AppConfig, Directories
+from app.services.journal import write_json_atomic
+from app.utils.logger import get_logger
+
+# 모듈 로거 설정
+logger = get_logger("prompt_cache")
+
+
+def make_cache_key(params: Dict[str, Any]) -> str:
+    """
+    GPT 호출 인자(모델, 메시지, 온도)로 캐시 키를 만듭니다.
+
+    최대 토큰 수는 유형별 예산에 따라 바뀌고 잘린 응답은 캐시하지 않으므로 키에 넣지 않습니다.
+
+    Args:
+        params: chat.completions.create 호출 인자
+
+    Returns:
+        SHA-256 해시 문자열
+    """
+    material = {
+        "model": params.get("model"),
+        "messages": params.get("messages"),
+        "temperature": params.get("temperature"),
+    }
+    encoded = json.dumps(material, ensure_ascii=False, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class PromptCache:
+    """
+    2계층 프롬프트 응답 캐시
+
+    조회는 메모리 → 디스크 순서로 하며, 디스크에서 찾은 응답은 메모리로
+    올립니다. 동기 호출(스레드)과 비동기 호출에서 함께 사용할 수 있도록
+    내부 상태는 잠금으로 보호합니다.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, memory_items: Optional[int] = None,
+                 disk_max_bytes: Optional[int] = None, ttl: Optional[float] = None):
+        """
+        PromptCache 초기화
+
+        Args:
+            directory: 디스크 캐시 디렉토리 (기본값: Directories.PROMPT_CACHE)
+            memory_items: 메모리 계층 최대 항목 수 (기본값: AppConfig.PROMPT_CACHE_MEMORY_ITEMS)
+            disk_max_bytes: 디스크 계층 최대 크기 (기본값: AppConfig.PROMPT_CACHE_DISK_MAX_BYTES)
+            ttl: 항목 유효 시간 (초, 0이면 만료 없음, 기본값: AppConfig.PROMPT_CACHE_TTL)
+        """
+        self.directory = Path(directory or Directories.PROMPT_CACHE)
+        self.memory_items = AppConfig.PROMPT_CACHE_MEMORY_ITEMS if memory_items is None else memory_items
+        self.disk_max_bytes = AppConfig.PROMPT_CACHE_DISK_MAX_BYTES if disk_max_bytes is None else disk_max_bytes
+        self.ttl = AppConfig.PROMPT_CACHE_TTL if ttl is None else ttl
+
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._disk_bytes = sum(path.stat().st_size for path in self.directory.glob("*.json"))
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl > 0 and time.time() - stored_at > self.ttl
+
+    def get(self, key: str, disk: bool = True) -> Optional[str]:
+        """
+        캐시된 응답을 조회합니다.
+
+        Args:
+            key: 캐시 키
+            disk: 메모리에 없을 때 디스크 계층도 조회할지 여부 (기본값: True)
+
+        Returns:
+            캐시된 응답 텍스트 또는 None (없거나 만료된 경우)
+        """
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if not self._expired(entry[0]):
+                    self._memory.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return entry[1]
+                del self._memory[key]
+
+        if not disk:
+            return None
+
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            self._stats["disk_hits"] += 1
+            self._remember(key, entry)
+        return entry[1]
+
+    def set(self, key: str, response: str) -> None:
+        """
+        응답을 메모리와 디스크 계층에 저장합니다.
+
+        Args:
+            key: 캐시 키
+            response: GPT 응답 텍스트
+        """
+        entry = (time.time(), response)
+        with self._lock:
+            self._remember(key, entry)
+
+        path = self._path(key)
+        try:
+            old_size = path.stat().st_size if path.exists() else 0
+            write_json_atomic(path, {"stored_at": entry[0], "response": response}, None, False)
+            size = path.stat().st_size
+        except OSError as e:
+            logger.error(f"프롬프트 캐시 기록 중 오류: {str(e)}")
+            return
+
+        with self._lock:
+            self._disk_bytes += size - old_size
+            over = self._disk_bytes > self.disk_max_bytes
+        if over:
+            self._evict_disk()
+
+    def clear(self) -> int:
+        """
+        모든 캐시 항목을 삭제합니다.
+
+        Returns:
+            삭제된 디스크 항목 수
+        """
+        removed = 0
+        with self._lock:
+            self._memory.clear()
+            for path in self.directory.glob("*.json"):
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+            self._disk_bytes = 0
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        계층별 적중 수와 크기를 반환합니다.
+
+        Returns:
+            캐시 통계 딕셔너리
+        """
+        with self._lock:
+            return {
+                **self._stats,
+                "memory_items": len(self._memory),
+                "disk_bytes": self._disk_bytes,
+            }
+
+    def _remember(self, key: str, entry: Tuple[float, str]) -> None:
+        """메모리 계층에 항목을 넣고 가장 오래 사용하지 않은 항목부터 제거합니다. (잠금 안에서 호출)"""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[Tuple[float, str]]:
+        """디스크 계층에서 항목을 읽습니다. 만료되었거나 손상된 파일은 삭제합니다."""
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            entry = (float(saved["stored_at"]), str(saved["response"]))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError):
+            self._remove_disk(path)
+            return None
+
+        if self._expired(entry[0]):
+            self._remove_disk(path)
+            return None
+        return entry
+
+    def _remove_disk(self, path: Path) -> None:
+        """디스크 항목 하나를 삭제하고 크기를 갱신합니다."""
+        try:
+            size = path.stat().st_size
+            path.unlink()
+        except OSError:
+            return
+        with self._lock:
+            self._disk_bytes -= size
+
+    def _evict_disk(self) -> None:
+        """디스크 계층이 최대 크기 이하가 될 때까지 오래된 항목부터 삭제합니다."""
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        evicted = 0
+        for _, size, path in entries:
+            if total <= self.disk_max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            evicted += 1
+
+        with self._lock:
+            self._disk_bytes = total
+            self._stats["evictions"] += evicted
+        logger.debug(f"프롬프트 캐시 디스크 항목 {evicted}개 제거")
@@ -0,0 +1,360 @@
+"""
+업스트림 호출 속도 제한 서비스
+
+모든 GPT 호출이 거쳐 가는 스케줄러입니다. 분당 요청 수(RPM)와 분당 토큰 수(TPM)를
+토큰 버킷으로 제한하고, 대기 중인 호출은 우선순위 순서로 내보냅니다.
+429/일시적 오류는 Retry-After를 따르는 지터 지수 백오프로 재시도합니다.
+"""
+
+import asyncio
+import heapq
+import itertools
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
+import openai
+
+from app.config import AIConfig
+from app.utils.logger import get_logger
+
+# 모듈 로거 설정
+logger = get_logger("rate_limiter")
+
+T = TypeVar("T")
+
+
+class Priority:
+    """호출 우선순위 (값이 작을수록 먼저 처리)"""
+    INTERACTIVE = 0    # 사용자가 기다리는 요청 (/generate, /regenerate 등)
+    BACKGROUND = 10    # 일괄 생성, 백그라운드 작업, 웜 풀 채우기
+
+
+def count_text_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수를 추정합니다.
+
+    영문/숫자는 약 4자당 1토큰, 한글 등 그 외 문자는 1자당 1토큰으로 계산합니다.
+
+    Args:
+        text: 토큰 수를 추정할 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    ascii_count = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_count // 4 + len(text) - ascii_count
+
+
+def estimate_tokens(messages: List[Dict[str, str]], max_tokens: int) -> int:
+    """
+    호출 한 번의 토큰 사용량을 추정합니다.
+
+    메시지 내용의 추정 토큰 수(count_text_tokens)에 응답 최대 토큰 수를 더합니다.
+
+    Args:
+        messages: 채팅 메시지 목록
+        max_tokens: 응답 최대 토큰 수
+
+    Returns:
+        추정 토큰 수
+    """
+    content_tokens = sum(count_text_tokens(message.get("content") or "") for message in messages)
+    # 메시지마다 역할/구분자 토큰이 약 4개씩 붙음
+    return content_tokens + 4 * len(messages) + max_tokens
+
+
+def retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    오류 응답의 retry-after-ms 또는 Retry-After 헤더에서 대기 시간을 읽습니다.
+
+    Args:
+        error: OpenAI API 오류
+
+    Returns:
+        대기 시간 (초) 또는 None (헤더가 없는 경우)
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    재시도할 수 있는 오류(429, 5xx, 시간 초과, 연결 오류)인지 확인합니다.
+
+    Args:
+        error: 호출 중 발생한 오류
+
+    Returns:
+        재시도 가능 여부
+    """
+    if isinstance(error, (openai.APITimeoutError, openai.APIConnectionError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code in (408, 409, 429) or error.status_code >= 500
+    return False
+
+
+class TokenBucket:
+    """
+    1분 단위 한도를 위한 토큰 버킷
+
+    최대 1분 치 한도만큼 쌓이며 초당 limit/60씩 다시 채워집니다.
+    limit이 0 이하이면 제한하지 않습니다.
+    """
+
+    def __init__(self, limit: int):
+        """
+        TokenBucket 초기화
+
+        Args:
+            limit: 분당 한도
+        """
+        self.capacity = float(limit)
+        self.rate = limit / 60.0
+        self.tokens = float(limit)
+        self.updated = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity <= 0
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount만큼 쓸 수 있을 때까지 남은 시간 (초)"""
+        if self.unlimited:
+            return 0.0
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float) -> None:
+        if not self.unlimited:
+            self.tokens -= min(amount, self.capacity)
+
+    def refund(self, amount: float) -> None:
+        if not self.unlimited:
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class RateLimitScheduler:
+    """
+    RPM/TPM 토큰 버킷과 우선순위 대기열을 가진 GPT 호출 스케줄러
+
+    비동기 호출은 우선순위 대기열에서 차례를 기다리며, 우선순위가 높은 호출이
+    들어오면 먼저 대기 중이던 낮은 우선순위 호출보다 앞서 나갑니다.
+    """
+
+    def __init__(self, rpm: Optional[int] = None, tpm: Optional[int] = None,
+                 max_retries: Optional[int] = None, base_delay: Optional[float] = None,
+                 max_delay: Optional[float] = None):
+        """
+        RateLimitScheduler 초기화
+
+        Args:
+            rpm: 분당 요청 수 한도 (기본값: AIConfig.RATE_LIMIT_RPM, 0이면 제한 없음)
+            tpm: 분당 토큰 수 한도 (기본값: AIConfig.RATE_LIMIT_TPM, 0이면 제한 없음)
+            max_retries: 최대 재시도 횟수 (기본값: AIConfig.MAX_RETRIES)
+            base_delay: 백오프 기본 대기 시간 (초, 기본값: AIConfig.RETRY_BASE_DELAY)
+            max_delay: 백오프 최대 대기 시간 (초, 기본값: AIConfig.RETRY_MAX_DELAY)
+        """
+        self.requests = TokenBucket(AIConfig.RATE_LIMIT_RPM if rpm is None else rpm)
+        self.tokens = TokenBucket(AIConfig.RATE_LIMIT_TPM if tpm is None else tpm)
+        self.max_retries = AIConfig.MAX_RETRIES if max_retries is None else max_retries
+        self.base_delay = AIConfig.RETRY_BASE_DELAY if base_delay is None else base_delay
+        self.max_delay = AIConfig.RETRY_MAX_DELAY if max_delay is None else max_delay
+
+        # 버킷 상태는 이벤트 루프와 스레드에서 함께 사용
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+
+        self._waiters: List[Tuple[int, int, asyncio.Future, int]] = []
+        self._counter = itertools.count()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+
+        self._stats = {"calls": 0, "retries": 0, "rate_limited": 0, "failures": 0}
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        호출/재시도 횟수와 대기열 상태를 반환합니다.
+
+        Returns:
+            스케줄러 통계 딕셔너리
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.requests._refill(now)
+            self.tokens._refill(now)
+            return {
+                **self._stats,
+                "waiting": len(self._waiters),
+                "paused_for": round(max(0.0, self._paused_until - now), 3),
+                "requests_available": None if self.requests.unlimited else int(self.requests.tokens),
+                "tokens_available": None if self.tokens.unlimited else int(self.tokens.tokens),
+            }
+
+    def _try_acquire(self, cost: int) -> float:
+        """버킷에서 한 번의 호출 몫을 가져옵니다. 가져오지 못하면 기다릴 시간을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(self._paused_until - now,
+                       self.requests.wait_time(1, now),
+                       self.tokens.wait_time(cost, now))
+            if wait <= 0:
+                self.requests.consume(1)
+                self.tokens.consume(cost)
+                self._stats["calls"] += 1
+            return wait
+
+    def settle(self, estimated: int, actual: Optional[int]) -> None:
+        """
+        실제 사용량이 추정보다 적으면 차이만큼 TPM 버킷에 돌려줍니다.
+
+        Args:
+            estimated: 호출 전에 차감한 추정 토큰 수
+            actual: 응답의 실제 토큰 수 (모르면 None)
+        """
+        if actual is None or actual >= estimated:
+            return
+        with self._lock:
+            self.tokens.refund(estimated - actual)
+
+    def _backoff(self, attempt: int, error: Exception) -> float:
+        """재시도 전 대기 시간을 계산하고, 429이면 모든 호출을 그동안 멈춥니다."""
+        retry_after = retry_after_seconds(error)
+        if retry_after is not None:
+            delay = min(retry_after, self.max_delay) + random.uniform(0, self.base_delay)
+        else:
+            # 지터를 넣은 지수 백오프 (full jitter)
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+        if isinstance(error, openai.RateLimitError):
+            with self._lock:
+                self._stats["rate_limited"] += 1
+                self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        return delay
+
+    def _on_error(self, attempt: int, error: Exception,
+                  handled: Optional[Callable[[Exception], bool]] = None) -> float:
+        """
+        호출 오류를 기록하고 재시도 대기 시간을 반환합니다. 재시도하지 않을 오류는 다시 발생시킵니다.
+
+        호출한 쪽에서 처리하는 오류(handled)는 실패로 집계하지 않습니다.
+        """
+        if not is_retryable(error) or attempt >= self.max_retries:
+            if handled is None or not handled(error):
+                with self._lock:
+                    self._stats["failures"] += 1
+            raise error
+
+        delay = self._backoff(attempt, error)
+        with self._lock:
+            self._stats["retries"] += 1
+        logger.warning(f"GPT 호출 재시도 {attempt + 1}/{self.max_retries} ({delay:.1f}초 후): {str(error)}")
+        return delay
+
+    # 비동기 호출
+
+    async def acquire(self, cost: int, priority: int = Priority.INTERACTIVE) -> None:
+        """
+        우선순위 대기열에서 차례가 될 때까지 기다린 뒤 호출 몫을 가져옵니다.
+
+        Args:
+            cost: 추정 토큰 수
+            priority: 우선순위 (Priority 값)
+        """
+        if not self._waiters and self._try_acquire(cost) <= 0:
+            return
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future, cost))
+        self._ensure_dispatcher()
+        self._wakeup.set()
+        await future
+
+    def _ensure_dispatcher(self) -> None:
+        """대기열을 처리하는 디스패처 태스크를 (필요하면) 시작합니다."""
+        loop = asyncio.get_running_loop()
+        if self._dispatcher is None or self._dispatcher.done() or self._dispatcher.get_loop() is not loop:
+            self._wakeup = asyncio.Event()
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        """가장 높은 우선순위의 대기 호출부터 버킷이 허용하는 대로 내보냅니다."""
+        while self._waiters:
+            self._wakeup.clear()
+            priority, _, future, cost = self._waiters[0]
+            if future.done():
+                # 취소된 대기 호출
+                heapq.heappop(self._waiters)
+                continue
+
+            wait = self._try_acquire(cost)
+            if wait <= 0:
+                heapq.heappop(self._waiters)
+                future.set_result(None)
+                continue
+
+            # 기다리는 동안 더 높은 우선순위 호출이 들어오면 다시 확인
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self, call: Callable[[], Awaitable[T]], cost: int,
+                  priority: int = Priority.INTERACTIVE,
+                  handled: Optional[Callable[[Exception], bool]] = None) -> T:
+        """
+        속도 제한과 재시도를 적용하여 비동기 호출을 실행합니다.
+
+        Args:
+            call: 호출할 때마다 새 코루틴을 만드는 함수
+            cost: 추정 토큰 수
+            priority: 우선순위 (Priority 값)
+            handled: 호출한 쪽에서 처리하는 오류인지 확인하는 함수 (선택, 해당 오류는 실패로 집계하지 않음)
+
+        Returns:
+            호출 결과
+
+        Raises:
+            Exception: 재시도할 수 없거나 재시도 횟수를 모두 쓴 경우의 마지막 오류
+        """
+        attempt = 0
+        while True:
+            await self.acquire(cost, priority)
+            try:
+                return await call()
+            except Exception as e:
+                delay = self._on_error(attempt, e, handled)
+                attempt += 1
+                await asyncio.sleep(delay)
@@ -0,0 +1,128 @@
+"""
+콘텐츠 품질 점수 서비스
+
+생성된 콘텐츠를 유형별 모델(app/utils/models.py)과 템플릿 규칙
+(본문 길이 목표, 키워드 5개, 보기 4개)으로 검사하여 0~100점으로 매깁니다.
+여러 후보 중 가장 좋은 것을 고를 때 사용하며, API 호출 없이 로컬에서 계산합니다.
+"""
+
+from typing import Any, Dict, List
+
+from app.templates import get_content_fields, get_length_target
+from app.utils.models import validate_content
+
+# 템플릿이 요구하는 키워드 수와 보기 수
+KEYWORD_COUNT = 5
+CHOICE_COUNT = 4
+
+# 항목별 감점 (길이는 목표 범위를 벗어난 비율(%)만큼 감점)
+MISSING_FIELD_PENALTY = 15
+LENGTH_PENALTY_MAX = 40
+KEYWORD_COUNT_PENALTY = 5
+KEYWORD_COUNT_PENALTY_MAX = 15
+KEYWORD_UNUSED_PENALTY = 5
+KEYWORD_UNUSED_PENALTY_MAX = 25
+CHOICE_PENALTY = 10
+
+
+def content_text(content: Dict[str, Any]) -> str:
+    """
+    콘텐츠의 유형별 문자열 필드(제목, 상황, 본문, 대화 등)를 하나의 텍스트로 합칩니다.
+
+    Args:
+        content: 콘텐츠 데이터
+
+    Returns:
+        합친 텍스트
+    """
+    fields = get_content_fields(content.get("type", "")) or ()
+    parts: List[str] = []
+    for field in fields:
+        if field in ("type", "level", "topic", "place", "keywords"):
+            continue
+        value = content.get(field)
+        if isinstance(value, str):
+            parts.append(value)
+        elif isinstance(value, list):
+            parts.extend(item for item in value if isinstance(item, str))
+    return "\n".join(parts)
+
+
+def body_length(content: Dict[str, Any], field: str) -> int:
+    """본문 필드의 글자 수 (대화 목록은 "A:" 같은 화자 표시를 뺀 길이의 합)"""
+    value = content.get(field)
+    if isinstance(value, list):
+        return sum(len(str(line).split(":", 1)[-1].strip()) for line in value)
+    return len(value.strip()) if isinstance(value, str) else 0
+
+
+def score_content(content: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    콘텐츠의 품질 점수를 계산합니다.
+
+    모델 검증에 실패하면 0점이며, 그 밖에는 100점에서 규칙별 감점을 뺍니다.
+
+    Args:
+        content: 콘텐츠 데이터
+
+    Returns:
+        {"score": 점수, "valid": 모델 검증 통과 여부, "issues": 감점 사유 목록} 형식의 딕셔너리
+    """
+    error = validate_content(content)
+    if error:
+        return {"score": 0, "valid": False, "issues": [error]}
+
+    content_type = content.get("type", "")
+    issues: List[str] = []
+    penalty = 0
+
+    # 출력 형식의 필드가 모두 채워져 있는지
+    for field in get_content_fields(content_type) or ():
+        if field in ("level", "tokens"):
+            continue
+        value = content.get(field)
+        if value is None or value == "" or value == []:
+            issues.append(f"{field} 필드가 비어 있습니다.")
+            penalty += MISSING_FIELD_PENALTY
+
+    # 본문 길이가 템플릿의 목표 범위 안에 있는지
+    target = get_length_target(content_type)
+    if target is not None:
+        field, min_chars, max_chars = target
+        length = body_length(content, field)
+        if length < min_chars or length > max_chars:
+            bound = min_chars if length < min_chars else max_chars
+            deviation = abs(length - bound) / bound
+            penalty += min(LENGTH_PENALTY_MAX, round(deviation * 100))
+            issues.append(f"{field} 길이 {length}자 (목표 {min_chars}~{max_chars}자)")
+
+    # 키워드가 5개이고 본문에 쓰였는지
+    keywords = [k for k in content.get("keywords") or [] if isinstance(k, str) and k.strip()]
+    if len(keywords) != KEYWORD_COUNT:
+        penalty += min(KEYWORD_COUNT_PENALTY_MAX, KEYWORD_COUNT_PENALTY * abs(len(keywords) - KEYWORD_COUNT))
+        issues.append(f"키워드 {len(keywords)}개 (목표 {KEYWORD_COUNT}개)")
+    text = content_text(content)
+    unused = [k for k in keywords if _keyword_stem(k) not in text]
+    if unused:
+        penalty += min(KEYWORD_UNUSED_PENALTY_MAX, KEYWORD_UNUSED_PENALTY * len(unused))
+        issues.append(f"본문에 쓰이지 않은 키워드: {', '.join(unused)}")
+
+    # 보기가 있는 유형은 서로 다른 보기 4개인지
+    choices = content.get("choices")
+    if isinstance(choices, list):
+        if len(choices) != CHOICE_COUNT:
+            penalty += CHOICE_PENALTY
+            issues.append(f"보기 {len(choices)}개 (목표 {CHOICE_COUNT}개)")
+        if len(set(map(str, choices))) != len(choices):
+            penalty += CHOICE_PENALTY
+            issues.append("중복된 보기가 있습니다.")
+
+    return {"score": max(0, 100 - penalty), "valid": True, "issues": issues}
+
+
+def _keyword_stem(keyword: str) -> str:
+    """활용형도 찾을 수 있도록 "~하다"로 끝나는 키워드는 어간만 사용합니다."""
+    keyword = keyword.strip()
+    if keyword.endswith("하다") and len(keyword) > 2:
+        return keyword[:-2]
+    return keyword
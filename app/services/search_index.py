@@ -0,0 +1,495 @@
+"""
+콘텐츠 검색 색인
+
+저장된 콘텐츠의 텍스트 필드를 문자 n-gram 역색인으로 관리합니다.
+한글은 공백 단위 토큰화가 잘 맞지 않으므로 문자 바이그램(검색어가 한 글자면
+유니그램)으로 후보를 좁힌 뒤, 실제 부분 문자열 일치를 확인합니다.
+"""
+
+import base64
+import bisect
+import json
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
+
+# 콘텐츠 검색 대상 필드
+SEARCH_TEXT_FIELDS = ('topic', 'title', 'situation', 'place', 'text', 'script')
+SEARCH_LIST_FIELDS = ('keywords', 'dialogue')
+
+# 검색 결과 순위 계산 시 필드별 가중치
+FIELD_WEIGHTS = {
+    'topic': 3.0,
+    'title': 3.0,
+    'keywords': 3.0,
+    'place': 2.0,
+    'situation': 2.0,
+    'dialogue': 1.0,
+    'text': 1.0,
+    'script': 1.0,
+}
+
+
+def iter_search_values(item: Dict[str, Any]) -> Iterable[Tuple[str, str]]:
+    """
+    항목의 검색 대상 값을 (필드명, 소문자 문자열) 쌍으로 반환합니다.
+
+    Args:
+        item: 콘텐츠 항목
+
+    Returns:
+        (필드명, 값) 이터레이터
+    """
+    for field in SEARCH_TEXT_FIELDS:
+        value = item.get(field)
+        if isinstance(value, str):
+            yield field, value.lower()
+
+    for field in SEARCH_LIST_FIELDS:
+        value = item.get(field)
+        if isinstance(value, list):
+            for line in value:
+                if isinstance(line, str):
+                    yield field, line.lower()
+
+
+def matches_search_query(item: Dict[str, Any], query: str) -> bool:
+    """
+    콘텐츠 항목이 검색어를 포함하는지 확인합니다.
+
+    Args:
+        item: 콘텐츠 항목
+        query: 소문자로 변환된 검색어
+
+    Returns:
+        검색 대상 필드 중 하나라도 검색어를 포함하는지 여부
+    """
+    if not isinstance(item, dict):
+        return False
+    return any(query in value for _, value in iter_search_values(item))
+
+
+def score_search_match(item: Dict[str, Any], query: str) -> float:
+    """
+    검색어가 나타나는 필드와 횟수로 항목의 관련도 점수를 계산합니다.
+
+    Args:
+        item: 콘텐츠 항목
+        query: 소문자로 변환된 검색어
+
+    Returns:
+        관련도 점수 (일치하지 않으면 0)
+    """
+    score = 0.0
+    for field, value in iter_search_values(item):
+        count = value.count(query)
+        if count:
+            score += FIELD_WEIGHTS.get(field, 1.0) * count
+    return score
+
+
+def _grams(text: str) -> Set[str]:
+    """문자열의 유니그램과 바이그램 집합을 만듭니다."""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+class NgramIndex:
+    """
+    문자 n-gram 역색인
+
+    gram -> 항목 ID 집합(posting)을 유지합니다. 항목 추가/교체/삭제 시
+    해당 항목의 gram만 갱신하므로 변경 비용은 항목 크기에 비례합니다.
+    """
+
+    def __init__(self):
+        """NgramIndex 초기화"""
+        self._postings: Dict[str, Set[str]] = {}
+        self._doc_grams: Dict[str, FrozenSet[str]] = {}
+        self._docs: Dict[str, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def rebuild(self, items: Iterable[Dict[str, Any]]) -> None:
+        """
+        색인을 비우고 주어진 항목으로 다시 만듭니다.
+
+        Args:
+            items: 색인할 항목 목록
+        """
+        self._postings = {}
+        self._doc_grams = {}
+        self._docs = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item: Dict[str, Any]) -> None:
+        """
+        항목을 색인에 추가합니다. 같은 ID가 있으면 교체합니다.
+
+        Args:
+            item: 색인할 항목 (id 필수)
+        """
+        item_id = item.get("id") if isinstance(item, dict) else None
+        if item_id is None:
+            return
+
+        if item_id in self._docs:
+            self.remove(self._docs[item_id])
+
+        grams: Set[str] = set()
+        for _, value in iter_search_values(item):
+            grams |= _grams(value)
+
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(item_id)
+        self._doc_grams[item_id] = frozenset(grams)
+        self._docs[item_id] = item
+
+    def remove(self, item: Dict[str, Any]) -> None:
+        """
+        항목을 색인에서 제거합니다.
+
+        Args:
+            item: 제거할 항목 (id 필수)
+        """
+        item_id = item.get("id") if isinstance(item, dict) else None
+        grams = self._doc_grams.pop(item_id, None)
+        if grams is None:
+            return
+
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(item_id)
+                if not posting:
+                    del self._postings[gram]
+        self._docs.pop(item_id, None)
+
+    def candidates(self, query: str) -> Set[str]:
+        """
+        검색어의 모든 gram을 포함하는 항목 ID 후보를 반환합니다.
+
+        Args:
+            query: 소문자로 변환된 검색어
+
+        Returns:
+            후보 항목 ID 집합 (실제 일치 여부는 확인 전)
+        """
+        if len(query) == 1:
+            return set(self._postings.get(query, ()))
+
+        grams = {query[i:i + 2] for i in range(len(query) - 1)}
+        postings = []
+        for gram in grams:
+            posting = self._postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+
+        # 가장 작은 posting부터 교집합
+        postings.sort(key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting
+            if not result:
+                break
+        return result
+
+    def search(self, query: str, ranked: bool = False) -> List[Dict[str, Any]]:
+        """
+        검색어를 포함하는 항목을 찾습니다.
+
+        Args:
+            query: 검색어
+            ranked: True면 관련도 점수 순으로 정렬
+
+        Returns:
+            일치하는 항목 목록
+        """
+        query = query.lower()
+        if not query:
+            return list(self._docs.values())
+
+        matches = []
+        for item_id in self.candidates(query):
+            item = self._docs[item_id]
+            if ranked:
+                score = score_search_match(item, query)
+                if score > 0:
+                    matches.append((score, item))
+            elif matches_search_query(item, query):
+                matches.append((0.0, item))
+
+        if ranked:
+            matches.sort(key=lambda match: match[0], reverse=True)
+        return [item for _, item in matches]
+
+
+class FacetIndex:
+    """
+    유형/레벨 패싯 집계
+
+    유형별, 레벨별, 유형×레벨별 항목 수를 항목 변경 시 증감하여 유지합니다.
+    필터 목록을 만들 때 전체 데이터를 다시 훑지 않아도 됩니다.
+    제거할 때는 항목의 현재 값이 아니라 추가할 때 집계한 ID별 값을 차감합니다.
+    """
+
+    def __init__(self):
+        """FacetIndex 초기화"""
+        self._types: Dict[str, int] = {}
+        self._levels: Dict[str, int] = {}
+        self._type_levels: Dict[Tuple[str, str], int] = {}
+        self._counted: Dict[str, Tuple[Any, Any]] = {}
+
+    @staticmethod
+    def _keys(item: Dict[str, Any]) -> Tuple[Any, Any]:
+        """항목의 (유형, 레벨) 값을 반환합니다. 비어 있으면 None"""
+        if not isinstance(item, dict):
+            return None, None
+        return item.get("type") or None, item.get("level") or None
+
+    @staticmethod
+    def _bump(counts: Dict[Any, int], key: Any, delta: int) -> None:
+        """카운트를 증감하고 0이 되면 키를 제거합니다."""
+        count = counts.get(key, 0) + delta
+        if count > 0:
+            counts[key] = count
+        else:
+            counts.pop(key, None)
+
+    def _apply(self, keys: Tuple[Any, Any], delta: int) -> None:
+        """(유형, 레벨) 하나만큼 패싯 카운트를 증감합니다."""
+        content_type, level = keys
+        if content_type is not None:
+            self._bump(self._types, content_type, delta)
+        if level is not None:
+            self._bump(self._levels, level, delta)
+        if content_type is not None and level is not None:
+            self._bump(self._type_levels, (content_type, level), delta)
+
+    def rebuild(self, items: Iterable[Dict[str, Any]]) -> None:
+        """
+        패싯을 비우고 주어진 항목으로 다시 집계합니다.
+
+        Args:
+            items: 집계할 항목 목록
+        """
+        self._types = {}
+        self._levels = {}
+        self._type_levels = {}
+        self._counted = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item: Dict[str, Any]) -> None:
+        """항목 추가를 패싯에 반영합니다. 같은 ID가 있으면 교체합니다."""
+        item_id = item.get("id") if isinstance(item, dict) else None
+        if item_id is not None and item_id in self._counted:
+            self.remove(item)
+        keys = self._keys(item)
+        if item_id is not None:
+            self._counted[item_id] = keys
+        self._apply(keys, 1)
+
+    def remove(self, item: Dict[str, Any]) -> None:
+        """항목 제거를 패싯에 반영합니다. (추가할 때 집계한 값 차감)"""
+        item_id = item.get("id") if isinstance(item, dict) else None
+        keys = self._counted.pop(item_id, None) if item_id is not None else self._keys(item)
+        if keys is not None:
+            self._apply(keys, -1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        현재 패싯 카운트를 반환합니다.
+
+        Returns:
+            {"types": {유형: 수}, "levels": {레벨: 수},
+             "type_levels": {유형: {레벨: 수}}} 형식의 딕셔너리 (키 정렬)
+        """
+        type_levels: Dict[str, Dict[str, int]] = {}
+        for (content_type, level), count in sorted(self._type_levels.items()):
+            type_levels.setdefault(content_type, {})[level] = count
+
+        return {
+            "types": dict(sorted(self._types.items())),
+            "levels": dict(sorted(self._levels.items())),
+            "type_levels": type_levels,
+        }
+
+
+# 목록 정렬에 사용할 수 있는 필드
+SORT_FIELDS = ('created_at', 'updated_at', 'type', 'level')
+
+SortKey = Tuple[str, str, str]
+
+
+def sort_key(item: Dict[str, Any], field: str) -> SortKey:
+    """
+    항목의 정렬 키를 만듭니다.
+
+    같은 값끼리는 생성일, 다시 ID 순으로 정렬되어 순서가 항상 결정적입니다.
+
+    Args:
+        item: 콘텐츠 항목
+        field: 정렬 필드 (SORT_FIELDS)
+
+    Returns:
+        (필드 값, 생성일, ID) 튜플
+    """
+    value = item.get(field)
+    created_at = item.get("created_at")
+    return (
+        str(value) if value is not None else "",
+        str(created_at) if created_at is not None else "",
+        str(item.get("id", "")),
+    )
+
+
+def encode_cursor(field: str, key: SortKey) -> str:
+    """
+    정렬 필드와 마지막 항목의 정렬 키를 페이지 커서 문자열로 만듭니다.
+
+    Args:
+        field: 정렬 필드
+        key: 페이지 마지막 항목의 정렬 키
+
+    Returns:
+        URL에 그대로 쓸 수 있는 커서 문자열
+    """
+    payload = json.dumps([field, *key], ensure_ascii=False, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, field: str) -> SortKey:
+    """
+    페이지 커서를 정렬 키로 되돌립니다.
+
+    Args:
+        cursor: encode_cursor로 만든 커서
+        field: 현재 요청의 정렬 필드
+
+    Returns:
+        커서가 가리키는 정렬 키
+
+    Raises:
+        ValueError: 커서 형식이 잘못되었거나 다른 정렬 필드의 커서인 경우
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+        cursor_field, value, created_at, item_id = payload
+    except Exception:
+        raise ValueError("페이지 커서 형식이 올바르지 않습니다.")
+
+    if cursor_field != field:
+        raise ValueError("페이지 커서의 정렬 기준이 현재 요청과 다릅니다.")
+    return str(value), str(created_at), str(item_id)
+
+
+def _cursor_range(keys: List[SortKey], after: Optional[SortKey], descending: bool) -> range:
+    """정렬된 키 목록에서 커서 다음 위치부터의 인덱스 범위를 구합니다."""
+    if descending:
+        end = bisect.bisect_left(keys, after) if after is not None else len(keys)
+        return range(end - 1, -1, -1)
+    start = bisect.bisect_right(keys, after) if after is not None else 0
+    return range(start, len(keys))
+
+
+def page_by_key(keyed_items: List[Tuple[SortKey, Dict[str, Any]]], after: Optional[SortKey],
+                descending: bool) -> Iterator[Tuple[SortKey, Dict[str, Any]]]:
+    """
+    정렬 키 순으로 정렬된 (키, 항목) 목록에서 커서 다음 위치부터 순회합니다.
+
+    Args:
+        keyed_items: 정렬 키 오름차순으로 정렬된 (키, 항목) 목록
+        after: 이전 페이지 마지막 항목의 정렬 키 (없으면 처음부터)
+        descending: 내림차순 순회 여부
+
+    Returns:
+        (키, 항목) 이터레이터
+    """
+    keys = [key for key, _ in keyed_items]
+    for i in _cursor_range(keys, after, descending):
+        yield keyed_items[i]
+
+
+class SortedIndex:
+    """
+    정렬 필드별 미리 정렬된 색인
+
+    (정렬 키) 목록을 항상 정렬된 상태로 유지하므로, 한 페이지를 읽을 때
+    전체를 정렬하지 않고 커서 위치를 이진 탐색한 뒤 페이지 크기만큼만 순회합니다.
+    저장소는 항목을 제자리에서 수정한 뒤 교체하므로, 제거할 때는 항목에서 키를 다시
+    계산하지 않고 추가할 때 기록한 ID별 키를 사용합니다.
+    """
+
+    def __init__(self, field: str):
+        """
+        SortedIndex 초기화
+
+        Args:
+            field: 정렬 필드 (SORT_FIELDS)
+        """
+        self.field = field
+        self._keys: List[SortKey] = []
+        self._docs: Dict[SortKey, Dict[str, Any]] = {}
+        self._id_keys: Dict[str, SortKey] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def rebuild(self, items: Iterable[Dict[str, Any]]) -> None:
+        """
+        색인을 비우고 주어진 항목으로 다시 만듭니다.
+
+        Args:
+            items: 색인할 항목 목록
+        """
+        self._docs = {}
+        self._id_keys = {}
+        for item in items:
+            if isinstance(item, dict) and item.get("id") is not None:
+                key = sort_key(item, self.field)
+                self._docs[key] = item
+                self._id_keys[item["id"]] = key
+        self._keys = sorted(self._docs)
+
+    def add(self, item: Dict[str, Any]) -> None:
+        """항목을 정렬 위치에 삽입합니다. 같은 ID가 있으면 교체합니다."""
+        item_id = item.get("id") if isinstance(item, dict) else None
+        if item_id is None:
+            return
+        if item_id in self._id_keys:
+            self.remove(item)
+        key = sort_key(item, self.field)
+        if key not in self._docs:
+            bisect.insort(self._keys, key)
+        self._docs[key] = item
+        self._id_keys[item_id] = key
+
+    def remove(self, item: Dict[str, Any]) -> None:
+        """항목을 색인에서 제거합니다. (추가할 때 기록한 키 사용)"""
+        item_id = item.get("id") if isinstance(item, dict) else None
+        key = self._id_keys.pop(item_id, None)
+        if key is None or self._docs.pop(key, None) is None:
+            return
+        i = bisect.bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            del self._keys[i]
+
+    def iter_from(self, after: Optional[SortKey] = None,
+                  descending: bool = False) -> Iterator[Tuple[SortKey, Dict[str, Any]]]:
+        """
+        커서 다음 위치부터 정렬 순서대로 (키, 항목)을 반환합니다.
+
+        Args:
+            after: 이전 페이지 마지막 항목의 정렬 키 (없으면 처음부터)
+            descending: 내림차순 순회 여부
+
+        Returns:
+            (키, 항목) 이터레이터
+        """
+        for i in _cursor_range(self._keys, after, descending):
+            key = self._keys[i]
+            yield key, self._docs[key]
@@ -0,0 +1,92 @@
+"""
+단일 비행(single-flight) 서비스
+
+같은 키로 동시에 들어온 요청을 하나의 upstream 호출로 합칩니다.
+먼저 온 요청이 호출을 시작하고, 호출이 끝나기 전에 들어온 같은 키의 요청은
+그 결과(또는 오류)를 함께 받습니다.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.config import AppConfig
+from app.utils.logger import get_logger
+
+# 모듈 로거 설정
+logger = get_logger("single_flight")
+
+
+class SingleFlight:
+    """
+    키별 진행 중 호출 공유
+
+    upstream 호출은 요청과 분리된 태스크로 실행되므로 먼저 온 요청이 취소되어도
+    기다리는 다른 요청은 결과를 받습니다. 호출에는 키별 제한 시간이 있으며,
+    제한 시간 초과를 포함한 오류는 기다리는 모든 요청에 전달됩니다.
+    """
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        SingleFlight 초기화
+
+        Args:
+            timeout: 키별 호출 제한 시간 (초, 0이면 제한 없음, 기본값: AppConfig.SINGLE_FLIGHT_TIMEOUT)
+        """
+        self.timeout = AppConfig.SINGLE_FLIGHT_TIMEOUT if timeout is None else timeout
+        self._calls: Dict[str, asyncio.Task] = {}
+        self._stats = {"calls": 0, "coalesced": 0, "errors": 0, "timeouts": 0}
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        키에 대해 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 func를 호출합니다.
+
+        Args:
+            key: 요청 키 (같은 키의 요청은 같은 결과를 공유)
+            func: upstream 호출 코루틴 함수
+
+        Returns:
+            (결과, 직접 호출했는지 여부) 튜플
+
+        Raises:
+            Exception: 공유한 호출에서 발생한 오류 (제한 시간 초과 시 TimeoutError)
+        """
+        task = self._calls.get(key)
+        leader = task is None or task.get_loop() is not asyncio.get_running_loop()
+        if leader:
+            task = asyncio.create_task(self._run(key, func))
+            # 기다리던 요청이 모두 취소된 뒤 실패해도 경고가 남지 않도록 예외를 회수
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._calls[key] = task
+            self._stats["calls"] += 1
+        else:
+            self._stats["coalesced"] += 1
+            logger.info("진행 중인 동일 요청의 결과를 함께 사용합니다.")
+
+        # 이 요청이 취소되어도 공유 호출은 계속 진행
+        return await asyncio.shield(task), leader
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        호출/공유/오류 횟수와 진행 중인 호출 수를 반환합니다.
+
+        Returns:
+            통계 딕셔너리
+        """
+        return {**self._stats, "inflight": len(self._calls)}
+
+    async def _run(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        """호출을 실행하고 끝나면 키를 비웁니다."""
+        try:
+            if self.timeout > 0:
+                try:
+                    return await asyncio.wait_for(func(), timeout=self.timeout)
+                except asyncio.TimeoutError:
+                    self._stats["timeouts"] += 1
+                    raise TimeoutError(f"동일 요청 공유 호출이 제한 시간({self.timeout:g}초)을 초과했습니다.")
+            return await func()
+        except Exception:
+            self._stats["errors"] += 1
+            raise
+        finally:
+            if self._calls.get(key) is asyncio.current_task():
+                del self._calls[key]
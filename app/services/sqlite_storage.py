@@ -0,0 +1,745 @@
+"""
+SQLite 콘텐츠 저장 서비스
+
+ContentStorage와 동일한 공개 인터페이스를 SQLite 데이터베이스 위에 제공합니다.
+항목 전체는 JSON 컬럼에 저장하고, 조회에 쓰이는 id, type, level,
+created_at, trashed_at은 인덱스가 있는 별도 컬럼으로 관리합니다.
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.config import AppConfig, Directories, Files
+from app.services.search_index import (
+    SORT_FIELDS, decode_cursor, encode_cursor, matches_search_query, score_search_match,
+)
+from app.services.storage import BackupMixin
+from app.utils.logger import get_logger
+
+# 모듈 로거 설정
+logger = get_logger("sqlite_storage")
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    type TEXT,
+    level TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    trashed_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_items_type ON items(type);
+CREATE INDEX IF NOT EXISTS idx_items_level ON items(level);
+CREATE INDEX IF NOT EXISTS idx_items_created_at ON items(created_at);
+CREATE INDEX IF NOT EXISTS idx_items_trashed_at ON items(trashed_at);
+CREATE INDEX IF NOT EXISTS idx_items_facets ON items(trashed_at, type, level);
+"""
+
+_INSERT = """
+INSERT INTO items (id, type, level, created_at, updated_at, trashed_at, data)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# 목록 페이지용 정렬 인덱스 (search_index.sort_key와 같은 (값, 생성일, ID) 순서)
+_SORT_COLUMNS = {
+    field: (f"COALESCE({field}, '')", "COALESCE(created_at, '')", "id") for field in SORT_FIELDS
+}
+
+_SORT_SCHEMA = "".join(
+    f"CREATE INDEX IF NOT EXISTS idx_items_sort_{field} ON items(trashed_at, {', '.join(columns)});\n"
+    for field, columns in _SORT_COLUMNS.items()
+)
+
+
+class SqliteContentStorage(BackupMixin):
+    """
+    SQLite 기반 콘텐츠 저장소
+
+    WAL 모드로 동작하므로 읽기가 쓰기를 막지 않습니다. 연결은 스레드마다
+    따로 열고, 쓰기는 잠금으로 직렬화합니다. 휴지통 항목은 trashed_at
+    컬럼이 채워진 행입니다.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, backup_dir: Optional[Path] = None,
+                 max_backups: int = None):
+        """
+        SqliteContentStorage 초기화
+
+        Args:
+            db_path: 데이터베이스 파일 경로 (기본값: Files.SQLITE)
+            backup_dir: 백업 디렉토리 경로 (기본값: DATA_DIR/backups)
+            max_backups: 유지할 최대 백업 수 (기본값: AppConfig.MAX_BACKUPS)
+        """
+        self.db_path = Path(db_path or Files.SQLITE)
+        BackupMixin.__init__(self, backup_dir or Directories.BACKUPS,
+                             max_backups or AppConfig.MAX_BACKUPS)
+
+        self._local = threading.local()
+        self._write_lock = threading.RLock()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        with self._write_lock:
+            self._connection().executescript(_SCHEMA + _SORT_SCHEMA)
+
+        # 백업 실행 (AppConfig.AUTO_BACKUP이 True인 경우, 하루 한 번)
+        self._last_backup_day: Optional[str] = None
+        self._auto_backup_if_due()
+
+    def _connection(self) -> sqlite3.Connection:
+        """현재 스레드의 데이터베이스 연결을 반환합니다."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # 연결은 만든 스레드에서만 사용하지만, close()는 다른 스레드에서 닫을 수 있어야 함
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> bool:
+        """
+        모든 스레드에서 연 데이터베이스 연결을 닫습니다.
+        애플리케이션 종료 시 호출합니다.
+
+        Returns:
+            모든 연결을 닫았는지 여부
+        """
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        self._local.conn = None
+
+        success = True
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                logger.error(f"데이터베이스 연결 종료 중 오류: {str(e)}")
+                success = False
+        return success
+
+    def _auto_backup_if_due(self) -> None:
+        """날짜가 바뀌었으면 자동 백업을 생성합니다."""
+        if not AppConfig.AUTO_BACKUP:
+            return
+        today = datetime.now().strftime('%Y%m%d')
+        if self._last_backup_day != today:
+            self._last_backup_day = today
+            self._create_auto_backup(self.get_all())
+
+    @staticmethod
+    def _row_values(item: Dict[str, Any]) -> Tuple[Any, ...]:
+        """항목을 items 테이블 행 값으로 변환합니다."""
+        return (
+            item["id"],
+            item.get("type"),
+            item.get("level"),
+            item.get("created_at"),
+            item.get("updated_at"),
+            item.get("trashed_at"),
+            json.dumps(item, ensure_ascii=False),
+        )
+
+    def _insert(self, conn: sqlite3.Connection, item: Dict[str, Any]) -> None:
+        """
+        항목을 새 행으로 삽입합니다.
+
+        Raises:
+            sqlite3.IntegrityError: 같은 ID의 행(휴지통 항목 포함)이 이미 있는 경우
+        """
+        conn.execute(_INSERT, self._row_values(item))
+
+    def _upsert(self, conn: sqlite3.Connection, items: Iterable[Dict[str, Any]]) -> None:
+        """항목을 삽입하거나 같은 ID의 행을 교체합니다. (수정, 가져오기 전용)"""
+        conn.executemany(
+            _INSERT + """
+            ON CONFLICT(id) DO UPDATE SET
+                type = excluded.type,
+                level = excluded.level,
+                created_at = excluded.created_at,
+                updated_at = excluded.updated_at,
+                trashed_at = excluded.trashed_at,
+                data = excluded.data
+            """,
+            [self._row_values(item) for item in items]
+        )
+
+    def _select(self, where: str, params: Tuple[Any, ...] = ()) -> List[Dict[str, Any]]:
+        """조건에 맞는 항목을 삽입 순서대로 조회합니다."""
+        rows = self._connection().execute(
+            f"SELECT data FROM items WHERE {where} ORDER BY rowid", params
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def _select_one(self, where: str, params: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
+        """조건에 맞는 항목 하나를 조회합니다."""
+        row = self._connection().execute(
+            f"SELECT data FROM items WHERE {where}", params
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def refresh(self) -> bool:
+        """
+        ContentStorage와의 호환을 위한 메서드입니다.
+        데이터베이스는 항상 최신 상태를 읽으므로 다시 로드할 것이 없습니다.
+
+        Returns:
+            항상 False
+        """
+        return False
+
+    def save(self) -> bool:
+        """
+        ContentStorage와의 호환을 위한 메서드입니다. 변경은 즉시 커밋됩니다.
+
+        Returns:
+            항상 True
+        """
+        return True
+
+    def flush(self) -> bool:
+        """
+        ContentStorage와의 호환을 위한 메서드입니다. 대기 중인 쓰기가 없습니다.
+
+        Returns:
+            항상 True
+        """
+        return True
+
+    def get_all(self) -> List[Dict[str, Any]]:
+        """
+        휴지통에 없는 모든 항목을 반환합니다.
+
+        Returns:
+            모든 항목 리스트
+        """
+        return self._select("trashed_at IS NULL")
+
+    def get_by_id(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """
+        ID로 특정 항목을 검색합니다.
+
+        Args:
+            item_id: 검색할 항목 ID
+
+        Returns:
+            항목 데이터 또는 None (없을 경우)
+        """
+        return self._select_one("id = ? AND trashed_at IS NULL", (item_id,))
+
+    def add(self, item: Dict[str, Any]) -> str:
+        """
+        새 항목을 추가합니다.
+
+        같은 ID의 행이 이미 있으면 (휴지통 항목 포함) 덮어쓰지 않고 새 ID를 부여합니다.
+
+        Args:
+            item: 추가할 항목 데이터
+
+        Returns:
+            추가된 항목의 ID
+        """
+        if "id" not in item:
+            item["id"] = str(uuid.uuid4())
+
+        now = datetime.now().isoformat()
+        if "created_at" not in item:
+            item["created_at"] = now
+        item["updated_at"] = now
+
+        with self._write_lock:
+            try:
+                self._insert(self._connection(), item)
+            except sqlite3.IntegrityError:
+                logger.warning(f"이미 사용 중인 ID라 새 ID로 추가합니다: {item['id']}")
+                item["id"] = str(uuid.uuid4())
+                self._insert(self._connection(), item)
+        self._auto_backup_if_due()
+        return item["id"]
+
+    def update(self, item: Dict[str, Any]) -> bool:
+        """
+        기존 항목을 업데이트합니다.
+
+        Args:
+            item: 업데이트할 항목 데이터 (id 포함)
+
+        Returns:
+            업데이트 성공 여부
+        """
+        if "id" not in item:
+            logger.error("업데이트할 항목에 ID가 없습니다.")
+            return False
+
+        with self._write_lock:
+            existing_item = self.get_by_id(item["id"])
+            if existing_item is None:
+                logger.warning(f"업데이트할 항목을 찾을 수 없음: {item['id']}")
+                return False
+
+            # 수정일 업데이트, 생성일 보존
+            item["updated_at"] = datetime.now().isoformat()
+            if "created_at" in existing_item and "created_at" not in item:
+                item["created_at"] = existing_item["created_at"]
+
+            self._upsert(self._connection(), [item])
+        self._auto_backup_if_due()
+        return True
+
+    def save_content(self, content: Dict[str, Any]) -> str:
+        """
+        콘텐츠를 저장합니다. (기존 항목 업데이트 또는 새 항목 추가)
+
+        Args:
+            content: 저장할 콘텐츠 데이터
+
+        Returns:
+            저장된 콘텐츠의 ID
+        """
+        if "id" in content and self.get_by_id(content["id"]):
+            self.update(content)
+            return content["id"]
+        else:
+            return self.add(content)
+
+    def delete(self, item_id: str) -> bool:
+        """
+        특정 항목을 삭제합니다.
+
+        Args:
+            item_id: 삭제할 항목 ID
+
+        Returns:
+            삭제 성공 여부
+        """
+        with self._write_lock:
+            cursor = self._connection().execute(
+                "DELETE FROM items WHERE id = ? AND trashed_at IS NULL", (item_id,)
+            )
+        if cursor.rowcount == 0:
+            logger.warning(f"삭제할 항목을 찾을 수 없음: {item_id}")
+            return False
+        return True
+
+    def search_contents(self, query: str = None, content_type: str = None,
+                        level: str = None, ranked: bool = False, sort: Optional[str] = None,
+                        descending: bool = True, limit: Optional[int] = None,
+                        cursor: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        콘텐츠를 검색합니다.
+
+        유형/레벨 필터는 인덱스 컬럼으로 처리하고, 검색어는 ContentStorage와
+        같은 필드 규칙으로 확인합니다. 정렬 필드를 지정하면 정렬 인덱스를 따라
+        커서 다음 위치부터 limit개만 읽습니다.
+
+        Args:
+            query: 검색어 (기본값: None)
+            content_type: 콘텐츠 유형 필터 (기본값: None)
+            level: 콘텐츠 레벨 필터 (기본값: None)
+            ranked: 검색어가 있을 때 관련도 순으로 정렬할지 여부 (기본값: False, 저장 순서)
+            sort: 정렬 필드 (SORT_FIELDS 중 하나, 기본값: None이면 저장 순서)
+            descending: 내림차순 정렬 여부 (기본값: True)
+            limit: 반환할 최대 항목 수 (기본값: None, 전체)
+            cursor: 이전 페이지의 next_cursor (sort 지정 시에만 사용)
+
+        Returns:
+            검색 결과 목록
+
+        Raises:
+            ValueError: 지원하지 않는 정렬 필드이거나 커서가 잘못된 경우
+        """
+        if sort is not None:
+            return [item for _, item in self._iter_sorted(query, content_type, level, sort,
+                                                          descending, limit, cursor)]
+
+        conditions, params = self._filter_conditions(query, content_type, level)
+        results = self._select(" AND ".join(conditions), tuple(params))
+
+        if query:
+            query = query.lower()
+            results = [item for item in results if matches_search_query(item, query)]
+            if ranked:
+                results.sort(key=lambda item: score_search_match(item, query), reverse=True)
+
+        if limit is not None:
+            results = results[:limit]
+
+        return results
+
+    @staticmethod
+    def _filter_conditions(query: Optional[str], content_type: Optional[str],
+                           level: Optional[str]) -> Tuple[List[str], List[Any]]:
+        """검색 조건을 WHERE 절 조건과 매개변수로 변환합니다."""
+        conditions = ["trashed_at IS NULL"]
+        params: List[Any] = []
+        if content_type:
+            conditions.append("type = ?")
+            params.append(content_type)
+        if level:
+            conditions.append("level = ?")
+            params.append(level)
+        if query and not any(c in query for c in '"\\%_'):
+            # JSON 문자열에 그대로 나타나는 검색어는 SQL에서 먼저 후보를 좁힘
+            # (LIKE는 ASCII 대소문자를 구분하지 않으며 한글에는 대소문자가 없음)
+            conditions.append("data LIKE ?")
+            params.append(f"%{query}%")
+        return conditions, params
+
+    def _iter_sorted(self, query: Optional[str], content_type: Optional[str], level: Optional[str],
+                     sort: str, descending: bool, limit: Optional[int],
+                     cursor: Optional[str]) -> List[Tuple[Tuple[str, str, str], Dict[str, Any]]]:
+        """
+        정렬 인덱스 순서로 필터를 적용해 (정렬 키, 항목) 목록을 최대 limit개 반환합니다.
+
+        커서는 (값, 생성일, ID) 행 값 비교로 처리하므로 OFFSET 없이 인덱스에서
+        바로 다음 위치를 찾습니다.
+        """
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"지원하지 않는 정렬 기준입니다: {sort}")
+
+        page: List[Tuple[Tuple[str, str, str], Dict[str, Any]]] = []
+        if limit is not None and limit <= 0:
+            return page
+
+        conditions, params = self._filter_conditions(query, content_type, level)
+        columns = _SORT_COLUMNS[sort]
+        expression = ", ".join(columns)
+        if cursor:
+            after = decode_cursor(cursor, sort)
+            # 첫 컬럼 범위 조건은 중복이지만 인덱스 범위 탐색에 쓰임
+            conditions.append(f"{columns[0]} {'<=' if descending else '>='} ?")
+            conditions.append(f"({expression}) {'<' if descending else '>'} (?, ?, ?)")
+            params.extend((after[0], *after))
+
+        direction = "DESC" if descending else "ASC"
+        order_by = ", ".join(f"{column} {direction}" for column in columns)
+        sql = f"SELECT {expression}, data FROM items WHERE {' AND '.join(conditions)} ORDER BY {order_by}"
+
+        # 검색어가 없으면 정확히 limit개만 읽고, 있으면 확인을 통과한 항목이 찰 때까지 읽음
+        if limit is not None and not query:
+            sql += f" LIMIT {int(limit)}"
+
+        query_lower = query.lower() if query else None
+        for value, created_at, item_id, data in self._connection().execute(sql, tuple(params)):
+            item = json.loads(data)
+            if query_lower and not matches_search_query(item, query_lower):
+                continue
+            page.append(((value, created_at, item_id), item))
+            if limit is not None and len(page) >= limit:
+                break
+
+        return page
+
+    def search_page(self, query: str = None, content_type: str = None, level: str = None,
+                    sort: str = "created_at", descending: bool = True, limit: int = 50,
+                    cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        콘텐츠 목록의 한 페이지를 반환합니다.
+
+        Args:
+            query: 검색어 (기본값: None)
+            content_type: 콘텐츠 유형 필터 (기본값: None)
+            level: 콘텐츠 레벨 필터 (기본값: None)
+            sort: 정렬 필드 (기본값: created_at)
+            descending: 내림차순 정렬 여부 (기본값: True)
+            limit: 페이지 크기 (기본값: 50)
+            cursor: 이전 페이지의 next_cursor (기본값: None, 첫 페이지)
+
+        Returns:
+            {"items": 항목 목록, "next_cursor": 다음 페이지 커서 또는 None, "total": 전체 결과 수}
+        """
+        entries = self._iter_sorted(query, content_type, level, sort, descending, limit + 1, cursor)
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+
+        return {
+            "items": [item for _, item in entries],
+            "next_cursor": encode_cursor(sort, entries[-1][0]) if has_more and entries else None,
+            "total": self.count_contents(query, content_type, level),
+        }
+
+    def count_contents(self, query: str = None, content_type: str = None, level: str = None) -> int:
+        """
+        검색 조건에 맞는 콘텐츠 수를 반환합니다.
+
+        Args:
+            query: 검색어 (기본값: None)
+            content_type: 콘텐츠 유형 필터 (기본값: None)
+            level: 콘텐츠 레벨 필터 (기본값: None)
+
+        Returns:
+            결과 수
+        """
+        if query:
+            return len(self.search_contents(query, content_type, level))
+
+        conditions, params = self._filter_conditions(None, content_type, level)
+        row = self._connection().execute(
+            f"SELECT COUNT(*) FROM items WHERE {' AND '.join(conditions)}", tuple(params)
+        ).fetchone()
+        return row[0]
+
+    def facets(self) -> Dict[str, Any]:
+        """
+        유형별, 레벨별, 유형×레벨별 콘텐츠 수를 반환합니다.
+
+        (trashed_at, type, level) 커버링 인덱스만 읽어 집계합니다.
+
+        Returns:
+            {"types": {...}, "levels": {...}, "type_levels": {유형: {레벨: 수}}}
+        """
+        rows = self._connection().execute(
+            """
+            SELECT type, level, COUNT(*) FROM items
+            WHERE trashed_at IS NULL
+            GROUP BY type, level
+            ORDER BY type, level
+            """
+        ).fetchall()
+
+        types: Dict[str, int] = {}
+        levels: Dict[str, int] = {}
+        type_levels: Dict[str, Dict[str, int]] = {}
+        for content_type, level, count in rows:
+            if content_type:
+                types[content_type] = types.get(content_type, 0) + count
+            if level:
+                levels[level] = levels.get(level, 0) + count
+            if content_type and level:
+                type_levels.setdefault(content_type, {})[level] = count
+
+        return {
+            "types": types,
+            "levels": dict(sorted(levels.items())),
+            "type_levels": type_levels,
+        }
+
+    def get_trash(self) -> List[Dict[str, Any]]:
+        """
+        휴지통에 있는 모든 항목을 반환합니다.
+
+        Returns:
+            휴지통의 항목 리스트
+        """
+        return self._select("trashed_at IS NOT NULL")
+
+    def get_trash_by_id(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """
+        휴지통에서 ID로 특정 항목을 검색합니다.
+
+        Args:
+            item_id: 검색할 항목 ID
+
+        Returns:
+            항목 데이터 또는 None (없을 경우)
+        """
+        return self._select_one("id = ? AND trashed_at IS NOT NULL", (item_id,))
+
+    def trash(self, content_id: str) -> bool:
+        """
+        특정 콘텐츠를 휴지통으로 이동합니다.
+
+        Args:
+            content_id: 이동할 콘텐츠 ID
+
+        Returns:
+            이동 성공 여부
+        """
+        with self._write_lock:
+            item = self.get_by_id(content_id)
+            if item is None:
+                logger.warning(f"휴지통으로 이동할 항목을 찾을 수 없음: {content_id}")
+                return False
+
+            item["trashed_at"] = datetime.now().isoformat()
+            self._upsert(self._connection(), [item])
+
+        logger.info(f"항목을 휴지통으로 이동: {content_id}")
+        return True
+
+    def restore(self, content_id: str) -> bool:
+        """
+        휴지통에서 콘텐츠를 복원합니다.
+
+        Args:
+            content_id: 복원할 콘텐츠 ID
+
+        Returns:
+            복원 성공 여부
+        """
+        with self._write_lock:
+            item = self.get_trash_by_id(content_id)
+            if item is None:
+                logger.warning(f"복원할 항목을 휴지통에서 찾을 수 없음: {content_id}")
+                return False
+
+            item.pop("trashed_at", None)
+            item["restored_at"] = datetime.now().isoformat()
+            item["updated_at"] = datetime.now().isoformat()
+            self._upsert(self._connection(), [item])
+
+        logger.info(f"항목을 휴지통에서 복원: {content_id}")
+        return True
+
+    def empty_trash(self) -> int:
+        """
+        휴지통을 비웁니다.
+
+        Returns:
+            삭제된 항목 수
+        """
+        with self._write_lock:
+            cursor = self._connection().execute("DELETE FROM items WHERE trashed_at IS NOT NULL")
+        count = cursor.rowcount
+        logger.info(f"휴지통 비우기 완료: {count}개 항목 삭제")
+        return count
+
+    def delete_from_trash(self, item_id: str) -> bool:
+        """
+        휴지통에서 항목을 영구 삭제합니다.
+
+        Args:
+            item_id: 삭제할 항목 ID
+
+        Returns:
+            삭제 성공 여부
+        """
+        with self._write_lock:
+            cursor = self._connection().execute(
+                "DELETE FROM items WHERE id = ? AND trashed_at IS NOT NULL", (item_id,)
+            )
+        if cursor.rowcount == 0:
+            logger.warning(f"휴지통에서 삭제할 항목을 찾을 수 없음: {item_id}")
+            return False
+        logger.info(f"휴지통에서 항목 영구 삭제: {item_id}")
+        return True
+
+    def restore_from_backup(self, backup_path: str) -> Tuple[int, str]:
+        """
+        백업 파일에서 데이터를 복원합니다. 휴지통 항목은 유지됩니다.
+
+        Args:
+            backup_path: 백업 파일 경로
+
+        Returns:
+            복원된 항목 수와 백업 ID
+        """
+        try:
+            # 현재 데이터 백업
+            pre_restore_backup = self.create_manual_backup(self.get_all())
+
+            # 백업 파일 로드
+            with open(backup_path, 'r', encoding='utf-8') as f:
+                backup_data = json.loads(f.read())
+
+            if not isinstance(backup_data, list):
+                raise ValueError("백업 데이터는 리스트 형식이어야 합니다.")
+
+            # 유효한 항목만 필터링
+            valid_items = []
+            for item in backup_data:
+                if isinstance(item, dict) and "type" in item:
+                    if "id" not in item:
+                        item["id"] = str(uuid.uuid4())
+                    item.pop("trashed_at", None)
+                    item["restored_from_backup"] = True
+                    item["restored_at"] = datetime.now().isoformat()
+                    valid_items.append(item)
+
+            # 데이터 교체 (하나의 트랜잭션)
+            with self._write_lock:
+                conn = self._connection()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute("DELETE FROM items WHERE trashed_at IS NULL")
+                    self._upsert(conn, valid_items)
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+
+            return len(valid_items), os.path.basename(pre_restore_backup) if pre_restore_backup else ""
+
+        except Exception as e:
+            logger.error(f"백업 복원 중 오류: {str(e)}")
+            raise ValueError(f"백업 복원 실패: {str(e)}")
+
+
+def _read_json_list(path: Path) -> List[Dict[str, Any]]:
+    """JSON 배열 파일에서 유효한 항목만 읽습니다. 파일이 없으면 빈 리스트"""
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read().strip()
+    if not content:
+        return []
+    data = json.loads(content)
+    if not isinstance(data, list):
+        raise ValueError(f"'{path}'의 데이터는 리스트 형식이어야 합니다.")
+    return [item for item in data if isinstance(item, dict) and "type" in item]
+
+
+def migrate_json_to_sqlite(db_path: Optional[Path] = None, confirm_path: Optional[Path] = None,
+                           trash_path: Optional[Path] = None) -> Tuple[int, int]:
+    """
+    기존 JSON 파일(저장 콘텐츠, 휴지통)을 SQLite 데이터베이스로 가져옵니다.
+
+    같은 ID의 행은 교체하므로 여러 번 실행해도 중복되지 않습니다.
+
+    Args:
+        db_path: 데이터베이스 파일 경로 (기본값: Files.SQLITE)
+        confirm_path: 저장 콘텐츠 JSON 경로 (기본값: Files.CONFIRM)
+        trash_path: 휴지통 JSON 경로 (기본값: Files.TRASH)
+
+    Returns:
+        가져온 (콘텐츠 수, 휴지통 항목 수)
+    """
+    items = _read_json_list(confirm_path or Files.CONFIRM)
+    trash_items = _read_json_list(trash_path or Files.TRASH)
+
+    now = datetime.now().isoformat()
+    for item in items:
+        item.setdefault("id", str(uuid.uuid4()))
+        item.pop("trashed_at", None)
+    for item in trash_items:
+        item.setdefault("id", str(uuid.uuid4()))
+        item.setdefault("trashed_at", now)
+
+    storage = SqliteContentStorage(db_path=db_path)
+    with storage._write_lock:
+        conn = storage._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            storage._upsert(conn, items)
+            storage._upsert(conn, trash_items)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    storage.close()
+
+    logger.info(f"SQLite 마이그레이션 완료: 콘텐츠 {len(items)}개, 휴지통 {len(trash_items)}개 -> {storage.db_path}")
+    return len(items), len(trash_items)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="JSON 저장 파일을 SQLite 데이터베이스로 마이그레이션")
+    parser.add_argument("--db", type=Path, default=Files.SQLITE, help="데이터베이스 파일 경로")
+    parser.add_argument("--confirmed", type=Path, default=Files.CONFIRM, help="저장 콘텐츠 JSON 경로")
+    parser.add_argument("--trash", type=Path, default=Files.TRASH, help="휴지통 JSON 경로")
+    args = parser.parse_args()
+
+    migrate_json_to_sqlite(args.db, args.confirmed, args.trash)
@@ -5,9 +5,11 @@
 파일 기반으로 콘텐츠를 저장, 검색, 수정, 삭제할 수 있습니다.
 """
 
+import hashlib
 import json
 import os
 import shutil
+import threading
 from typing import List, Dict, Any, Optional, Tuple, Union
 import uuid
 from datetime import datetime
@@ -16,27 +18,264 @@ from pathlib import Path
 from app.config import Files, Directories, AppConfig
 from app.utils.logger import get_logger
 from app.utils.json_debug import safely_parse_json
+from app.services.journal import JournalOp, StorageJournal, write_json_atomic
+from app.services.write_behind import WriteBehindFlusher
+from app.services.search_index import (
+    SORT_FIELDS, FacetIndex, NgramIndex, SortedIndex,
+    decode_cursor, encode_cursor, page_by_key, sort_key,
+)
 
 # 모듈 로거 설정
 logger = get_logger("storage")
 
 
+def _build_positions(items: List[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    항목 리스트에서 ID -> 위치 인덱스를 만듭니다.
+    
+    ID가 중복되면 선형 검색과 같은 결과가 나오도록 첫 번째 항목을 사용합니다.
+    """
+    positions = {}
+    for i, item in enumerate(items):
+        item_id = item.get("id") if isinstance(item, dict) else None
+        if item_id is not None and item_id not in positions:
+            positions[item_id] = i
+    return positions
+
+
+def _swap_remove(items: List[Dict[str, Any]], positions: Dict[str, int],
+                 item_id: str) -> Optional[Dict[str, Any]]:
+    """
+    마지막 항목을 빈자리로 옮겨 O(1)에 항목을 제거하고 위치 인덱스를 갱신합니다.
+    
+    Args:
+        items: 항목 리스트
+        positions: ID -> 위치 인덱스
+        item_id: 제거할 항목 ID
+        
+    Returns:
+        제거된 항목 또는 None (없을 경우)
+    """
+    pos = positions.pop(item_id, None)
+    if pos is None:
+        return None
+    
+    removed = items[pos]
+    last = items.pop()
+    if pos < len(items):
+        items[pos] = last
+        last_id = last.get("id") if isinstance(last, dict) else None
+        if last_id is not None and positions.get(last_id) == len(items):
+            positions[last_id] = pos
+    return removed
+
+
+class FileSignature:
+    """
+    파일 변경 감지를 위한 시그니처
+
+    mtime과 크기를 먼저 비교하고, 둘 중 하나라도 다르면 내용 해시로
+    실제 변경 여부를 확인합니다. 다른 프로세스가 파일을 수정했을 때만
+    다시 로드하기 위해 사용합니다.
+    """
+
+    def __init__(self, path: Path):
+        """
+        FileSignature 초기화
+
+        Args:
+            path: 감시할 파일 경로
+        """
+        self.path = path
+        self.mtime_ns: Optional[int] = None
+        self.size: Optional[int] = None
+        self.digest: Optional[str] = None
+
+    def _stat(self) -> Tuple[Optional[int], Optional[int]]:
+        """파일의 (mtime_ns, 크기)를 반환합니다. 파일이 없으면 (None, None)"""
+        try:
+            stat = os.stat(self.path)
+            return stat.st_mtime_ns, stat.st_size
+        except OSError:
+            return None, None
+
+    def _hash(self) -> Optional[str]:
+        """파일 내용의 SHA-256 해시를 계산합니다."""
+        try:
+            digest = hashlib.sha256()
+            with open(self.path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+            return digest.hexdigest()
+        except OSError:
+            return None
+
+    def current(self, hash_content: bool = True) -> Tuple[Optional[int], Optional[int], Optional[str]]:
+        """
+        현재 파일 상태를 기록하지 않고 반환합니다.
+        
+        Args:
+            hash_content: 내용 해시까지 계산할지 여부 (False면 해시는 None)
+            
+        Returns:
+            (mtime_ns, 크기, 내용 해시)
+        """
+        mtime_ns, size = self._stat()
+        digest = self._hash() if hash_content and mtime_ns is not None else None
+        return mtime_ns, size, digest
+
+    def capture(self, hash_content: bool = True) -> None:
+        """
+        현재 파일 상태를 기준 시그니처로 기록합니다.
+        
+        Args:
+            hash_content: 내용 해시까지 계산할지 여부 (False면 mtime/크기만 기록)
+        """
+        self.mtime_ns, self.size, self.digest = self.current(hash_content)
+
+    def remember(self, written: Tuple[Optional[int], Optional[int], Optional[str]]) -> None:
+        """
+        미리 구한 시그니처를 기록합니다. (파일을 다시 읽지 않음)
+        
+        Args:
+            written: write_json_atomic 또는 current()가 반환한 (mtime_ns, 크기, 내용 해시)
+        """
+        self.mtime_ns, self.size, self.digest = written
+
+    def has_changed(self) -> bool:
+        """
+        기록된 시그니처 이후 파일이 변경되었는지 확인합니다.
+
+        Returns:
+            변경 여부
+        """
+        mtime_ns, size = self._stat()
+        if mtime_ns == self.mtime_ns and size == self.size:
+            return False
+
+        # mtime/크기가 달라도 내용이 같으면 (touch 등) 변경으로 보지 않음
+        digest = self._hash() if mtime_ns is not None else None
+        if digest == self.digest:
+            self.mtime_ns, self.size = mtime_ns, size
+            return False
+
+        return True
+
+
 class BaseStorage:
     """기본 저장소 클래스"""
     
-    def __init__(self, file_path: Path):
+    def __init__(self, file_path: Path, indexes: Optional[List[Any]] = None):
         """
         BaseStorage 초기화
         
         Args:
             file_path: 데이터 저장 파일 경로
+            indexes: 항목 변경 시 함께 갱신할 보조 인덱스 목록
+                (rebuild(items), add(item), remove(item) 메서드 필요)
         """
         self.file_path = file_path
+        self._lock = getattr(self, "_lock", None) or threading.RLock()
+        self._file_lock = getattr(self, "_file_lock", None) or threading.RLock()
+        # 메모리 항목/휴지통 변경 횟수 (잠금 없이 다시 로드하는 동안의 변경 감지용)
+        self._changes = getattr(self, "_changes", 0)
+        self._indexes = list(indexes or [])
+        self._signature = FileSignature(file_path)
         self.data = self._load_data()
+        self._signature.capture()
+    
+    @property
+    def data(self) -> List[Dict[str, Any]]:
+        """현재 항목 리스트"""
+        return self._data
+    
+    @data.setter
+    def data(self, items: List[Dict[str, Any]]) -> None:
+        """항목 리스트를 교체하고 ID 인덱스를 다시 만듭니다."""
+        with self._lock:
+            self._changes += 1
+            self._data = items
+            self._positions = _build_positions(items)
+            for index in self._indexes:
+                index.rebuild(items)
+    
+    def _insert_item(self, item: Dict[str, Any]) -> None:
+        """항목을 리스트 끝에 추가하고 ID 인덱스에 등록합니다."""
+        with self._lock:
+            self._changes += 1
+            self._positions.setdefault(item["id"], len(self._data))
+            self._data.append(item)
+            for index in self._indexes:
+                index.add(item)
+    
+    def _replace_item(self, item: Dict[str, Any]) -> bool:
+        """같은 ID의 항목을 제자리에서 교체합니다."""
+        with self._lock:
+            pos = self._positions.get(item["id"])
+            if pos is None:
+                return False
+            self._changes += 1
+            old_item = self._data[pos]
+            self._data[pos] = item
+            for index in self._indexes:
+                index.remove(old_item)
+                index.add(item)
+            return True
+    
+    def _remove_item(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """ID로 항목을 O(1)에 제거합니다. (마지막 항목이 빈자리로 이동)"""
+        with self._lock:
+            removed = _swap_remove(self._data, self._positions, item_id)
+            if removed is not None:
+                self._changes += 1
+                for index in self._indexes:
+                    index.remove(removed)
+            return removed
+    
+    def reload_if_changed(self) -> bool:
+        """
+        다른 프로세스가 데이터 파일을 변경한 경우에만 다시 로드합니다.
+        
+        Returns:
+            다시 로드했는지 여부
+        """
+        if not self._signature.has_changed():
+            return False
+        
+        logger.info(f"'{self.file_path}' 파일 변경 감지, 데이터를 다시 로드합니다.")
+        # 파일은 잠금 없이 읽고, 읽는 동안 메모리 항목이 바뀌었으면 교체하지 않음
+        changes = self._changes
+        signature = self._signature.current()
+        data, repaired = self._read_data()
+        with self._lock:
+            if self._changes != changes:
+                logger.info("다시 로드하는 동안 항목이 변경되어 다음 확인 때 다시 로드합니다.")
+                return False
+            self.data = data
+            self._signature.remember(signature)
+        
+        # ID를 새로 부여한 항목은 잠금 밖에서 save()와 같은 순서로 저장
+        if repaired:
+            self.save()
+        return True
     
     def _load_data(self) -> List[Dict[str, Any]]:
-        """파일에서 데이터 로드"""
+        """파일에서 데이터 로드 (정리된 항목이 있으면 파일에 다시 저장)"""
+        data, repaired = self._read_data()
+        if repaired:
+            self._save_to_file(data)
+            logger.info("유효한 데이터만 다시 파일에 저장했습니다.")
+        return data
+    
+    def _read_data(self) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        파일에서 데이터를 읽습니다. (파일에 다시 저장하지 않음)
+        
+        Returns:
+            (유효한 항목 리스트, ID 부여나 유효하지 않은 항목 제외로 다시 저장이 필요한지 여부)
+        """
         data = []
+        repaired = False
         
         # 파일이 위치할 디렉토리가 없으면 생성
         os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
@@ -49,25 +288,32 @@ class BaseStorage:
                         data = json.loads(content)
                     else:
                         logger.warning(f"'{self.file_path}' 파일이 비어 있습니다.")
-                        return []
+                        return [], False
                 
                 logger.info(f"'{self.file_path}'에서 {len(data)}개의 항목을 로드했습니다.")
                 
                 # 데이터 유효성 검사
                 valid_data = []
+                missing_ids = 0
                 for item in data:
                     if isinstance(item, dict) and 'type' in item:
+                        # ID가 없는 항목은 인덱스에 등록할 수 있도록 ID 부여
+                        if "id" not in item:
+                            item["id"] = str(uuid.uuid4())
+                            missing_ids += 1
                         valid_data.append(item)
                     else:
                         logger.warning(f"유효하지 않은 데이터 항목 발견: {item}")
                 
-                if len(valid_data) != len(data):
+                if missing_ids:
+                    logger.warning(f"ID가 없는 {missing_ids}개의 항목에 새 ID를 부여했습니다.")
+                
+                if len(valid_data) != len(data) or missing_ids:
                     logger.warning(f"{len(data) - len(valid_data)}개의 유효하지 않은 항목이 제외되었습니다.")
                     data = valid_data
                     
                     # 유효하지 않은 항목이 있었다면 파일 다시 저장
-                    self._save_to_file(data)
-                    logger.info("유효한 데이터만 다시 파일에 저장했습니다.")
+                    repaired = True
                     
             except json.JSONDecodeError as e:
                 logger.error(f"'{self.file_path}' 파일의 JSON 형식이 올바르지 않습니다: {e}")
@@ -82,7 +328,7 @@ class BaseStorage:
             # 빈 파일 생성
             self._create_empty_json_file()
         
-        return data
+        return data, repaired
     
     def _backup_corrupted_file(self) -> str:
         """
@@ -131,11 +377,13 @@ class BaseStorage:
             file_path = self.file_path
             
         try:
-            # 파일이 위치할 디렉토리가 없으면 생성
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 임시 파일에 쓴 뒤 교체하므로 쓰는 도중 종료되어도 반쯤 쓰인 파일이 남지 않음
+            with self._file_lock:
+                written = write_json_atomic(file_path, data)
+                
+                # 자체 저장은 외부 변경으로 감지하지 않도록 쓴 내용으로 시그니처 갱신
+                if file_path == self.file_path and hasattr(self, "_signature"):
+                    self._signature.remember(written)
             logger.info(f"{len(data)}개의 항목을 '{file_path}'에 저장했습니다.")
             return True
         except Exception as e:
@@ -149,7 +397,24 @@ class BaseStorage:
         Returns:
             저장 성공 여부
         """
-        return self._save_to_file(self.data)
+        # 스냅샷과 쓰기를 함께 직렬화하여 오래된 스냅샷이 나중에 기록되지 않도록 함
+        with self._file_lock:
+            with self._lock:
+                data = list(self.data)
+            return self._save_to_file(data)
+    
+    def _persist(self, op: str, **payload: Any) -> bool:
+        """
+        항목 변경 사항을 영구 저장합니다. 기본 동작은 전체 파일 저장입니다.
+        
+        Args:
+            op: 변경 연산 유형 (JournalOp)
+            **payload: 변경 내용 (item 또는 item_id)
+            
+        Returns:
+            저장 성공 여부
+        """
+        return self.save()
     
     def get_all(self) -> List[Dict[str, Any]]:
         """
@@ -170,10 +435,8 @@ class BaseStorage:
         Returns:
             항목 데이터 또는 None (없을 경우)
         """
-        for item in self.data:
-            if isinstance(item, dict) and item.get("id") == item_id:
-                return item
-        return None
+        pos = self._positions.get(item_id)
+        return self._data[pos] if pos is not None else None
     
     def add(self, item: Dict[str, Any]) -> str:
         """
@@ -195,8 +458,8 @@ class BaseStorage:
             item["created_at"] = now
         item["updated_at"] = now
             
-        self.data.append(item)
-        self.save()
+        self._insert_item(item)
+        self._persist(JournalOp.PUT, item=item)
         return item["id"]
     
     def update(self, item: Dict[str, Any]) -> bool:
@@ -214,18 +477,18 @@ class BaseStorage:
             return False
             
         item_id = item["id"]
+        existing_item = self.get_by_id(item_id)
         
-        for i, existing_item in enumerate(self.data):
-            if isinstance(existing_item, dict) and existing_item.get("id") == item_id:
-                # 수정일 업데이트
-                item["updated_at"] = datetime.now().isoformat()
-                # 생성일 보존
-                if "created_at" in existing_item and "created_at" not in item:
-                    item["created_at"] = existing_item["created_at"]
-                
-                self.data[i] = item
-                self.save()
-                return True
+        if existing_item is not None:
+            # 수정일 업데이트
+            item["updated_at"] = datetime.now().isoformat()
+            # 생성일 보존
+            if "created_at" in existing_item and "created_at" not in item:
+                item["created_at"] = existing_item["created_at"]
+            
+            self._replace_item(item)
+            self._persist(JournalOp.PUT, item=item)
+            return True
                 
         logger.warning(f"업데이트할 항목을 찾을 수 없음: {item_id}")
         return False
@@ -240,11 +503,9 @@ class BaseStorage:
         Returns:
             삭제 성공 여부
         """
-        for i, item in enumerate(self.data):
-            if isinstance(item, dict) and item.get("id") == item_id:
-                self.data.pop(i)
-                self.save()
-                return True
+        if self._remove_item(item_id) is not None:
+            self._persist(JournalOp.DELETE, item_id=item_id)
+            return True
                 
         logger.warning(f"삭제할 항목을 찾을 수 없음: {item_id}")
         return False
@@ -509,7 +770,48 @@ class TrashMixin:
             trash_path: 휴지통 파일 경로
         """
         self.trash_path = trash_path
+        self._lock = getattr(self, "_lock", None) or threading.RLock()
+        self._file_lock = getattr(self, "_file_lock", None) or threading.RLock()
+        self._changes = getattr(self, "_changes", 0)
+        self._trash_signature = FileSignature(trash_path)
         self.trash_data = self._load_trash_data()
+        self._trash_signature.capture()
+    
+    @property
+    def trash_data(self) -> List[Dict[str, Any]]:
+        """현재 휴지통 항목 리스트"""
+        return self._trash_data
+    
+    @trash_data.setter
+    def trash_data(self, items: List[Dict[str, Any]]) -> None:
+        """휴지통 항목 리스트를 교체하고 ID 인덱스를 다시 만듭니다."""
+        with self._lock:
+            self._changes += 1
+            self._trash_data = items
+            self._trash_positions = _build_positions(items)
+    
+    def reload_trash_if_changed(self) -> bool:
+        """
+        다른 프로세스가 휴지통 파일을 변경한 경우에만 다시 로드합니다.
+        
+        Returns:
+            다시 로드했는지 여부
+        """
+        if not self._trash_signature.has_changed():
+            return False
+        
+        logger.info(f"'{self.trash_path}' 파일 변경 감지, 휴지통 데이터를 다시 로드합니다.")
+        # 파일은 잠금 없이 읽고, 읽는 동안 휴지통이 바뀌었으면 교체하지 않음
+        changes = self._changes
+        signature = self._trash_signature.current()
+        trash_data = self._load_trash_data()
+        with self._lock:
+            if self._changes != changes:
+                logger.info("다시 로드하는 동안 항목이 변경되어 다음 확인 때 다시 로드합니다.")
+                return False
+            self.trash_data = trash_data
+            self._trash_signature.remember(signature)
+        return True
     
     def _load_trash_data(self) -> List[Dict[str, Any]]:
         """휴지통 데이터 로드"""
@@ -568,17 +870,29 @@ class TrashMixin:
             저장 성공 여부
         """
         try:
-            # 파일이 위치할 디렉토리가 없으면 생성
-            os.makedirs(os.path.dirname(self.trash_path), exist_ok=True)
-            
-            with open(self.trash_path, 'w', encoding='utf-8') as f:
-                json.dump(self.trash_data, f, ensure_ascii=False, indent=2)
-            logger.info(f"{len(self.trash_data)}개의 휴지통 항목을 '{self.trash_path}'에 저장했습니다.")
+            with self._file_lock:
+                with self._lock:
+                    trash_data = list(self.trash_data)
+                self._trash_signature.remember(write_json_atomic(self.trash_path, trash_data))
+            logger.info(f"{len(trash_data)}개의 휴지통 항목을 '{self.trash_path}'에 저장했습니다.")
             return True
         except Exception as e:
             logger.error(f"휴지통 데이터 저장 중 오류: {str(e)}")
             return False
     
+    def _persist_trash(self, op: str, **payload: Any) -> bool:
+        """
+        휴지통 변경 사항을 영구 저장합니다. 기본 동작은 휴지통 파일 전체 저장입니다.
+        
+        Args:
+            op: 변경 연산 유형 (JournalOp)
+            **payload: 변경 내용 (item 또는 item_id)
+            
+        Returns:
+            저장 성공 여부
+        """
+        return self.save_trash()
+    
     def get_trash(self) -> List[Dict[str, Any]]:
         """
         휴지통에 있는 모든 항목을 반환합니다.
@@ -598,10 +912,8 @@ class TrashMixin:
         Returns:
             항목 데이터 또는 None (없을 경우)
         """
-        for item in self.trash_data:
-            if isinstance(item, dict) and item.get("id") == item_id:
-                return item
-        return None
+        pos = self._trash_positions.get(item_id)
+        return self._trash_data[pos] if pos is not None else None
     
     def move_to_trash(self, item_id: str, data: List[Dict[str, Any]]) -> bool:
         """
@@ -614,25 +926,39 @@ class TrashMixin:
         Returns:
             이동 성공 여부
         """
-        for i, item in enumerate(data):
+        for item in data:
             if isinstance(item, dict) and item.get("id") == item_id:
-                # 휴지통으로 이동 시간 추가
-                item["trashed_at"] = datetime.now().isoformat()
-                
-                # 휴지통으로 이동
-                self.trash_data.append(item)
-                self.save_trash()
-                
-                # 원본 위치 반환 (삭제를 위해)
-                logger.info(f"항목을 휴지통으로 이동: {item_id}")
+                self._add_to_trash(item)
                 return True
                 
         logger.warning(f"휴지통으로 이동할 항목을 찾을 수 없음: {item_id}")
         return False
     
+    def _add_to_trash(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        항목의 복사본에 휴지통 이동 시간을 기록해 휴지통에 추가합니다.
+        
+        Args:
+            item: 휴지통으로 이동할 항목 (저장된 항목은 직접 수정하지 않음)
+            
+        Returns:
+            휴지통에 추가된 항목
+        """
+        trashed_item = dict(item)
+        trashed_item["trashed_at"] = datetime.now().isoformat()
+        
+        with self._lock:
+            self._changes += 1
+            self._trash_positions.setdefault(trashed_item["id"], len(self._trash_data))
+            self._trash_data.append(trashed_item)
+        self._persist_trash(JournalOp.TRASH, item=trashed_item)
+        
+        logger.info(f"항목을 휴지통으로 이동: {trashed_item['id']}")
+        return trashed_item
+    
     def restore_from_trash(self, item_id: str) -> Optional[Dict[str, Any]]:
         """
-        휴지통에서 항목을 복원합니다.
+        휴지통에서 항목을 꺼내 반환합니다. (데이터 목록에 다시 넣는 것은 호출한 쪽의 몫)
         
         Args:
             item_id: 복원할 항목 ID
@@ -640,22 +966,37 @@ class TrashMixin:
         Returns:
             복원된 항목 또는 None (실패 시)
         """
-        for i, item in enumerate(self.trash_data):
-            if isinstance(item, dict) and item.get("id") == item_id:
-                # 휴지통 정보 제거
-                if "trashed_at" in item:
-                    del item["trashed_at"]
-                
-                # 복원 시간 업데이트
-                item["restored_at"] = datetime.now().isoformat()
-                item["updated_at"] = datetime.now().isoformat()
-                
-                # 휴지통에서 제거
-                restored_item = self.trash_data.pop(i)
-                self.save_trash()
-                
-                logger.info(f"항목을 휴지통에서 복원: {item_id}")
-                return restored_item
+        restored_item = self._take_from_trash(item_id)
+        if restored_item is not None:
+            # 휴지통에서 제거된 것만 기록 (저널 재생 시 데이터 목록에 다시 넣지 않음)
+            self._persist_trash(JournalOp.PURGE, item_id=item_id)
+        return restored_item
+    
+    def _take_from_trash(self, item_id: str) -> Optional[Dict[str, Any]]:
+        """
+        휴지통에서 항목을 제거하고 복원용 복사본을 반환합니다. (영구 저장은 하지 않음)
+        
+        Args:
+            item_id: 복원할 항목 ID
+            
+        Returns:
+            휴지통 정보를 지우고 복원 시간을 기록한 항목 또는 None (휴지통에 없는 경우)
+        """
+        with self._lock:
+            item = _swap_remove(self._trash_data, self._trash_positions, item_id)
+            self._changes += 1
+        
+        if item is not None:
+            # 휴지통 정보 제거 (저장된 항목은 직접 수정하지 않음)
+            restored_item = dict(item)
+            restored_item.pop("trashed_at", None)
+            
+            # 복원 시간 업데이트
+            restored_item["restored_at"] = datetime.now().isoformat()
+            restored_item["updated_at"] = datetime.now().isoformat()
+            
+            logger.info(f"항목을 휴지통에서 복원: {item_id}")
+            return restored_item
                 
         logger.warning(f"복원할 항목을 휴지통에서 찾을 수 없음: {item_id}")
         return None
@@ -669,7 +1010,7 @@ class TrashMixin:
         """
         count = len(self.trash_data)
         self.trash_data = []
-        self.save_trash()
+        self._persist_trash(JournalOp.EMPTY_TRASH)
         logger.info(f"휴지통 비우기 완료: {count}개 항목 삭제")
         return count
     
@@ -683,12 +1024,14 @@ class TrashMixin:
         Returns:
             삭제 성공 여부
         """
-        for i, item in enumerate(self.trash_data):
-            if isinstance(item, dict) and item.get("id") == item_id:
-                self.trash_data.pop(i)
-                self.save_trash()
-                logger.info(f"휴지통에서 항목 영구 삭제: {item_id}")
-                return True
+        with self._lock:
+            removed = _swap_remove(self._trash_data, self._trash_positions, item_id)
+            self._changes += 1
+        
+        if removed is not None:
+            self._persist_trash(JournalOp.PURGE, item_id=item_id)
+            logger.info(f"휴지통에서 항목 영구 삭제: {item_id}")
+            return True
                 
         logger.warning(f"휴지통에서 삭제할 항목을 찾을 수 없음: {item_id}")
         return False
@@ -700,7 +1043,9 @@ class ContentStorage(BaseStorage, BackupMixin, TrashMixin):
     """
     
     def __init__(self, file_path: Optional[Path] = None, trash_path: Optional[Path] = None, 
-                 backup_dir: Optional[Path] = None, max_backups: int = None):
+                 backup_dir: Optional[Path] = None, max_backups: int = None,
+                 journal_path: Optional[Path] = None, use_journal: Optional[bool] = None,
+                 write_behind: Optional[bool] = None):
         """
         ContentStorage 초기화
         
@@ -709,6 +1054,10 @@ class ContentStorage(BaseStorage, BackupMixin, TrashMixin):
             trash_path: 휴지통 파일 경로 (기본값: DATA_DIR/trash.json)
             backup_dir: 백업 디렉토리 경로 (기본값: DATA_DIR/backups)
             max_backups: 유지할 최대 백업 수 (기본값: AppConfig.MAX_BACKUPS)
+            journal_path: 저널 파일 경로 (기본값: Files.JOURNAL)
+            use_journal: 저널 모드 사용 여부 (기본값: AppConfig.STORAGE_JOURNAL)
+            write_behind: 지연 쓰기 사용 여부 (기본값: AppConfig.STORAGE_WRITE_BEHIND,
+                저널 모드에서는 사용하지 않음)
         """
         # 기본 값 설정
         self.file_path = file_path or Files.CONFIRM
@@ -716,14 +1065,189 @@ class ContentStorage(BaseStorage, BackupMixin, TrashMixin):
         backup_dir = backup_dir or Directories.BACKUPS
         max_backups = max_backups or AppConfig.MAX_BACKUPS
         
+        # 검색어 조회용 n-gram 역색인과 필터용 패싯 집계
+        self._search_index = NgramIndex()
+        self._facet_index = FacetIndex()
+        
+        # 목록 페이지용 정렬 필드별 색인
+        self._sorted_indexes = {field: SortedIndex(field) for field in SORT_FIELDS}
+        
         # 부모 클래스 초기화
-        BaseStorage.__init__(self, self.file_path)
+        BaseStorage.__init__(self, self.file_path,
+                             indexes=[self._search_index, self._facet_index, *self._sorted_indexes.values()])
         BackupMixin.__init__(self, backup_dir, max_backups)
         TrashMixin.__init__(self, trash_path)
         
+        # 저널 모드: 스냅샷 로드 후 저널 재생
+        if use_journal is None:
+            use_journal = AppConfig.STORAGE_JOURNAL
+        self.journal: Optional[StorageJournal] = None
+        self._compaction_lock = threading.Lock()
+        self._compaction_thread: Optional[threading.Thread] = None
+        if use_journal:
+            self.journal = StorageJournal(journal_path or Files.JOURNAL, fsync=AppConfig.JOURNAL_FSYNC)
+            self._journal_signature = FileSignature(self.journal.path)
+            replayed = self._replay_journal()
+            self._journal_signature.capture(hash_content=False)
+            logger.info(f"저널 모드 활성화: {replayed}개의 저널 레코드를 재생했습니다.")
+            self._maybe_compact()
+        
+        # 지연 쓰기: 변경은 표시만 하고 백그라운드에서 묶어서 저장
+        if write_behind is None:
+            write_behind = AppConfig.STORAGE_WRITE_BEHIND
+        self._write_behind: Optional[WriteBehindFlusher] = None
+        if write_behind and self.journal is None:
+            self._write_behind = WriteBehindFlusher(
+                {"data": self.save, "trash": self.save_trash},
+                window=AppConfig.WRITE_BEHIND_WINDOW_MS / 1000,
+                max_pending=AppConfig.WRITE_BEHIND_MAX_PENDING,
+            )
+            logger.info(f"지연 쓰기 활성화: {AppConfig.WRITE_BEHIND_WINDOW_MS}ms 또는 "
+                        f"{AppConfig.WRITE_BEHIND_MAX_PENDING}건 단위로 저장합니다.")
+        
         # 백업 실행 (AppConfig.AUTO_BACKUP이 True인 경우)
         if AppConfig.AUTO_BACKUP:
             self._create_auto_backup(self.data)
+    
+    @staticmethod
+    def _keyed(items: List[Dict[str, Any]]) -> Dict[Any, Dict[str, Any]]:
+        """항목 리스트를 순서를 유지한 ID 키 딕셔너리로 변환합니다."""
+        keyed = {}
+        for i, item in enumerate(items):
+            item_id = item.get("id") if isinstance(item, dict) else None
+            # ID가 없는 항목은 위치 기반 키로 보존
+            keyed[item_id if item_id is not None else ("", i)] = item
+        return keyed
+    
+    def _replay_journal(self) -> int:
+        """
+        스냅샷 데이터 위에 저널 레코드를 순서대로 재생합니다.
+        
+        Returns:
+            재생된 레코드 수
+        """
+        live = self._keyed(self.data)
+        trash = self._keyed(self.trash_data)
+        count = 0
+        
+        for record in self.journal.replay():
+            op = record.get("op")
+            item = record.get("item") if isinstance(record.get("item"), dict) else None
+            item_id = record.get("item_id") or (item.get("id") if item else None)
+            
+            if op == JournalOp.PUT and item:
+                live[item_id] = item
+            elif op == JournalOp.DELETE:
+                live.pop(item_id, None)
+            elif op == JournalOp.TRASH and item:
+                live.pop(item_id, None)
+                trash[item_id] = item
+            elif op == JournalOp.RESTORE:
+                trash.pop(item_id, None)
+                if item:
+                    live[item_id] = item
+            elif op == JournalOp.PURGE:
+                trash.pop(item_id, None)
+            elif op == JournalOp.EMPTY_TRASH:
+                trash.clear()
+            else:
+                logger.warning(f"알 수 없는 저널 레코드를 건너뜁니다: {op}")
+                continue
+            count += 1
+        
+        self.data = list(live.values())
+        self.trash_data = list(trash.values())
+        return count
+    
+    def _append_journal(self, op: str, **payload: Any) -> bool:
+        """저널에 레코드를 추가하고 필요하면 백그라운드 압축을 시작합니다."""
+        with self.journal.lock:
+            success = self.journal.append(op, **payload)
+            # 자체 기록은 외부 변경으로 감지하지 않도록 시그니처 갱신
+            self._journal_signature.capture(hash_content=False)
+        
+        self._maybe_compact()
+        return success
+    
+    def _persist(self, op: str, **payload: Any) -> bool:
+        """
+        항목 변경 사항을 영구 저장합니다.
+        
+        저널 모드에서는 변경된 항목 하나만 저널에 추가하고, 지연 쓰기 모드에서는
+        변경 표시만 남기며, 그렇지 않으면 전체 파일을 저장합니다.
+        """
+        if self.journal is not None:
+            return self._append_journal(op, **payload)
+        if self._write_behind is not None:
+            self._write_behind.mark_dirty("data")
+            return True
+        return self.save()
+    
+    def _persist_trash(self, op: str, **payload: Any) -> bool:
+        """
+        휴지통 변경 사항을 영구 저장합니다.
+        
+        저널 모드에서는 변경 레코드 하나만 저널에 추가하고, 지연 쓰기 모드에서는
+        변경 표시만 남기며, 그렇지 않으면 휴지통 파일 전체를 저장합니다.
+        """
+        if self.journal is not None:
+            return self._append_journal(op, **payload)
+        if self._write_behind is not None:
+            self._write_behind.mark_dirty("trash")
+            return True
+        return self.save_trash()
+    
+    def _maybe_compact(self) -> None:
+        """저널이 임계값을 넘었으면 백그라운드 스레드에서 압축을 시작합니다."""
+        if self.journal is None:
+            return
+        if not self.journal.needs_compaction(AppConfig.JOURNAL_MAX_RECORDS, AppConfig.JOURNAL_MAX_BYTES):
+            return
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return
+        
+        self._compaction_thread = threading.Thread(
+            target=self.compact, name="storage-compactor", daemon=True
+        )
+        self._compaction_thread.start()
+    
+    def compact(self) -> bool:
+        """
+        저널 내용을 스냅샷 파일(데이터/휴지통)에 반영하고 저널을 비웁니다.
+        
+        스냅샷 복사와 저널 교체는 저널 잠금 안에서 함께 수행되므로,
+        압축 중에 들어온 변경은 새 저널에 기록되어 유실되지 않습니다.
+        
+        Returns:
+            압축 성공 여부
+        """
+        if self.journal is None:
+            return self.save() and self.save_trash()
+        
+        with self._compaction_lock:
+            with self._lock, self.journal.lock:
+                data = list(self.data)
+                trash_data = list(self.trash_data)
+                self.journal.rotate()
+                self._journal_signature.capture(hash_content=False)
+            
+            try:
+                if AppConfig.AUTO_BACKUP:
+                    self._create_auto_backup(data)
+                written = write_json_atomic(self.file_path, data)
+                trash_written = write_json_atomic(self.trash_path, trash_data)
+            except Exception as e:
+                # 교체된 저널은 남겨두고 다음 압축/재시작 때 다시 반영
+                logger.error(f"저널 압축 중 오류: {str(e)}")
+                return False
+            
+            with self.journal.lock:
+                self._signature.remember(written)
+                self._trash_signature.remember(trash_written)
+                self.journal.discard_rotated()
+            
+            logger.info(f"저널 압축 완료: 항목 {len(data)}개, 휴지통 {len(trash_data)}개")
+            return True
             
     def save(self) -> bool:
         """
@@ -739,6 +1263,85 @@ class ContentStorage(BaseStorage, BackupMixin, TrashMixin):
         # 파일에 저장
         return BaseStorage.save(self)
     
+    def refresh(self) -> bool:
+        """
+        데이터 파일과 휴지통 파일 중 외부에서 변경된 것만 다시 로드합니다.
+        
+        Returns:
+            하나라도 다시 로드했는지 여부
+        """
+        if self.journal is not None:
+            return self._refresh_journaled()
+        
+        # 아직 파일에 반영되지 않은 변경이 있으면 메모리 상태가 최신
+        # (다시 로드는 잠금 밖에서 하고, 그 사이의 변경은 reload_*_if_changed가 감지)
+        with self._lock:
+            if self._write_behind is not None and not self._write_behind.idle:
+                return False
+        
+        data_reloaded = self.reload_if_changed()
+        trash_reloaded = self.reload_trash_if_changed()
+        return data_reloaded or trash_reloaded
+    
+    def flush(self) -> bool:
+        """
+        지연 쓰기 모드에서 대기 중인 변경을 즉시 파일에 저장합니다.
+        
+        Returns:
+            저장 성공 여부
+        """
+        if self._write_behind is None:
+            return True
+        return self._write_behind.flush()
+    
+    def close(self) -> bool:
+        """
+        백그라운드 작업을 정리하고 대기 중인 변경을 저장합니다.
+        애플리케이션 종료 시 호출합니다.
+        
+        Returns:
+            저장 성공 여부
+        """
+        if self._compaction_thread is not None:
+            self._compaction_thread.join()
+        if self._write_behind is None:
+            return True
+        return self._write_behind.close()
+    
+    def _refresh_journaled(self) -> bool:
+        """
+        저널 모드에서 스냅샷 또는 저널이 외부에서 변경되었으면 전체를 다시 로드합니다.
+        
+        잠금은 압축(compact) 및 쓰기 경로와 같은 순서(압축 → 항목 → 저널)로 잡습니다.
+        """
+        # 자체 압축이 진행 중이면 파일 변경은 우리 쓰기이므로 건너뜀
+        if not self._compaction_lock.acquire(blocking=False):
+            return False
+        
+        try:
+            with self._lock, self.journal.lock:
+                signatures = (self._signature, self._trash_signature, self._journal_signature)
+                if not any([signature.has_changed() for signature in signatures]):
+                    return False
+                
+                logger.info("저장소 파일 변경 감지, 스냅샷과 저널을 다시 로드합니다.")
+                data, repaired = self._read_data()
+                self.data = data
+                self.trash_data = self._load_trash_data()
+                self.journal.refresh_stats()
+                self._replay_journal()
+                
+                self._signature.capture()
+                self._trash_signature.capture()
+                self._journal_signature.capture(hash_content=False)
+        finally:
+            self._compaction_lock.release()
+        
+        # ID를 새로 부여한 항목은 잠금을 놓은 뒤 압축으로 스냅샷에 반영
+        if repaired:
+            self.compact()
+        return True
+    
     def save_content(self, content: Dict[str, Any]) -> str:
         """
         콘텐츠를 저장합니다. (기존 항목 업데이트 또는 새 항목 추가)
@@ -765,16 +1368,20 @@ class ContentStorage(BaseStorage, BackupMixin, TrashMixin):
         Returns:
             이동 성공 여부
         """
-        # 휴지통으로 이동
-        if self.move_to_trash(content_id, self.data):
-            # 원본 삭제
-            for i, item in enumerate(self.data):
-                if isinstance(item, dict) and item.get("id") == content_id:
-                    self.data.pop(i)
-                    self.save()
-                    return True
+        # 압축 스냅샷이 이동 중간 상태를 보지 않도록 잠금 안에서 처리
+        with self._lock:
+            item = self.get_by_id(content_id)
+            if item is None:
+                logger.warning(f"휴지통으로 이동할 항목을 찾을 수 없음: {content_id}")
+                return False
+            
+            # 휴지통으로 이동 후 원본 삭제 (저널 모드에서는 trash 레코드가 원본 삭제까지 나타냄)
+            self._add_to_trash(item)
+            self._remove_item(content_id)
         
-        return False
+        if self.journal is None:
+            self._persist(JournalOp.DELETE, item_id=content_id)
+        return True
     
     def restore(self, content_id: str) -> bool:
         """
@@ -786,30 +1393,60 @@ class ContentStorage(BaseStorage, BackupMixin, TrashMixin):
         Returns:
             복원 성공 여부
         """
-        restored_item = self.restore_from_trash(content_id)
-        if restored_item:
-            # 복원된 항목 추가
-            self.data.append(restored_item)
-            self.save()
-            return True
+        # 압축 스냅샷이 이동 중간 상태를 보지 않도록 잠금 안에서 처리
+        with self._lock:
+            restored_item = self._take_from_trash(content_id)
+            if not restored_item:
+                return False
+            
+            # 복원된 항목 추가 (저널 모드에서는 restore 레코드 하나가 휴지통 제거와 복원을 함께 나타냄)
+            self._insert_item(restored_item)
+            if self.journal is not None:
+                self._persist_trash(JournalOp.RESTORE, item=restored_item)
         
-        return False
+        if self.journal is None:
+            self._persist_trash(JournalOp.PURGE, item_id=content_id)
+            self._persist(JournalOp.PUT, item=restored_item)
+        return True
     
     def search_contents(self, query: str = None, content_type: str = None, 
-                       level: str = None) -> List[Dict[str, Any]]:
+                       level: str = None, ranked: bool = False, sort: Optional[str] = None,
+                       descending: bool = True, limit: Optional[int] = None,
+                       cursor: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         콘텐츠를 검색합니다.
         
+        검색어가 있으면 n-gram 역색인으로 후보를 찾은 뒤 실제 일치 여부를 확인합니다.
+        정렬 필드를 지정하면 미리 정렬된 색인에서 커서 다음 위치부터 limit개만 읽습니다.
+        
         Args:
             query: 검색어 (기본값: None)
             content_type: 콘텐츠 유형 필터 (기본값: None)
             level: 콘텐츠 레벨 필터 (기본값: None)
+            ranked: 검색어가 있을 때 관련도 순으로 정렬할지 여부 (기본값: False, 저장 순서)
+            sort: 정렬 필드 (SORT_FIELDS 중 하나, 기본값: None이면 저장 순서)
+            descending: 내림차순 정렬 여부 (기본값: True)
+            limit: 반환할 최대 항목 수 (기본값: None, 전체)
+            cursor: 이전 페이지의 next_cursor (sort 지정 시에만 사용)
             
         Returns:
             검색 결과 목록
+            
+        Raises:
+            ValueError: 지원하지 않는 정렬 필드이거나 커서가 잘못된 경우
         """
-        # 기본 결과 (모든 항목)
-        results = self.data
+        if sort is not None:
+            return [item for _, item in self._iter_sorted(query, content_type, level, sort,
+                                                          descending, limit, cursor)]
+        
+        with self._lock:
+            if query:
+                results = self._search_index.search(query, ranked=ranked)
+                if not ranked:
+                    results.sort(key=lambda item: self._positions.get(item["id"], 0))
+            else:
+                # 기본 결과 (모든 항목)
+                results = self.data
         
         # 필터 적용
         if content_type:
@@ -818,54 +1455,113 @@ class ContentStorage(BaseStorage, BackupMixin, TrashMixin):
         if level:
             results = [item for item in results if isinstance(item, dict) and item.get("level") == level]
         
-        # 텍스트 검색
-        if query:
-            query_results = []
-            query = query.lower()
+        if limit is not None:
+            results = results[:limit]
+        
+        return results
+    
+    def _iter_sorted(self, query: Optional[str], content_type: Optional[str], level: Optional[str],
+                     sort: str, descending: bool, limit: Optional[int],
+                     cursor: Optional[str]) -> List[Tuple[Tuple[str, str, str], Dict[str, Any]]]:
+        """
+        정렬 순서로 필터를 적용해 (정렬 키, 항목) 목록을 최대 limit개 반환합니다.
+        
+        검색어가 없으면 정렬 색인을 커서 위치부터 순회하므로 페이지 크기에 비례하는
+        만큼만 읽고, 검색어가 있으면 역색인 결과만 정렬합니다.
+        """
+        if sort not in SORT_FIELDS:
+            raise ValueError(f"지원하지 않는 정렬 기준입니다: {sort}")
+        after = decode_cursor(cursor, sort) if cursor else None
+        
+        page: List[Tuple[Tuple[str, str, str], Dict[str, Any]]] = []
+        if limit is not None and limit <= 0:
+            return page
+        
+        with self._lock:
+            if query:
+                matched = self._search_index.search(query)
+                keyed = sorted(((sort_key(item, sort), item) for item in matched), key=lambda pair: pair[0])
+                entries = page_by_key(keyed, after, descending)
+            else:
+                entries = self._sorted_indexes[sort].iter_from(after, descending)
             
-            for item in results:
-                if not isinstance(item, dict):
+            for key, item in entries:
+                if content_type and item.get("type") != content_type:
                     continue
-                
-                # 검색 필드: topic, title, situation, place, keywords
-                searchable_fields = ['topic', 'title', 'situation', 'place']
-                
-                # 각 필드 검색
-                item_matches = False
-                
-                # 텍스트 필드 검색
-                for field in searchable_fields:
-                    if field in item and isinstance(item[field], str) and query in item[field].lower():
-                        item_matches = True
-                        break
-                
-                # 키워드 검색
-                if not item_matches and 'keywords' in item and isinstance(item['keywords'], list):
-                    for keyword in item['keywords']:
-                        if isinstance(keyword, str) and query in keyword.lower():
-                            item_matches = True
-                            break
-                
-                # 대화 검색
-                if not item_matches and 'dialogue' in item and isinstance(item['dialogue'], list):
-                    for line in item['dialogue']:
-                        if isinstance(line, str) and query in line.lower():
-                            item_matches = True
-                            break
-                
-                # 텍스트/스크립트 검색
-                if not item_matches:
-                    for field in ['text', 'script']:
-                        if field in item and isinstance(item[field], str) and query in item[field].lower():
-                            item_matches = True
-                            break
-                
-                if item_matches:
-                    query_results.append(item)
+                if level and item.get("level") != level:
+                    continue
+                page.append((key, item))
+                if limit is not None and len(page) >= limit:
+                    break
+        
+        return page
+    
+    def search_page(self, query: str = None, content_type: str = None, level: str = None,
+                    sort: str = "created_at", descending: bool = True, limit: int = 50,
+                    cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        콘텐츠 목록의 한 페이지를 반환합니다.
+        
+        Args:
+            query: 검색어 (기본값: None)
+            content_type: 콘텐츠 유형 필터 (기본값: None)
+            level: 콘텐츠 레벨 필터 (기본값: None)
+            sort: 정렬 필드 (기본값: created_at)
+            descending: 내림차순 정렬 여부 (기본값: True)
+            limit: 페이지 크기 (기본값: 50)
+            cursor: 이전 페이지의 next_cursor (기본값: None, 첫 페이지)
             
-            results = query_results
+        Returns:
+            {"items": 항목 목록, "next_cursor": 다음 페이지 커서 또는 None, "total": 전체 결과 수}
+        """
+        # 한 개를 더 읽어 다음 페이지 존재 여부를 확인
+        entries = self._iter_sorted(query, content_type, level, sort, descending, limit + 1, cursor)
+        has_more = len(entries) > limit
+        entries = entries[:limit]
         
-        return results
+        return {
+            "items": [item for _, item in entries],
+            "next_cursor": encode_cursor(sort, entries[-1][0]) if has_more and entries else None,
+            "total": self.count_contents(query, content_type, level),
+        }
+    
+    def count_contents(self, query: str = None, content_type: str = None, level: str = None) -> int:
+        """
+        검색 조건에 맞는 콘텐츠 수를 반환합니다.
+        
+        검색어가 없으면 패싯 집계에서 바로 계산합니다.
+        
+        Args:
+            query: 검색어 (기본값: None)
+            content_type: 콘텐츠 유형 필터 (기본값: None)
+            level: 콘텐츠 레벨 필터 (기본값: None)
+            
+        Returns:
+            결과 수
+        """
+        if query:
+            return len(self.search_contents(query, content_type, level))
+        
+        with self._lock:
+            if not content_type and not level:
+                return len(self._data)
+            facets = self._facet_index.snapshot()
+        
+        if content_type and level:
+            return facets["type_levels"].get(content_type, {}).get(level, 0)
+        if content_type:
+            return facets["types"].get(content_type, 0)
+        return facets["levels"].get(level, 0)
+    
+    def facets(self) -> Dict[str, Any]:
+        """
+        유형별, 레벨별, 유형×레벨별 콘텐츠 수를 반환합니다.
+        
+        Returns:
+            {"types": {...}, "levels": {...}, "type_levels": {유형: {레벨: 수}}}
+        """
+        with self._lock:
+            return self._facet_index.snapshot()
     
     def restore_from_backup(self, backup_path: str) -> Tuple[int, str]:
         """
@@ -902,9 +1598,12 @@ class ContentStorage(BaseStorage, BackupMixin, TrashMixin):
                     
                     valid_items.append(item)
             
-            # 데이터 교체 및 저장
+            # 데이터 교체 및 저장 (저널 모드에서는 이전 저널이 재생되지 않도록 압축)
             self.data = valid_items
-            self.save()
+            if self.journal is not None:
+                self.compact()
+            else:
+                self.save()
             
             return len(valid_items), os.path.basename(pre_restore_backup) if pre_restore_backup else ""
             
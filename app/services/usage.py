@@ -0,0 +1,182 @@
+"""
+GPT 사용량 기록 서비스
+
+GPT 호출마다 토큰 사용량, 지연 시간, 모델, 콘텐츠 유형/레벨, 결과를
+추가 전용(append-only) JSONL 로그에 한 줄씩 기록하고,
+유형/레벨/날짜별 합계와 백분위수를 집계합니다.
+"""
+
+import json
+import math
+import os
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.config import Files
+from app.utils.logger import get_logger
+
+# 모듈 로거 설정
+logger = get_logger("usage")
+
+
+class UsageOutcome:
+    """GPT 호출 결과"""
+    SUCCESS = "success"    # 응답이 그대로 JSON으로 파싱됨
+    REPAIRED = "repaired"  # 코드 블록 추출이나 오류 수정 후 파싱됨
+    FAILED = "failed"      # 호출 실패 또는 파싱 실패
+
+    ALL = (SUCCESS, REPAIRED, FAILED)
+
+
+TOKEN_FIELDS = ("prompt_tokens", "completion_tokens", "total_tokens", "cached_tokens")
+
+
+def percentile(values: List[float], p: float) -> Optional[float]:
+    """
+    정렬된 값 목록의 백분위수를 구합니다. (nearest-rank 방식)
+
+    Args:
+        values: 오름차순으로 정렬된 값 목록
+        p: 백분위 (0~100)
+
+    Returns:
+        백분위수 또는 None (값이 없는 경우)
+    """
+    if not values:
+        return None
+    rank = max(1, math.ceil(p / 100 * len(values)))
+    return values[min(rank, len(values)) - 1]
+
+
+def summarize(entries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    사용량 기록 목록의 합계와 지연 시간/토큰 백분위수를 계산합니다.
+
+    Args:
+        entries: 사용량 기록 목록
+
+    Returns:
+        calls, 결과별 횟수, 캐시/병합 횟수, 토큰 합계, latency_ms/total_tokens 백분위수를 담은 딕셔너리
+    """
+    summary: Dict[str, Any] = {"calls": 0, "cache_hits": 0, "coalesced": 0, **{outcome: 0 for outcome in UsageOutcome.ALL}}
+    for field in TOKEN_FIELDS:
+        summary[field] = 0
+    latencies: List[float] = []
+    totals: List[int] = []
+
+    for entry in entries:
+        summary["calls"] += 1
+        outcome = entry.get("outcome")
+        if outcome in UsageOutcome.ALL:
+            summary[outcome] += 1
+        if entry.get("cache_hit"):
+            summary["cache_hits"] += 1
+        if entry.get("coalesced"):
+            summary["coalesced"] += 1
+        for field in TOKEN_FIELDS:
+            summary[field] += entry.get(field) or 0
+        if entry.get("latency_ms") is not None:
+            latencies.append(entry["latency_ms"])
+        if entry.get("total_tokens") and not entry.get("cache_hit"):
+            totals.append(entry["total_tokens"])
+
+    latencies.sort()
+    totals.sort()
+    summary["latency_ms"] = {f"p{p}": percentile(latencies, p) for p in (50, 90, 99)}
+    summary["latency_ms"]["max"] = latencies[-1] if latencies else None
+    summary["tokens_per_call"] = {f"p{p}": percentile(totals, p) for p in (50, 90, 99)}
+    return summary
+
+
+class UsageLog:
+    """
+    추가 전용 JSONL 사용량 로그
+
+    기록은 한 줄 단위 append로만 이루어지며, 집계는 로그 전체를 읽어서 계산합니다.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        UsageLog 초기화
+
+        Args:
+            path: 로그 파일 경로 (기본값: Files.USAGE_LOG)
+        """
+        self.path = Path(path or Files.USAGE_LOG)
+        self._lock = threading.Lock()
+
+    def record(self, entry: Dict[str, Any]) -> None:
+        """
+        사용량 기록 한 건을 로그 끝에 추가합니다.
+
+        Args:
+            entry: 사용량 기록 (timestamp가 없으면 현재 시각 추가)
+        """
+        entry = {"timestamp": datetime.now().isoformat(), **entry}
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        try:
+            with self._lock:
+                os.makedirs(self.path.parent, exist_ok=True)
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.write(line)
+        except OSError as e:
+            logger.error(f"사용량 기록 중 오류: {str(e)}")
+
+    def read(self, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        로그의 기록을 읽습니다. 손상된 줄은 건너뜁니다.
+
+        Args:
+            since: 이 시각 이후의 기록만 반환 (기본값: None, 전체)
+
+        Returns:
+            사용량 기록 목록
+        """
+        if not self.path.exists():
+            return []
+
+        since_str = since.isoformat() if since else None
+        entries = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if since_str and entry.get("timestamp", "") < since_str:
+                    continue
+                entries.append(entry)
+        return entries
+
+    def aggregate(self, days: Optional[int] = None) -> Dict[str, Any]:
+        """
+        전체 및 유형/레벨/날짜별 사용량을 집계합니다.
+
+        Args:
+            days: 최근 며칠의 기록만 집계 (기본값: None, 전체)
+
+        Returns:
+            {"totals", "by_type", "by_level", "by_day", "by_model"} 형식의 딕셔너리
+        """
+        since = datetime.now() - timedelta(days=days) if days and days > 0 else None
+        entries = self.read(since)
+
+        groups: Dict[str, Dict[str, List[Dict[str, Any]]]] = {
+            "by_type": defaultdict(list),
+            "by_level": defaultdict(list),
+            "by_day": defaultdict(list),
+            "by_model": defaultdict(list),
+        }
+        for entry in entries:
+            groups["by_type"][entry.get("type") or "unknown"].append(entry)
+            groups["by_level"][entry.get("level") or "unknown"].append(entry)
+            groups["by_day"][entry.get("timestamp", "")[:10] or "unknown"].append(entry)
+            groups["by_model"][entry.get("model") or "unknown"].append(entry)
+
+        result: Dict[str, Any] = {"days": days, "totals": summarize(entries)}
+        for name, grouped in groups.items():
+            result[name] = {key: summarize(items) for key, items in sorted(grouped.items())}
+        return result
@@ -0,0 +1,304 @@
+"""
+웜 풀(warm pool) 서비스
+
+(유형, 레벨) 조합마다 미리 생성해 둔 검토 전 콘텐츠를 보관합니다.
+/generate 요청은 풀에서 바로 꺼내 응답하고, 풀이 최소 수량 아래로
+내려가면 백그라운드에서 다시 채웁니다.
+"""
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.config import AppConfig, Files
+from app.services.journal import write_json_atomic
+from app.services.rate_limiter import Priority
+from app.templates import TemplateType
+from app.utils.logger import get_logger
+from app.utils.models import ContentLevel, validate_content
+
+# 모듈 로거 설정
+logger = get_logger("warm_pool")
+
+PoolKey = Tuple[str, str]
+
+
+def parse_pool_sizes(spec: str) -> Dict[str, int]:
+    """
+    "dialogue=5,lecture=2" 형식의 유형별 풀 크기 설정을 해석합니다.
+
+    Args:
+        spec: 설정 문자열
+
+    Returns:
+        유형별 풀 크기
+    """
+    sizes = {}
+    for part in spec.split(","):
+        name, sep, value = part.partition("=")
+        if not sep:
+            continue
+        try:
+            sizes[name.strip()] = int(value)
+        except ValueError:
+            logger.warning(f"잘못된 웜 풀 크기 설정을 무시합니다: {part}")
+    return sizes
+
+
+class WarmPool:
+    """
+    (유형, 레벨)별 미리 생성된 콘텐츠 풀
+
+    풀의 항목 수가 low_water 미만이 되면 용량(size)까지 백그라운드에서 채웁니다.
+    풀 내용과 적중/실패 카운터는 파일에 기록되어 재시작 후에도 유지됩니다.
+    """
+
+    def __init__(self, generator: Any, path: Optional[Path] = None, size: Optional[int] = None,
+                 low_water: Optional[int] = None, concurrency: Optional[int] = None,
+                 sizes: Optional[Dict[str, int]] = None):
+        """
+        WarmPool 초기화
+
+        Args:
+            generator: ContentGenerator 인스턴스 (generate_candidates_async 사용)
+            path: 풀 저장 파일 경로 (기본값: Files.WARM_POOL)
+            size: (유형, 레벨)별 기본 풀 크기 (기본값: AppConfig.WARM_POOL_SIZE)
+            low_water: 다시 채우기 시작하는 최소 수량 (기본값: AppConfig.WARM_POOL_LOW_WATER)
+            concurrency: 동시 채우기 생성 수 (기본값: AppConfig.WARM_POOL_CONCURRENCY)
+            sizes: 유형별 풀 크기 (기본값: AppConfig.WARM_POOL_SIZES)
+        """
+        self.generator = generator
+        self.path = Path(path or Files.WARM_POOL)
+        self.size = AppConfig.WARM_POOL_SIZE if size is None else size
+        self.low_water = AppConfig.WARM_POOL_LOW_WATER if low_water is None else low_water
+        self.concurrency = max(1, concurrency or AppConfig.WARM_POOL_CONCURRENCY)
+        self.sizes = parse_pool_sizes(AppConfig.WARM_POOL_SIZES) if sizes is None else sizes
+
+        self.keys: List[PoolKey] = [(t.value, l.value) for t in TemplateType for l in ContentLevel]
+        self._pools: Dict[PoolKey, List[Dict[str, Any]]] = {key: [] for key in self.keys}
+        self._stats: Dict[PoolKey, Dict[str, int]] = {
+            key: {"hits": 0, "misses": 0, "refills": 0, "failures": 0} for key in self.keys
+        }
+        self._inflight: Dict[PoolKey, int] = {key: 0 for key in self.keys}
+
+        self._wakeup: Optional[asyncio.Event] = None
+        self._refill_task: Optional[asyncio.Task] = None
+        self._fill_tasks: Set[asyncio.Task] = set()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._persist_lock: Optional[asyncio.Lock] = None
+        self._backoff_until = 0.0
+        self._stopping = False
+
+    def capacity(self, content_type: str, level: str) -> int:
+        """(유형, 레벨)의 풀 크기를 반환합니다."""
+        return max(0, self.sizes.get(content_type, self.size))
+
+    def _load(self) -> None:
+        """저장된 풀 내용과 카운터를 불러옵니다."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"웜 풀 파일을 읽을 수 없어 빈 풀로 시작합니다: {str(e)}")
+            return
+
+        for name, items in saved.get("items", {}).items():
+            key = tuple(name.split("|", 1))
+            if key in self._pools and isinstance(items, list):
+                self._pools[key] = [item for item in items if isinstance(item, dict)]
+        for name, counters in saved.get("stats", {}).items():
+            key = tuple(name.split("|", 1))
+            if key in self._stats and isinstance(counters, dict):
+                self._stats[key].update({k: int(v) for k, v in counters.items() if k in self._stats[key]})
+
+    async def start(self) -> None:
+        """저장된 풀을 불러오고 백그라운드 채우기를 시작합니다."""
+        self._wakeup = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._persist_lock = asyncio.Lock()
+
+        await asyncio.to_thread(self._load)
+        ready = sum(len(items) for items in self._pools.values())
+
+        # API 클라이언트가 없으면 목업 콘텐츠만 생성되므로 채우지 않음 (저장된 항목은 사용)
+        if not getattr(self.generator, "client", None) and not getattr(self.generator, "async_client", None):
+            logger.warning(f"OpenAI 클라이언트가 없어 웜 풀을 채우지 않습니다. (준비된 항목 {ready}개)")
+            return
+
+        self._refill_task = asyncio.create_task(self._refill_loop())
+        self._wakeup.set()
+        logger.info(f"웜 풀 시작: {len(self.keys)}개 조합, 준비된 항목 {ready}개")
+
+    async def stop(self) -> None:
+        """백그라운드 채우기를 중지하고 풀을 기록합니다."""
+        # wait_for가 깨어나는 시점과 취소가 겹치면 취소가 무시될 수 있으므로 종료 표시를 먼저 남김
+        self._stopping = True
+        self._signal()
+        tasks = [task for task in (self._refill_task, *self._fill_tasks) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._refill_task = None
+        await self._persist()
+
+    async def pop(self, content_type: str, level: str) -> Optional[Dict[str, Any]]:
+        """
+        풀에서 항목 하나를 꺼냅니다.
+
+        Args:
+            content_type: 콘텐츠 유형
+            level: 콘텐츠 레벨
+
+        Returns:
+            준비된 콘텐츠 또는 None (풀이 비어 있거나 관리하지 않는 조합인 경우)
+        """
+        key = (content_type, level)
+        items = self._pools.get(key)
+        if items is None:
+            return None
+
+        if not items:
+            self._stats[key]["misses"] += 1
+            self._signal()
+            return None
+
+        item = items.pop(0)
+        self._stats[key]["hits"] += 1
+        if len(items) < self.low_water:
+            self._signal()
+        self._spawn(self._persist())
+        return item
+
+    async def put(self, content_type: str, level: str, content: Dict[str, Any]) -> bool:
+        """
+        외부에서 생성된 유효한 콘텐츠를 풀에 추가합니다. (풀이 가득 차면 버림)
+
+        Args:
+            content_type: 콘텐츠 유형
+            level: 콘텐츠 레벨
+            content: 추가할 콘텐츠
+
+        Returns:
+            추가 여부
+        """
+        key = (content_type, level)
+        items = self._pools.get(key)
+        if items is None or len(items) >= self.capacity(*key) or validate_content(content):
+            return False
+        items.append(content)
+        self._spawn(self._persist())
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        조합별 준비 수량과 적중/실패 카운터를 반환합니다.
+
+        Returns:
+            {"hits", "misses", "hit_rate", "ready", "pools": [...]} 형식의 딕셔너리
+        """
+        pools = []
+        for key in self.keys:
+            pools.append({
+                "qtype": key[0],
+                "level": key[1],
+                "ready": len(self._pools[key]),
+                "capacity": self.capacity(*key),
+                "refilling": self._inflight[key],
+                **self._stats[key],
+            })
+        hits = sum(pool["hits"] for pool in pools)
+        misses = sum(pool["misses"] for pool in pools)
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 3) if hits + misses else None,
+            "ready": sum(pool["ready"] for pool in pools),
+            "pools": pools,
+        }
+
+    def _spawn(self, coro: Any) -> asyncio.Task:
+        """stop()에서 정리할 수 있도록 백그라운드 태스크를 등록합니다."""
+        task = asyncio.create_task(coro)
+        self._fill_tasks.add(task)
+        task.add_done_callback(self._fill_tasks.discard)
+        return task
+
+    def _signal(self) -> None:
+        """백그라운드 채우기를 깨웁니다."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _refill_loop(self) -> None:
+        """최소 수량 아래로 내려간 조합을 용량까지 채웁니다."""
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=AppConfig.WARM_POOL_CHECK_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            if self._stopping:
+                return
+            self._wakeup.clear()
+
+            # 연속 실패 후에는 잠시 쉬었다가 다시 시도
+            delay = self._backoff_until - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            for key in self.keys:
+                ready = len(self._pools[key]) + self._inflight[key]
+                if ready >= self.low_water and ready > 0:
+                    continue
+                for _ in range(self.capacity(*key) - ready):
+                    self._inflight[key] += 1
+                    self._spawn(self._fill_one(key))
+
+    async def _fill_one(self, key: PoolKey) -> None:
+        """
+        항목을 생성해 풀에 추가합니다.
+
+        후보를 여러 개 생성하도록 설정된 경우(AIConfig.GENERATION_CANDIDATES) 한 번의 호출로
+        얻은 유효한 후보를 용량까지 모두 추가합니다.
+        """
+        try:
+            async with self._semaphore:
+                candidates = await self.generator.generate_candidates_async(
+                    *key, use_cache=False, priority=Priority.BACKGROUND
+                )
+        except Exception as e:
+            candidates = [{"error": str(e)}]
+        finally:
+            self._inflight[key] -= 1
+
+        error = validate_content(candidates[0])
+        if error:
+            self._stats[key]["failures"] += 1
+            self._backoff_until = time.monotonic() + AppConfig.WARM_POOL_RETRY_DELAY
+            logger.warning(f"웜 풀 채우기 실패 ({key[0]} / {key[1]}): {error[:200]}")
+            return
+
+        items = self._pools[key]
+        for index, content in enumerate(candidates):
+            if index and len(items) + self._inflight[key] >= self.capacity(*key):
+                break
+            if validate_content(content) is None:
+                items.append(content)
+                self._stats[key]["refills"] += 1
+        await self._persist()
+
+    async def _persist(self) -> None:
+        """풀 내용과 카운터를 파일에 기록합니다. (파일 쓰기는 스레드에서 실행)"""
+        snapshot = {
+            "items": {f"{key[0]}|{key[1]}": list(items) for key, items in self._pools.items()},
+            "stats": {f"{key[0]}|{key[1]}": dict(counters) for key, counters in self._stats.items()},
+        }
+        lock = self._persist_lock or asyncio.Lock()
+        async with lock:
+            try:
+                await asyncio.to_thread(write_json_atomic, self.path, snapshot, None, False)
+            except Exception as e:
+                logger.error(f"웜 풀 기록 중 오류: {str(e)}")
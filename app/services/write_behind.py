@@ -0,0 +1,160 @@
+"""
+지연 쓰기(write-behind) 서비스
+
+저장소 변경 시 파일을 바로 다시 쓰지 않고 변경 표시만 남긴 뒤,
+백그라운드 스레드가 일정 시간(또는 변경 횟수) 동안 모인 변경을
+한 번의 파일 쓰기로 묶어서(group commit) 반영합니다.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional, Set
+
+from app.utils.logger import get_logger
+
+# 모듈 로거 설정
+logger = get_logger("write_behind")
+
+
+class WriteBehindFlusher:
+    """
+    변경 표시를 모아 대상별로 한 번씩 저장하는 백그라운드 플러셔
+
+    첫 변경 후 ``window`` 초가 지나거나 변경이 ``max_pending`` 회 쌓이면
+    변경된 대상의 저장 함수를 호출합니다. 저장은 항상 한 번에 하나씩만
+    실행되며, 저장 함수는 호출 시점의 메모리 상태 전체를 기록해야 합니다.
+    """
+
+    def __init__(self, targets: Dict[str, Callable[[], bool]], window: float = 0.2,
+                 max_pending: int = 50, name: str = "storage-flusher"):
+        """
+        WriteBehindFlusher 초기화
+
+        Args:
+            targets: 대상 이름별 저장 함수 (성공 여부 반환)
+            window: 첫 변경 후 저장까지 기다리는 시간 (초, 기본값: 0.2)
+            max_pending: 이 횟수만큼 변경이 쌓이면 즉시 저장 (기본값: 50)
+            name: 백그라운드 스레드 이름
+        """
+        self._targets = dict(targets)
+        self.window = window
+        self.max_pending = max(1, max_pending)
+
+        self._cond = threading.Condition()
+        self._dirty: Set[str] = set()
+        self._pending = 0
+        self._first_dirty_at: Optional[float] = None
+        self._flushing = False
+        self._closed = False
+
+        # 저장 함수 실행을 직렬화하는 잠금 (백그라운드 저장과 flush() 호출 간)
+        self._flush_lock = threading.Lock()
+
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def idle(self) -> bool:
+        """저장 대기 중이거나 저장 중인 변경이 없는지 여부"""
+        with self._cond:
+            return not self._dirty and not self._flushing
+
+    def mark_dirty(self, target: str) -> None:
+        """
+        대상에 변경이 있음을 표시합니다.
+
+        Args:
+            target: 대상 이름 (targets의 키)
+        """
+        if target not in self._targets:
+            raise KeyError(f"알 수 없는 저장 대상입니다: {target}")
+
+        with self._cond:
+            closed = self._closed
+            if not closed:
+                self._dirty.add(target)
+                self._pending += 1
+                if self._first_dirty_at is None:
+                    self._first_dirty_at = time.monotonic()
+                self._cond.notify()
+
+        if closed:
+            # 종료 후에 들어온 변경은 바로 저장
+            self._targets[target]()
+
+    def _run(self) -> None:
+        """변경이 생기면 창(window)이 끝날 때까지 모았다가 저장합니다."""
+        while True:
+            with self._cond:
+                while not self._dirty and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    # 남은 변경은 close()에서 저장
+                    return
+
+                while not self._closed and self._pending < self.max_pending:
+                    remaining = self._first_dirty_at + self.window - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._closed:
+                    return
+
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        대기 중인 변경을 지금 저장합니다.
+
+        실패한 대상은 다시 변경 상태로 표시되어 다음 창에서 재시도합니다.
+
+        Returns:
+            모든 대상의 저장 성공 여부
+        """
+        with self._flush_lock:
+            with self._cond:
+                targets = self._dirty
+                pending = self._pending
+                self._dirty = set()
+                self._pending = 0
+                self._first_dirty_at = None
+                self._flushing = True
+
+            failed: Set[str] = set()
+            try:
+                for target in sorted(targets):
+                    try:
+                        if not self._targets[target]():
+                            failed.add(target)
+                    except Exception as e:
+                        logger.error(f"지연 쓰기 저장 중 오류 ({target}): {str(e)}")
+                        failed.add(target)
+            finally:
+                with self._cond:
+                    self._flushing = False
+                    if failed:
+                        self._dirty |= failed
+                        self._pending += 1
+                        if self._first_dirty_at is None:
+                            self._first_dirty_at = time.monotonic()
+                        self._cond.notify()
+
+            if targets and pending > 1:
+                logger.debug(f"변경 {pending}건을 {len(targets)}개 파일 쓰기로 묶어 저장했습니다.")
+            return not failed
+
+    def close(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        백그라운드 스레드를 멈추고 남은 변경을 저장합니다.
+
+        Args:
+            timeout: 스레드 종료 대기 시간 (초)
+
+        Returns:
+            남은 변경의 저장 성공 여부
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        return self.flush()
@@ -5,7 +5,7 @@ TOPIK 문제 생성기에서 사용하는 다양한 유형의 GPT 프롬프트 
 """
 
 from enum import Enum
-from typing import Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple
 
 
 class TemplateType(str, Enum):
@@ -78,6 +78,47 @@ _OUTPUT_FORMAT_FIELDS = {
 }
 
 
+# 모든 유형에 공통인 콘텐츠 필드와 유형별 콘텐츠 필드 (출력 형식과 동일, 재생성 프롬프트에 사용)
+_BASE_CONTENT_FIELDS = ("type", "level", "topic", "place", "keywords", "tokens")
+
+_CONTENT_FIELDS = {
+    TemplateType.DIALOGUE: ("situation", "dialogue"),
+    TemplateType.MONOLOGUE: ("situation", "script"),
+    TemplateType.NEWS: ("script",),
+    TemplateType.LECTURE: ("script",),
+    TemplateType.SHORT_READING: ("title", "text"),
+    TemplateType.LONG_READING: ("title", "text"),
+    TemplateType.IMAGE_READING: ("description",),
+    TemplateType.IMAGE_LISTENING: ("dialogue", "choices", "answer_index"),
+}
+
+
+# 각 유형의 본문 필드와 길이 목표 (글자 수, 위 템플릿 정의의 "길이" 항목과 같은 값)
+# 문장 수로만 정한 대화형 유형은 문장당 약 40~50자로 환산
+_LENGTH_TARGETS = {
+    TemplateType.DIALOGUE: ("dialogue", 80, 250),
+    TemplateType.MONOLOGUE: ("script", 150, 300),
+    TemplateType.NEWS: ("script", 200, 300),
+    TemplateType.LECTURE: ("script", 300, 400),
+    TemplateType.SHORT_READING: ("text", 150, 200),
+    TemplateType.LONG_READING: ("text", 300, 500),
+    TemplateType.IMAGE_READING: ("description", 150, 250),
+    TemplateType.IMAGE_LISTENING: ("dialogue", 120, 200),
+}
+
+
+# 부분 재생성에서 다시 작성할 수 없는 필드 (유형/레벨은 고정, tokens는 전체 콘텐츠 기준)
+_FIXED_FIELDS = ("type", "level", "tokens")
+
+# 부분 재생성에서 함께 다시 작성해야 하는 필드 (보기를 바꾸면 정답 번호도 바뀜)
+_COUPLED_FIELDS = {
+    "choices": ("answer_index",),
+}
+
+# 부분 재생성 프롬프트에 문맥으로 보내는 공통 필드 (나머지는 유형별 콘텐츠 필드 중 대상이 아닌 것)
+_CONTEXT_FIELDS = ("type", "level", "topic", "place")
+
+
 def _create_output_format(template_type: TemplateType) -> str:
     """템플릿 유형에 맞는 출력 형식 생성"""
     additional_fields = _OUTPUT_FORMAT_FIELDS.get(template_type, "")
@@ -184,6 +225,27 @@ REGENERATE_TEMPLATE = """
 """
 
 
+# 부분 재생성 프롬프트 템플릿
+PARTIAL_REGENERATE_TEMPLATE = """
+다음은 이전에 생성된 한국어 교육용 콘텐츠의 일부입니다:
+
+{context}
+
+이 콘텐츠에서 다음 필드만 요구사항에 맞게 다시 작성해 주세요: {fields}
+
+현재 값:
+
+{current}
+
+요구사항:
+
+{user_comment}
+
+응답은 다시 작성한 필드({fields})만 담은 JSON 객체로 제공해 주세요.
+다른 필드는 포함하지 말고, 마크다운이나 설명 없이 순수한 JSON 객체만 반환해주세요.
+"""
+
+
 def get_template(template_type: str) -> Optional[PromptTemplate]:
     """
     템플릿 유형에 해당하는 프롬프트 템플릿을 반환합니다.
@@ -197,6 +259,99 @@ def get_template(template_type: str) -> Optional[PromptTemplate]:
     return TEMPLATES.get(template_type)
 
 
+def get_content_fields(template_type: str) -> Optional[Tuple[str, ...]]:
+    """
+    템플릿 유형의 콘텐츠 필드(메타데이터 제외) 목록을 반환합니다.
+    
+    Args:
+        template_type: 템플릿 유형
+        
+    Returns:
+        콘텐츠 필드 이름 튜플 또는 None (알 수 없는 유형인 경우)
+    """
+    try:
+        return _BASE_CONTENT_FIELDS + _CONTENT_FIELDS[TemplateType(template_type)]
+    except ValueError:
+        return None
+
+
+def get_length_target(template_type: str) -> Optional[Tuple[str, int, int]]:
+    """
+    템플릿 유형의 본문 필드와 길이 목표(글자 수)를 반환합니다.
+    
+    Args:
+        template_type: 템플릿 유형
+        
+    Returns:
+        (본문 필드 이름, 최소 글자 수, 최대 글자 수) 튜플 또는 None (알 수 없는 유형인 경우)
+    """
+    try:
+        return _LENGTH_TARGETS[TemplateType(template_type)]
+    except ValueError:
+        return None
+
+
+def get_regenerable_fields(template_type: str) -> Tuple[str, ...]:
+    """
+    부분 재생성으로 다시 작성할 수 있는 필드 목록을 반환합니다.
+    
+    Args:
+        template_type: 템플릿 유형
+        
+    Returns:
+        필드 이름 튜플 (알 수 없는 유형이면 빈 튜플)
+    """
+    fields = get_content_fields(template_type) or ()
+    return tuple(field for field in fields if field not in _FIXED_FIELDS)
+
+
+def expand_regenerate_fields(template_type: str, fields: Sequence[str]) -> Tuple[str, ...]:
+    """
+    부분 재생성 대상 필드를 검증하고, 함께 다시 작성해야 하는 필드를 추가합니다.
+    
+    Args:
+        template_type: 템플릿 유형
+        fields: 다시 작성할 필드 목록
+        
+    Returns:
+        유형의 필드 순서로 정렬한 대상 필드 튜플
+        
+    Raises:
+        ValueError: 대상 필드가 없거나 다시 작성할 수 없는 필드가 포함된 경우
+    """
+    regenerable = get_regenerable_fields(template_type)
+    if not fields:
+        raise ValueError("다시 작성할 필드를 선택해 주세요.")
+    invalid = [field for field in fields if field not in regenerable]
+    if invalid:
+        raise ValueError(f"'{template_type}' 유형에서 다시 작성할 수 없는 필드입니다: {', '.join(invalid)}")
+    
+    targets = set(fields)
+    for field in fields:
+        targets.update(coupled for coupled in _COUPLED_FIELDS.get(field, ()) if coupled in regenerable)
+    return tuple(field for field in regenerable if field in targets)
+
+
+def get_context_fields(template_type: str, fields: Sequence[str]) -> Tuple[str, ...]:
+    """
+    부분 재생성 프롬프트에 문맥으로 보낼 필드 목록을 반환합니다.
+    
+    공통 문맥 필드(type, level, topic, place)와 대상이 아닌 유형별 콘텐츠 필드입니다.
+    
+    Args:
+        template_type: 템플릿 유형
+        fields: 다시 작성할 필드 목록
+        
+    Returns:
+        문맥 필드 이름 튜플
+    """
+    try:
+        type_fields = _CONTENT_FIELDS[TemplateType(template_type)]
+    except ValueError:
+        type_fields = ()
+    return tuple(field for field in _CONTEXT_FIELDS + type_fields if field not in fields)
+
+
 def build_regenerate_prompt(original_content: str, user_comment: str) -> str:
     """
     재생성 프롬프트를 구성합니다.
@@ -211,4 +366,26 @@ def build_regenerate_prompt(original_content: str, user_comment: str) -> str:
     return REGENERATE_TEMPLATE.format(
         original_content=original_content,
         user_comment=user_comment
+    )
+
+
+def build_partial_regenerate_prompt(context: str, current: str, fields: Sequence[str],
+                                    user_comment: str) -> str:
+    """
+    부분 재생성 프롬프트를 구성합니다.
+    
+    Args:
+        context: 문맥 필드 JSON 문자열
+        current: 다시 작성할 필드의 현재 값 JSON 문자열
+        fields: 다시 작성할 필드 목록
+        user_comment: 사용자 요청 사항
+        
+    Returns:
+        구성된 부분 재생성 프롬프트
+    """
+    return PARTIAL_REGENERATE_TEMPLATE.format(
+        context=context,
+        current=current,
+        fields=", ".join(fields),
+        user_comment=user_comment
     )
\ No newline at end of file
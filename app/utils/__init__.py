@@ -13,7 +13,8 @@ from app.utils.models import (
 )
 from app.utils.json_debug import (
     debug_json_error, fix_common_json_errors, 
-    extract_valid_json, safely_parse_json
+    extract_valid_json, safely_parse_json,
+    scan_json_object, JSONParseError
 )
 
 # 외부에서 import 가능한 모든 심볼 정의
@@ -29,5 +30,6 @@ __all__ = [
     
     # JSON 관련
     "debug_json_error", "fix_common_json_errors",
-    "extract_valid_json", "safely_parse_json"
+    "extract_valid_json", "safely_parse_json",
+    "scan_json_object", "JSONParseError"
 ]
\ No newline at end of file
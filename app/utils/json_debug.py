@@ -5,9 +5,61 @@ JSON 파싱 오류를 분석하고 수정하기 위한 도구를 제공합니다
 """
 
 import json
+import logging
 import re
 from typing import Any, Dict, List, Tuple, Optional
 
+from app.utils.logger import get_logger
+
+# 모듈 로거 설정
+logger = get_logger("json_debug")
+
+# 올바른 큰따옴표 JSON 문자열 (이스케이프가 없는 구간을 한 번에 읽는 형태로 백트래킹 없음)
+_STRING = r'"[^"\\\x00-\x1f]*(?:\\["\\/bfnrtu][^"\\\x00-\x1f]*)*"'
+
+# scan_json_object의 토큰: 보정이 필요 없는 구간(올바른 문자열 포함), 구조 문자, 주석
+_TOKEN = re.compile(
+    r'(?:' + _STRING + r'|[^{}\[\],"\'/])+'
+    r'|[{}\[\],]'
+    r'|//[^\n]*'
+    r'|/\*.*?\*/',
+    re.DOTALL
+)
+
+# _scan_string에서 한 번에 건너뛸 수 있는 문자열 내부 구간
+_DOUBLE_QUOTED_RUN = re.compile(r'[^"\\\x00-\x1f]+')
+_SINGLE_QUOTED_RUN = re.compile(r'[^\'"\\\x00-\x1f]+')
+
+# 객체 뒤의 텍스트를 무시하고 파싱하는 디코더
+_DECODER = json.JSONDecoder()
+
+# JSON 문자열 안에서 유효한 이스케이프 문자
+_VALID_ESCAPES = '"\\/bfnrtu'
+
+# 문자열 안의 제어 문자 이스케이프
+_CONTROL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t", "\b": "\\b", "\f": "\\f"}
+
+
+class JSONParseError(ValueError):
+    """
+    safely_parse_json의 파싱 실패 오류
+    
+    디버그 정보(debug_json_error)는 비용이 크므로 debug_info에 처음 접근할 때 계산합니다.
+    """
+    
+    def __init__(self, json_str: str, error: json.JSONDecodeError):
+        super().__init__(f"JSON 파싱 실패: {str(error)}")
+        self.json_str = json_str
+        self.error = error
+        self._debug_info: Optional[Dict[str, Any]] = None
+    
+    @property
+    def debug_info(self) -> Dict[str, Any]:
+        """파싱 실패 원인 분석 결과"""
+        if self._debug_info is None:
+            self._debug_info = debug_json_error(self.json_str, self.error)
+        return self._debug_info
+
 
 def debug_json_error(json_str: str, error: json.JSONDecodeError) -> Dict[str, Any]:
     """
@@ -254,7 +306,7 @@ def fix_common_json_errors(json_str: str) -> Tuple[str, List[str]]:
     # 수정 패턴과 설명 목록
     fix_patterns = [
         # 이중 이스케이프 처리
-        (r'\\\\', '\\', "이중 이스케이프 문자 수정"),
+        (r'\\\\', r'\\', "이중 이스케이프 문자 수정"),
         # 싱글 따옴표를 더블 따옴표로 변환 (속성명)
         (r"'([^']*)':", r'"\1":', "싱글 따옴표로 된 속성명을 더블 따옴표로 변환"),
         # 마지막 콤마 제거
@@ -276,36 +328,146 @@ def fix_common_json_errors(json_str: str) -> Tuple[str, List[str]]:
     return fixed_str, fixes
 
 
-def extract_valid_json(text: str) -> Optional[str]:
+def scan_json_object(text: str) -> Optional[str]:
     """
-    텍스트에서 유효한 JSON 객체를 추출합니다.
+    텍스트에서 첫 번째 최상위 JSON 객체를 한 번의 선형 스캔으로 추출하고 정리합니다.
+    
+    객체 앞뒤의 텍스트(코드 블록 표시, 설명 등)는 무시하며, 스캔하면서 다음을 처리합니다.
+    - // 및 /* */ 주석 제거
+    - 객체/배열 끝의 불필요한 콤마 제거
+    - 작은따옴표 문자열(키, 값)을 큰따옴표 문자열로 변환
+    - 문자열 안의 줄바꿈 등 제어 문자와 잘못된 이스케이프 시퀀스 수정
     
     Args:
         text: JSON을 추출할 텍스트
         
     Returns:
-        추출된 JSON 문자열 또는 None (실패 시)
+        정리된 JSON 객체 문자열 또는 None (객체가 없거나 닫히지 않은 경우)
     """
-    # JSON 객체 추출 패턴들
-    patterns = [
-        # 복잡한 중첩 객체 패턴
-        r'(\{(?:[^{}]|(?:\{(?:[^{}]|(?:\{[^{}]*\}))*\}))*\})',
-        # 단순한 객체 패턴
-        r'(\{.*\})'
-    ]
+    i = text.find("{")
+    if i < 0:
+        return None
+    
+    n = len(text)
+    out: List[str] = []
+    depth = 0
+    pending_comma = False
+    
+    while i < n:
+        match = _TOKEN.match(text, i)
+        if match is None:
+            # 작은따옴표 문자열, 보정이 필요한 큰따옴표 문자열, 닫히지 않은 주석
+            c = text[i]
+            if c == "/":
+                return None
+            if pending_comma:
+                out.append(",")
+                pending_comma = False
+            i = _scan_string(text, i, out)
+            if i < 0:
+                return None
+            continue
+        
+        token = match.group()
+        i = match.end()
+        c = token[0]
+        if c == ",":
+            pending_comma = True
+        elif c == "}" or c == "]":
+            # 닫는 괄호 바로 앞의 콤마는 버림
+            pending_comma = False
+            out.append(c)
+            depth -= 1
+            if depth == 0:
+                return "".join(out)
+        elif c == "/" and token[1:2] in ("/", "*"):
+            continue
+        elif token.isspace():
+            out.append(token)
+        else:
+            if pending_comma:
+                out.append(",")
+                pending_comma = False
+            out.append(token)
+            if c == "{" or c == "[":
+                depth += 1
+    
+    return None
+
+
+def _scan_string(text: str, i: int, out: List[str]) -> int:
+    """
+    text[i]에서 시작하는 문자열을 큰따옴표 JSON 문자열로 out에 추가합니다.
     
-    for pattern in patterns:
-        match = re.search(pattern, text, re.DOTALL)
+    Args:
+        text: 스캔 중인 텍스트
+        i: 여는 따옴표 위치
+        out: 출력 조각 목록 (수정됨)
+        
+    Returns:
+        닫는 따옴표 다음 위치 또는 -1 (문자열이 닫히지 않은 경우)
+    """
+    quote = text[i]
+    run_pattern = _DOUBLE_QUOTED_RUN if quote == '"' else _SINGLE_QUOTED_RUN
+    n = len(text)
+    out.append('"')
+    i += 1
+    
+    while i < n:
+        match = run_pattern.match(text, i)
         if match:
-            candidate = match.group(1)
-            try:
-                # 유효성 검사
-                json.loads(candidate)
-                return candidate
-            except json.JSONDecodeError:
-                continue
+            out.append(match.group())
+            i = match.end()
+            continue
+        
+        c = text[i]
+        if c == quote:
+            out.append('"')
+            return i + 1
+        if c == "\\":
+            escaped = text[i + 1:i + 2]
+            if not escaped:
+                return -1
+            if escaped in _VALID_ESCAPES:
+                out.append(text[i:i + 2])
+                i += 2
+            elif escaped == "'":
+                out.append("'")
+                i += 2
+            else:
+                # 잘못된 이스케이프는 백슬래시 문자 자체로 취급
+                out.append("\\\\")
+                i += 1
+        elif c == '"':
+            # 작은따옴표 문자열 안의 큰따옴표
+            out.append('\\"')
+            i += 1
+        else:
+            out.append(_CONTROL_ESCAPES.get(c) or f"\\u{ord(c):04x}")
+            i += 1
+    
+    return -1
+
+
+def extract_valid_json(text: str) -> Optional[str]:
+    """
+    텍스트에서 유효한 JSON 객체를 추출합니다.
     
-    return None
+    Args:
+        text: JSON을 추출할 텍스트
+        
+    Returns:
+        추출된 JSON 문자열 또는 None (실패 시)
+    """
+    candidate = scan_json_object(text)
+    if candidate is None:
+        return None
+    try:
+        # 유효성 검사
+        json.loads(candidate)
+        return candidate
+    except json.JSONDecodeError:
+        return None
 
 
 def safely_parse_json(json_str: str) -> Dict[str, Any]:
@@ -319,7 +481,8 @@ def safely_parse_json(json_str: str) -> Dict[str, Any]:
         파싱된 JSON 객체
         
     Raises:
-        ValueError: JSON 파싱에 실패한 경우
+        JSONParseError: JSON 파싱에 실패한 경우 (ValueError 하위 클래스)
+        ValueError: JSON 문자열이 비어 있는 경우
     """
     if not json_str or json_str.isspace():
         raise ValueError("JSON 문자열이 비어 있습니다.")
@@ -337,25 +500,26 @@ def safely_parse_json(json_str: str) -> Dict[str, Any]:
         
         return data
     except json.JSONDecodeError as e:
-        # 2. 오류 발생 시 수정 시도
-        fixed_str, fixes = fix_common_json_errors(json_str)
-        
-        if fixes:  # 수정이 적용된 경우
-            try:
-                data = json.loads(fixed_str)
-                return data
-            except json.JSONDecodeError:
-                pass
-        
-        # 3. 여전히 실패한 경우, 유효한 JSON 추출 시도
-        extracted = extract_valid_json(json_str)
-        if extracted:
-            try:
-                data = json.loads(extracted)
-                return data
-            except json.JSONDecodeError:
-                pass
-        
-        # 4. 모든 시도 실패
-        debug_info = debug_json_error(json_str, e)
-        raise ValueError(f"JSON 파싱 실패: {str(e)}\n디버그 정보: {debug_info}")
\ No newline at end of file
+        error = e
+    
+    # 2. 객체 앞뒤에 코드 블록 표시나 설명만 붙은 경우 첫 객체만 파싱
+    start = json_str.find("{")
+    if start >= 0:
+        try:
+            return _DECODER.raw_decode(json_str, start)[0]
+        except json.JSONDecodeError:
+            pass
+    
+    # 3. 실패한 경우 한 번의 스캔으로 객체를 추출/정리한 뒤 다시 파싱
+    cleaned = scan_json_object(json_str)
+    if cleaned is not None:
+        try:
+            return json.loads(cleaned)
+        except json.JSONDecodeError:
+            pass
+    
+    # 4. 모든 시도 실패 (디버그 정보는 디버그 로그가 켜진 경우에만 계산)
+    parse_error = JSONParseError(json_str, error)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"JSON 파싱 실패 디버그 정보: {parse_error.debug_info}")
+    raise parse_error
\ No newline at end of file
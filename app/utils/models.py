@@ -5,10 +5,13 @@
 """
 
 from enum import Enum
-from typing import List, Dict, Any, Optional, Union, Type
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Union, Type
 from uuid import uuid4
 from pydantic import BaseModel, Field, validator
 
+from app.templates import get_content_fields
+
 
 class ContentType(str, Enum):
     """콘텐츠 유형 열거형"""
@@ -207,4 +210,137 @@ def create_content_model(content_type: Union[str, ContentType],
         **kwargs
     }
     
-    return parse_content(data)
\ No newline at end of file
+    return parse_content(data)
+
+def validate_content(data: Dict[str, Any]) -> Optional[str]:
+    """
+    생성된 콘텐츠가 유형별 모델의 필수 필드와 형식을 만족하는지 확인합니다.
+    
+    Args:
+        data: 검증할 콘텐츠 데이터
+        
+    Returns:
+        오류 메시지 또는 None (유효한 경우)
+    """
+    if not isinstance(data, dict):
+        return "콘텐츠가 JSON 객체가 아닙니다."
+    
+    if data.get("error"):
+        return str(data["error"])
+    
+    try:
+        model_class = CONTENT_TYPE_MODELS[ContentType(data.get("type"))]
+    except ValueError:
+        return f"알 수 없는 콘텐츠 유형: {data.get('type')}"
+    
+    try:
+        model_class(**data)
+    except Exception as e:
+        return str(e)
+    return None
+
+
+@lru_cache(maxsize=None)
+def content_json_schema(content_type: str) -> Optional[Dict[str, Any]]:
+    """
+    구조화된 출력(response_format)에 사용할 콘텐츠 유형의 JSON 스키마를 생성합니다.
+    
+    유형별 모델의 JSON 스키마에서 출력 형식에 포함된 콘텐츠 필드만 골라
+    모두 필수(null 불가) 필드로 만듭니다. level은 출력 형식에 없으므로 제외합니다.
+    반환값은 캐시되어 공유되므로 수정하지 않아야 합니다.
+    
+    Args:
+        content_type: 콘텐츠 유형
+        
+    Returns:
+        JSON 스키마 딕셔너리 또는 None (알 수 없는 유형인 경우)
+    """
+    try:
+        model_class = CONTENT_TYPE_MODELS[ContentType(content_type)]
+    except ValueError:
+        return None
+    
+    fields = [name for name in get_content_fields(content_type) if name != "level"]
+    model_properties = model_class.model_json_schema()["properties"]
+    
+    properties = {}
+    for name in fields:
+        prop = model_properties[name]
+        # Optional[X]의 anyOf에서 null을 제외한 타입 사용
+        variants = [v for v in prop.get("anyOf", [prop]) if v.get("type") != "null"]
+        properties[name] = {k: v for k, v in variants[0].items() if k not in ("title", "default")}
+    properties["type"] = {"type": "string", "enum": [content_type]}
+    
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": fields,
+        "additionalProperties": False,
+    }
+
+
+@lru_cache(maxsize=None)
+def partial_json_schema(content_type: str, fields: Tuple[str, ...]) -> Optional[Dict[str, Any]]:
+    """
+    부분 재생성 응답에 사용할 JSON 스키마를 생성합니다.
+    
+    content_json_schema에서 대상 필드만 골라 모두 필수 필드로 만듭니다.
+    반환값은 캐시되어 공유되므로 수정하지 않아야 합니다.
+    
+    Args:
+        content_type: 콘텐츠 유형
+        fields: 다시 작성할 필드 튜플
+        
+    Returns:
+        JSON 스키마 딕셔너리 또는 None (알 수 없는 유형이거나 스키마에 없는 필드가 있는 경우)
+    """
+    schema = content_json_schema(content_type)
+    if schema is None or any(field not in schema["properties"] for field in fields):
+        return None
+    
+    return {
+        "type": "object",
+        "properties": {field: schema["properties"][field] for field in fields},
+        "required": list(fields),
+        "additionalProperties": False,
+    }
+
+
+class BatchGenerateItem(BaseModel):
+    """일괄 생성 요청 항목"""
+    qtype: str
+    level: str
+    count: int = Field(1, ge=1)
+
+
+class BatchGenerateRequest(BaseModel):
+    """일괄 생성 요청"""
+    items: List[BatchGenerateItem]
+    auto_save: bool = False
+    concurrency: Optional[int] = Field(None, ge=1)
+    
+    @validator('items')
+    def ensure_items(cls, v):
+        """요청 항목이 비어 있지 않은지 검증"""
+        if not v:
+            raise ValueError("생성할 항목이 없습니다.")
+        return v
+    
+    def total_count(self) -> int:
+        """요청된 전체 생성 개수"""
+        return sum(item.count for item in self.items)
+
+
+class PartialRegenerateRequest(BaseModel):
+    """부분 재생성 요청"""
+    content: Dict[str, Any]
+    fields: List[str]
+    user_comment: str
+    fresh: bool = False
+    
+    @validator('user_comment')
+    def ensure_comment(cls, v):
+        """요구사항이 비어 있지 않은지 검증"""
+        if not v or v.isspace():
+            raise ValueError("추가 요구사항을 입력해주세요.")
+        return v
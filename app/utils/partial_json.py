@@ -0,0 +1,208 @@
+"""
+부분 JSON 파서
+
+스트리밍으로 도착하는 GPT 응답을 조각 단위로 받아, 지금까지 받은 내용만으로
+만들 수 있는 가장 완전한 JSON 객체를 구성합니다. 이미 읽은 부분은 다시 읽지 않고
+새로 도착한 조각만 스캔합니다.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+_WHITESPACE = " \t\r\n"
+_TOKEN_END = _WHITESPACE + ",]}:"
+
+
+class _Frame:
+    """열려 있는 객체 또는 배열 하나의 스캔 상태"""
+    __slots__ = ("kind", "expect", "key_start")
+
+    def __init__(self, kind: str):
+        self.kind = kind                                      # '{' 또는 '['
+        self.expect = "key" if kind == "{" else "value"       # 다음에 올 요소
+        self.key_start = 0                                    # 현재 키의 시작 위치
+
+
+class PartialJSONParser:
+    """
+    스트리밍 JSON 증분 파서
+
+    첫 번째 '{' 또는 '[' 이전의 텍스트(코드 블록 표시 등)는 무시하며,
+    최상위 값이 닫힌 뒤의 텍스트도 무시합니다.
+
+    사용 예:
+        parser = PartialJSONParser()
+        for chunk in chunks:
+            partial = parser.feed(chunk)  # 내용이 바뀐 경우에만 값 반환
+    """
+
+    def __init__(self):
+        """PartialJSONParser 초기화"""
+        self._text = ""
+        self._pos = 0
+        self._root_start: Optional[int] = None
+        self._root_end: Optional[int] = None
+        self._stack: List[_Frame] = []
+
+        self._in_string = False
+        self._escape = False
+        self._escape_start = 0
+        self._unicode_left = 0
+        self._string_start = 0
+        self._string_is_key = False
+        self._token_start: Optional[int] = None
+
+        self.value: Optional[Any] = None
+
+    @property
+    def complete(self) -> bool:
+        """최상위 값이 닫혔는지 여부"""
+        return self._root_end is not None
+
+    def feed(self, chunk: str) -> Optional[Any]:
+        """
+        새 조각을 추가하고 현재까지의 부분 값을 구성합니다.
+
+        Args:
+            chunk: 새로 도착한 텍스트 조각
+
+        Returns:
+            이전과 달라진 부분 값 또는 None (변화가 없거나 아직 구성할 수 없는 경우)
+        """
+        if self.complete or not chunk:
+            return None
+
+        self._text += chunk
+        self._scan()
+
+        value = self._snapshot()
+        if value is None or value == self.value:
+            return None
+        self.value = value
+        return value
+
+    def _scan(self) -> None:
+        """새로 추가된 텍스트만 스캔하여 중첩 상태를 갱신합니다."""
+        text = self._text
+        stack = self._stack
+        i = self._pos
+        end = len(text)
+
+        while i < end and self._root_end is None:
+            c = text[i]
+
+            if self._root_start is None:
+                if c in "{[":
+                    self._root_start = i
+                    stack.append(_Frame(c))
+                i += 1
+                continue
+
+            if self._in_string:
+                if self._unicode_left:
+                    self._unicode_left -= 1
+                elif self._escape:
+                    self._escape = False
+                    if c == "u":
+                        self._unicode_left = 4
+                elif c == "\\":
+                    self._escape = True
+                    self._escape_start = i
+                elif c == '"':
+                    self._in_string = False
+                    stack[-1].expect = "colon" if self._string_is_key else "comma"
+                i += 1
+                continue
+
+            if self._token_start is not None:
+                if c not in _TOKEN_END:
+                    i += 1
+                    continue
+                # 숫자/리터럴 종료 - 현재 문자는 아래에서 처리
+                self._token_start = None
+                stack[-1].expect = "comma"
+
+            frame = stack[-1]
+            if c in _WHITESPACE:
+                pass
+            elif c == '"':
+                self._in_string = True
+                self._string_start = i
+                self._string_is_key = frame.kind == "{" and frame.expect == "key"
+                if self._string_is_key:
+                    frame.key_start = i
+            elif c in "{[":
+                frame.expect = "comma"
+                stack.append(_Frame(c))
+            elif c in "}]":
+                stack.pop()
+                if not stack:
+                    self._root_end = i + 1
+            elif c == ":":
+                frame.expect = "value"
+            elif c == ",":
+                frame.expect = "key" if frame.kind == "{" else "value"
+            else:
+                self._token_start = i
+            i += 1
+
+        self._pos = i
+
+    def _snapshot(self) -> Optional[Any]:
+        """현재까지의 텍스트를 닫아서 JSON 값으로 변환합니다."""
+        if self._root_start is None:
+            return None
+
+        if self._root_end is not None:
+            candidate = self._text[self._root_start:self._root_end]
+        else:
+            candidate = self._close()
+
+        try:
+            return json.loads(candidate)
+        except json.JSONDecodeError:
+            return None
+
+    def _close(self) -> str:
+        """열린 문자열과 컨테이너를 닫는 접미사를 붙인 후보 텍스트를 만듭니다."""
+        text = self._text
+        stack = self._stack
+
+        if self._in_string and not self._string_is_key:
+            # 작성 중인 문자열 값은 지금까지 받은 부분까지 사용 (불완전한 이스케이프 제외)
+            if self._escape or self._unicode_left:
+                body = text[self._root_start:self._escape_start] + '"'
+            else:
+                body = text[self._root_start:] + '"'
+        else:
+            if self._in_string:
+                cut = self._string_start
+            elif self._token_start is not None:
+                cut = self._token_start
+            else:
+                cut = len(text)
+            body = text[self._root_start:cut].rstrip(_WHITESPACE)
+
+            # 값이 없는 키("key" 또는 "key":)와 끝의 쉼표 제거
+            if body.endswith(":") or stack[-1].expect == "colon":
+                body = text[self._root_start:stack[-1].key_start].rstrip(_WHITESPACE)
+            if body.endswith(","):
+                body = body[:-1]
+
+        closers = "".join("}" if frame.kind == "{" else "]" for frame in reversed(stack))
+        return body + closers
+
+
+def parse_partial_json(text: str) -> Optional[Dict[str, Any]]:
+    """
+    불완전한 JSON 텍스트에서 구성할 수 있는 부분 객체를 반환합니다.
+
+    Args:
+        text: 불완전할 수 있는 JSON 텍스트
+
+    Returns:
+        부분 객체 또는 None (객체를 구성할 수 없는 경우)
+    """
+    parser = PartialJSONParser()
+    parser.feed(text)
+    return parser.value if isinstance(parser.value, dict) else None
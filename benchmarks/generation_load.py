@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+"""
+콘텐츠 생성 부하 벤치마크
+
+OpenAI 호환 스텁 서버(benchmarks/stub_openai.py)를 같은 프로세스에 띄우고,
+실제 생성 경로(공유 AsyncOpenAI 클라이언트, RateLimitScheduler 재시도,
+구조화된 출력 전환, JSON 보정, 유형별 출력 토큰 예산)으로 동시 요청을 보내 지연 시간과
+재시도/보정/실패 횟수를 측정합니다. 네트워크 접근이 필요하지 않습니다.
+
+사용법:
+    python benchmarks/generation_load.py --requests 200 --concurrency 20 \
+        --latency-median 0.3 --error-429-rate 0.05 --malformed-rate 0.1 --no-structured-output
+"""
+
+import argparse
+import asyncio
+import logging
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import uvicorn
+
+from app.config import AIConfig
+from app.services.generator import ContentGenerator, create_async_openai_client
+from app.services.output_budget import OutputBudget
+from app.services.rate_limiter import RateLimitScheduler
+from app.services.usage import UsageLog, summarize
+from app.templates import TemplateType
+from benchmarks.stub_openai import StubSettings, create_stub_app
+
+
+def parse_arguments():
+    """명령행 인수를 파싱합니다."""
+    parser = argparse.ArgumentParser(description="스텁 서버를 사용한 콘텐츠 생성 부하 측정")
+    parser.add_argument("--requests", type=int, default=200, help="전체 생성 요청 수 (기본값: 200)")
+    parser.add_argument("--concurrency", type=int, default=20, help="동시 요청 수 (기본값: 20)")
+    parser.add_argument("--stream", action="store_true", help="generate_stream 경로 사용")
+    parser.add_argument("--rpm", type=int, default=0, help="스케줄러 분당 요청 한도 (기본값: 0, 제한 없음)")
+    parser.add_argument("--max-retries", type=int, default=5, help="최대 재시도 횟수 (기본값: 5)")
+    parser.add_argument("--latency-median", type=float, default=0.3, help="스텁 지연 시간 중앙값(초) (기본값: 0.3)")
+    parser.add_argument("--latency-sigma", type=float, default=0.4, help="스텁 지연 시간 표준편차 (기본값: 0.4)")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="잘못된 JSON 비율 (기본값: 0)")
+    parser.add_argument("--error-429-rate", type=float, default=0.0, help="429 오류 비율 (기본값: 0)")
+    parser.add_argument("--error-500-rate", type=float, default=0.0, help="500 오류 비율 (기본값: 0)")
+    parser.add_argument("--no-structured-output", action="store_true",
+                        help="스텁이 response_format을 거부 (보정 경로 측정)")
+    parser.add_argument("--no-output-budget", action="store_true",
+                        help="유형별 출력 토큰 예산 없이 항상 AIConfig.MAX_TOKENS 사용")
+    parser.add_argument("--candidates", type=int, default=1,
+                        help="호출 한 번에 생성할 후보 수 (기본값: 1, 스트리밍 경로에는 적용 안 함)")
+    parser.add_argument("--seed", type=int, default=7, help="스텁 난수 시드 (기본값: 7)")
+    return parser.parse_args()
+
+
+def free_port() -> int:
+    """사용 가능한 로컬 포트를 찾습니다."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_stub(args) -> uvicorn.Server:
+    """스텁 서버를 백그라운드 스레드에서 시작하고 AIConfig.BASE_URL을 그 주소로 바꿉니다."""
+    settings = StubSettings(
+        latency_median=args.latency_median,
+        latency_sigma=args.latency_sigma,
+        malformed_rate=args.malformed_rate,
+        error_429_rate=args.error_429_rate,
+        error_500_rate=args.error_500_rate,
+        retry_after_ms=100,
+        structured_output=not args.no_structured_output,
+        seed=args.seed,
+    )
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(create_stub_app(settings), host="127.0.0.1", port=port,
+                                          log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    AIConfig.BASE_URL = f"http://127.0.0.1:{port}/v1"
+    return server
+
+
+async def run_load(args, usage_log: UsageLog) -> dict:
+    """동시 생성 요청을 보내고 요청별 지연 시간을 측정합니다."""
+    scheduler = RateLimitScheduler(rpm=args.rpm, tpm=0, max_retries=args.max_retries,
+                                   base_delay=0.05, max_delay=2.0)
+    output_budget = None if args.no_output_budget else OutputBudget()
+    generator = ContentGenerator(api_key="stub", async_client=create_async_openai_client("stub"),
+                                 scheduler=scheduler, usage_log=usage_log, output_budget=output_budget)
+    types = [t.value for t in TemplateType]
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+    errors = [0]
+
+    async def one(i: int):
+        content_type = types[i % len(types)]
+        async with semaphore:
+            started = time.perf_counter()
+            if args.stream:
+                content = {}
+                async for event in generator.generate_stream(content_type, "중급", use_cache=False):
+                    if event["event"] == "done":
+                        content = event["content"]
+            else:
+                content = await generator.generate_async(content_type, "중급", use_cache=False,
+                                                         n=args.candidates)
+            latencies.append((time.perf_counter() - started) * 1000)
+            errors[0] += int(bool(content.get("error")))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(args.requests)))
+    elapsed = time.perf_counter() - started
+    await generator.aclose()
+
+    latencies.sort()
+    return {
+        "elapsed": elapsed,
+        "errors": errors[0],
+        "p50": statistics.median(latencies),
+        "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "max": latencies[-1],
+        "scheduler": scheduler.stats(),
+        "response_format": generator.response_format,
+        "output_budget": output_budget.stats() if output_budget else None,
+    }
+
+
+def main():
+    args = parse_arguments()
+
+    # 요청마다 남는 INFO 로그가 측정에 섞이지 않도록 경고 이상만 출력
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("topik_generator"):
+            logging.getLogger(name).setLevel(logging.ERROR)
+
+    server = start_stub(args)
+    with tempfile.TemporaryDirectory() as tmp:
+        usage_log = UsageLog(Path(tmp) / "usage.jsonl")
+        result = asyncio.run(run_load(args, usage_log))
+        usage = summarize(usage_log.read())
+    stub_stats = server.config.app.state.stats
+    server.should_exit = True
+
+    print(f"요청 {args.requests}개, 동시 {args.concurrency}개, {'스트리밍' if args.stream else '일반'} 경로, "
+          f"응답 형식 {result['response_format']}, 후보 {args.candidates}개")
+    print(f"소요 {result['elapsed']:.2f}초, 처리량 {args.requests / result['elapsed']:.1f} req/s")
+    print(f"지연(ms) p50 {result['p50']:.0f} / p95 {result['p95']:.0f} / p99 {result['p99']:.0f} / "
+          f"max {result['max']:.0f}")
+    print(f"결과: 성공 {usage['success']}, 보정 {usage['repaired']}, 실패 {usage['failed']} "
+          f"(오류 항목 {result['errors']})")
+    scheduler = result["scheduler"]
+    print(f"스케줄러: 호출 {scheduler['calls']}, 재시도 {scheduler['retries']}, "
+          f"429 {scheduler['rate_limited']}, 실패 {scheduler['failures']}")
+    if result["output_budget"]:
+        budgets = ", ".join(f"{name} {info['max_tokens']}(잘림 {info['truncated']})"
+                            for name, info in result["output_budget"]["types"].items())
+        print(f"출력 토큰 예산: {budgets}")
+    else:
+        print(f"출력 토큰 예산: 사용 안 함 (max_tokens {AIConfig.MAX_TOKENS})")
+    print(f"스텁: {stub_stats}")
+
+
+if __name__ == "__main__":
+    main()
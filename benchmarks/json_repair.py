@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+"""
+JSON 보정 파서 벤치마크
+
+잘못된 형식의 모델 출력(코드 블록, 앞뒤 설명, 주석, 끝의 콤마, 작은따옴표 키,
+문자열 안의 줄바꿈, 닫히지 않은 객체 등) 코퍼스로 두 가지 파싱 방식을 비교합니다.
+
+- legacy: 정규식 보정 6단계 → 중첩 괄호 정규식 추출 → 실패 시 전체 디버그 분석
+- scanner: 현재 safely_parse_json (선형 스캔 한 번, 디버그 정보는 필요할 때만 계산)
+
+사용법:
+    python benchmarks/json_repair.py --docs 2000 --repeat 3
+"""
+
+import argparse
+import json
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.utils.json_debug import debug_json_error, fix_common_json_errors, safely_parse_json
+
+# 이전 extract_valid_json의 추출 패턴
+_LEGACY_PATTERNS = [
+    r'(\{(?:[^{}]|(?:\{(?:[^{}]|(?:\{[^{}]*\}))*\}))*\})',
+    r'(\{.*\})'
+]
+
+
+def legacy_parse(json_str: str):
+    """비교용: 이전 safely_parse_json의 보정 단계를 그대로 수행합니다."""
+    try:
+        return json.loads(json_str)
+    except json.JSONDecodeError as e:
+        fixed_str, fixes = fix_common_json_errors(json_str)
+        if fixes:
+            try:
+                return json.loads(fixed_str)
+            except json.JSONDecodeError:
+                pass
+
+        for pattern in _LEGACY_PATTERNS:
+            match = re.search(pattern, json_str, re.DOTALL)
+            if match:
+                try:
+                    return json.loads(match.group(1))
+                except json.JSONDecodeError:
+                    continue
+
+        debug_info = debug_json_error(json_str, e)
+        raise ValueError(f"JSON 파싱 실패: {str(e)}\n디버그 정보: {debug_info}")
+
+
+def sample_item(rng: random.Random, i: int) -> dict:
+    """벤치마크용 대화 콘텐츠를 만듭니다."""
+    lines = rng.randint(4, 40)
+    return {
+        "type": "dialogue",
+        "topic": f"도서관 이용 {i}",
+        "place": "학교 도서관",
+        "keywords": ["도서관", "대출", "반납", "연체", f"키워드{i % 50}"],
+        "situation": "학생이 도서관에서 책을 빌리는 방법을 묻는 상황",
+        "dialogue": [f"{'AB'[n % 2]}: 문장 {i}-{n}입니다. 이 책은 언제까지 반납해야 하나요?" for n in range(lines)],
+        "tokens": rng.randint(100, 600),
+    }
+
+
+def malform(rng: random.Random, item: dict) -> str:
+    """항목을 모델이 흔히 내놓는 잘못된 형식 중 하나로 직렬화합니다."""
+    text = json.dumps(item, ensure_ascii=False, indent=2)
+    kind = rng.choice(["fence", "prose", "trailing_comma", "comment", "single_quote_keys",
+                       "raw_newline", "truncated", "valid"])
+    if kind == "fence":
+        return f"```json\n{text}\n```"
+    if kind == "prose":
+        return f"다음은 요청하신 콘텐츠입니다.\n\n{text}\n\n필요하시면 수정해 드릴게요."
+    if kind == "trailing_comma":
+        return text.replace('"\n  ]', '",\n  ]').replace("\n}", ",\n}")
+    if kind == "comment":
+        return text.replace('  "place"', '  // 장소\n  "place"').replace('  "tokens"', '  /* 추정치 */ "tokens"')
+    if kind == "single_quote_keys":
+        return re.sub(r'"(\w+)":', r"'\1':", text)
+    if kind == "raw_newline":
+        return text.replace("상황", "상황\n(줄바꿈 포함)")
+    if kind == "truncated":
+        return text[:rng.randint(len(text) // 2, len(text) - 2)]
+    return text
+
+
+def build_corpus(docs: int, seed: int) -> list:
+    """잘못된 형식의 모델 출력 코퍼스를 만듭니다."""
+    rng = random.Random(seed)
+    return [malform(rng, sample_item(rng, i)) for i in range(docs)]
+
+
+def run_parser(name: str, parse, corpus: list, repeat: int) -> dict:
+    """코퍼스 전체를 repeat번 파싱하여 문서별 시간과 성공 수를 측정합니다."""
+    timings = []
+    parsed = 0
+    for _ in range(repeat):
+        parsed = 0
+        for doc in corpus:
+            started = time.perf_counter()
+            try:
+                parse(doc)
+                parsed += 1
+            except ValueError:
+                pass
+            timings.append((time.perf_counter() - started) * 1_000_000)
+
+    timings.sort()
+    return {
+        "name": name,
+        "parsed": parsed,
+        "mean": statistics.fmean(timings),
+        "p50": timings[len(timings) // 2],
+        "p99": timings[min(len(timings) - 1, int(len(timings) * 0.99))],
+        "max": timings[-1],
+        "total": sum(timings) / 1000 / repeat,
+    }
+
+
+def parse_arguments():
+    """명령행 인수를 파싱합니다."""
+    parser = argparse.ArgumentParser(description="잘못된 형식의 모델 출력 JSON 파싱 비교")
+    parser.add_argument("--docs", type=int, default=2000, help="코퍼스 문서 수 (기본값: 2000)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (기본값: 3)")
+    parser.add_argument("--seed", type=int, default=7, help="코퍼스 생성 시드 (기본값: 7)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    corpus = build_corpus(args.docs, args.seed)
+
+    print(f"문서 {len(corpus)}개, 평균 {statistics.fmean(len(doc) for doc in corpus):.0f}자, {args.repeat}회 반복")
+    print(f"{'parser':<8} {'parsed':>7} {'mean(us)':>9} {'p50(us)':>9} {'p99(us)':>9} {'max(us)':>10} {'total(ms)':>10}")
+    for name, parse in (("legacy", legacy_parse), ("scanner", safely_parse_json)):
+        result = run_parser(name, parse, corpus, args.repeat)
+        print(f"{result['name']:<8} {result['parsed']:>7} {result['mean']:>9.1f} {result['p50']:>9.1f} "
+              f"{result['p99']:>9.1f} {result['max']:>10.1f} {result['total']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+"""
+저장소 I/O 지연 벤치마크
+
+/confirm 쓰기 요청이 계속 들어오는 동안 /confirmed 읽기 요청의 지연 시간
+(p50/p95/p99)을 측정합니다. 같은 조건에서 저장소 작업을 이벤트 루프에서
+직접 실행하는 방식(inline)과 스레드 풀로 넘기는 방식(offload)을 비교합니다.
+
+데이터는 임시 디렉토리에 만들어지므로 실제 data/ 파일은 변경되지 않습니다.
+
+사용법:
+    python benchmarks/storage_latency.py --items 5000 --duration 10
+"""
+
+import argparse
+import json
+import logging
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+import urllib.request
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import uvicorn
+
+from app import config
+from app.services.async_storage import AsyncContentStorage
+
+
+class InlineContentStorage(AsyncContentStorage):
+    """비교용: 저장소 작업을 이벤트 루프 스레드에서 바로 실행하는 파사드"""
+
+    async def run(self, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+
+def parse_arguments():
+    """명령행 인수를 파싱합니다."""
+    parser = argparse.ArgumentParser(description="/confirm 쓰기 중 /confirmed 읽기 지연 측정")
+    parser.add_argument("--items", type=int, default=5000, help="미리 채워둘 항목 수 (기본값: 5000)")
+    parser.add_argument("--duration", type=float, default=10.0, help="모드별 측정 시간(초) (기본값: 10)")
+    parser.add_argument("--readers", type=int, default=4, help="동시 읽기 클라이언트 수 (기본값: 4)")
+    parser.add_argument("--writers", type=int, default=2, help="동시 쓰기 클라이언트 수 (기본값: 2)")
+    parser.add_argument("--mode", choices=["inline", "offload", "both"], default="both",
+                        help="측정할 방식 (기본값: both)")
+    return parser.parse_args()
+
+
+def sample_item(i: int) -> dict:
+    """벤치마크용 대화 콘텐츠를 만듭니다."""
+    return {
+        "type": "dialogue",
+        "level": ["초급", "중급", "고급"][i % 3],
+        "topic": f"벤치마크 주제 {i}",
+        "situation": "학교 도서관에서 친구와 과제에 대해 이야기하는 상황",
+        "dialogue": [f"A: 문장 {i}-{n} 입니다. 오늘 도서관에 같이 갈래요?" for n in range(8)],
+        "keywords": ["도서관", "과제", f"키워드{i % 50}"],
+    }
+
+
+def prepare_data(data_dir: Path, items: int) -> None:
+    """임시 디렉토리에 데이터 파일을 만들고 설정 경로를 바꿉니다."""
+    config.Directories.DATA = data_dir
+    config.Directories.BACKUPS = data_dir / "backups"
+    config.Files.CONFIRM = data_dir / "confirmed_questions.json"
+    config.Files.TRASH = data_dir / "trash.json"
+    config.Files.JOURNAL = data_dir / "storage_journal.jsonl"
+    config.Files.SQLITE = data_dir / "topik.sqlite3"
+    config.AppConfig.AUTO_BACKUP = False
+
+    data = []
+    for i in range(items):
+        item = sample_item(i)
+        item["id"] = f"bench-{i}"
+        item["created_at"] = item["updated_at"] = f"2024-01-01T00:00:{i % 60:02d}.{i:06d}"
+        data.append(item)
+    with open(config.Files.CONFIRM, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(config.Files.TRASH, "w", encoding="utf-8") as f:
+        f.write("[]")
+
+
+def free_port() -> int:
+    """사용 가능한 로컬 포트를 찾습니다."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(values, pct: float) -> float:
+    """정렬된 값 목록의 백분위수를 구합니다."""
+    if not values:
+        return float("nan")
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def run_mode(mode: str, args) -> dict:
+    """서버를 띄우고 한 가지 방식으로 측정합니다."""
+    from app.main import app
+
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    if mode == "inline":
+        # lifespan이 만든 파사드를 같은 저장소를 쓰는 inline 파사드로 교체
+        offloaded = app.state.content_storage
+        app.state.content_storage = InlineContentStorage(offloaded.storage, max_workers=1)
+
+    base = f"http://127.0.0.1:{port}"
+    stop = threading.Event()
+    read_latencies = []
+    write_count = [0]
+    lock = threading.Lock()
+
+    def reader():
+        while not stop.is_set():
+            started = time.perf_counter()
+            with urllib.request.urlopen(f"{base}/confirmed?limit=50") as response:
+                response.read()
+            elapsed = (time.perf_counter() - started) * 1000
+            with lock:
+                read_latencies.append(elapsed)
+
+    def writer(n: int):
+        i = 0
+        while not stop.is_set():
+            body = urllib.parse.urlencode({
+                "content": json.dumps(sample_item(n * 1_000_000 + i), ensure_ascii=False)
+            }).encode("utf-8")
+            with urllib.request.urlopen(urllib.request.Request(f"{base}/confirm", data=body)) as response:
+                response.read()
+            i += 1
+            with lock:
+                write_count[0] += 1
+
+    clients = [threading.Thread(target=reader) for _ in range(args.readers)]
+    clients += [threading.Thread(target=writer, args=(n,)) for n in range(args.writers)]
+    for client in clients:
+        client.start()
+    time.sleep(args.duration)
+    stop.set()
+    for client in clients:
+        client.join()
+
+    server.should_exit = True
+    thread.join()
+
+    read_latencies.sort()
+    return {
+        "mode": mode,
+        "reads": len(read_latencies),
+        "writes": write_count[0],
+        "p50": statistics.median(read_latencies) if read_latencies else float("nan"),
+        "p95": percentile(read_latencies, 95),
+        "p99": percentile(read_latencies, 99),
+        "max": read_latencies[-1] if read_latencies else float("nan"),
+    }
+
+
+def main():
+    args = parse_arguments()
+    modes = ["inline", "offload"] if args.mode == "both" else [args.mode]
+
+    # 요청마다 남는 INFO 로그가 측정에 섞이지 않도록 경고 이상만 출력
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("topik_generator"):
+            logging.getLogger(name).setLevel(logging.WARNING)
+
+    print(f"항목 {args.items}개, 읽기 {args.readers}개 / 쓰기 {args.writers}개 클라이언트, "
+          f"모드별 {args.duration:.0f}초")
+    print(f"{'mode':<8} {'reads':>7} {'writes':>7} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'max(ms)':>9}")
+
+    for mode in modes:
+        with tempfile.TemporaryDirectory() as tmp:
+            prepare_data(Path(tmp), args.items)
+            result = run_mode(mode, args)
+        print(f"{result['mode']:<8} {result['reads']:>7} {result['writes']:>7} "
+              f"{result['p50']:>9.1f} {result['p95']:>9.1f} {result['p99']:>9.1f} {result['max']:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
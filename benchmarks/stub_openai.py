@@ -0,0 +1,367 @@
+#!/usr/bin/env python
+"""
+OpenAI 호환 스텁 서버
+
+네트워크 없이 실제 생성 경로(스케줄러, 재시도, 캐시, 스트리밍, JSON 보정)를
+부하/지연 테스트할 수 있도록 chat.completions HTTP 프로토콜을 흉내 냅니다.
+
+- 프롬프트의 콘텐츠 유형(TemplateType)에 맞는 그럴듯한 한국어 JSON 응답
+- 로그 정규분포 지연 시간, 스트리밍(SSE) 응답과 include_usage 사용량
+- 후보 n개 응답 (n 인자, 스트리밍 제외)
+- 잘못된 JSON(코드 블록, 끝의 콤마, 앞뒤 설명) 비율
+- 429(retry-after-ms 포함)/500 오류 주입
+- response_format을 거부하는 구형 백엔드 흉내 (--no-structured-output)
+
+사용법:
+    python benchmarks/stub_openai.py --port 8001 --latency-median 0.8 --error-429-rate 0.05
+    OPENAI_BASE_URL=http://127.0.0.1:8001/v1 OPENAI_API_KEY=stub python run.py
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import re
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.services.rate_limiter import count_text_tokens
+from app.templates import TemplateType
+
+PLACES = ["도서관", "카페", "병원", "우체국", "지하철역", "회사", "식당", "공원", "시장", "학교"]
+TOPICS = ["책 대출", "주문 변경", "진료 예약", "소포 발송", "길 찾기", "회의 일정", "예약 확인",
+          "환경 보호", "전통 문화", "건강한 생활"]
+SENTENCES = [
+    "오늘은 날씨가 좋아서 많은 사람들이 밖으로 나왔습니다.",
+    "이번 주말까지 신청서를 제출해야 합니다.",
+    "최근 조사에 따르면 혼자 사는 사람이 꾸준히 늘고 있습니다.",
+    "이 프로그램은 누구나 무료로 참여할 수 있습니다.",
+    "정부는 다음 달부터 새로운 정책을 시행할 예정이라고 밝혔습니다.",
+    "전문가들은 규칙적인 운동이 건강에 도움이 된다고 말합니다.",
+    "행사 장소는 시청 앞 광장이며 오후 두 시에 시작합니다.",
+    "처음에는 어려웠지만 계속 연습하니까 점점 익숙해졌습니다.",
+    "이 제도는 시민들의 불편을 줄이기 위해 마련되었습니다.",
+    "자세한 내용은 홈페이지에서 확인하실 수 있습니다.",
+]
+DIALOGUE_LINES = [
+    ("실례지만 이 책은 어디에서 빌릴 수 있어요?", "저쪽 안내 데스크에서 빌리시면 됩니다."),
+    ("주문을 바꿔도 될까요?", "네, 아직 준비 전이라 바꾸실 수 있어요."),
+    ("다음 주 화요일에 예약할 수 있을까요?", "오전 열 시와 오후 세 시가 비어 있습니다."),
+    ("이 소포를 일본으로 보내고 싶은데요.", "항공편으로 보내시면 일주일쯤 걸립니다."),
+    ("회의가 몇 시로 바뀌었어요?", "두 시에서 네 시로 미뤄졌어요."),
+]
+
+
+class StubSettings:
+    """스텁 서버 동작 설정"""
+
+    def __init__(self, latency_median: float = 0.5, latency_sigma: float = 0.4,
+                 malformed_rate: float = 0.0, error_429_rate: float = 0.0, error_500_rate: float = 0.0,
+                 retry_after_ms: int = 500, structured_output: bool = True,
+                 stream_chunk_chars: int = 8, seed: Optional[int] = None):
+        """
+        StubSettings 초기화
+
+        Args:
+            latency_median: 응답 지연 시간 중앙값 (초, 로그 정규분포)
+            latency_sigma: 로그 정규분포의 표준편차 (0이면 고정 지연)
+            malformed_rate: 잘못된 JSON을 반환할 비율 (json_schema 요청은 제외)
+            error_429_rate: 429 오류를 반환할 비율
+            error_500_rate: 500 오류를 반환할 비율
+            retry_after_ms: 429 응답의 retry-after-ms 헤더 값
+            structured_output: False면 response_format이 있는 요청을 400으로 거부
+            stream_chunk_chars: 스트리밍 조각당 글자 수
+            seed: 난수 시드 (재현용)
+        """
+        self.latency_median = latency_median
+        self.latency_sigma = latency_sigma
+        self.malformed_rate = malformed_rate
+        self.error_429_rate = error_429_rate
+        self.error_500_rate = error_500_rate
+        self.retry_after_ms = retry_after_ms
+        self.structured_output = structured_output
+        self.stream_chunk_chars = max(1, stream_chunk_chars)
+        self.random = random.Random(seed)
+
+    def latency(self) -> float:
+        """이번 응답의 지연 시간(초)을 뽑습니다."""
+        if self.latency_median <= 0:
+            return 0.0
+        if self.latency_sigma <= 0:
+            return self.latency_median
+        return self.random.lognormvariate(math.log(self.latency_median), self.latency_sigma)
+
+
+def detect_content_type(body: Dict[str, Any]) -> str:
+    """요청의 response_format 스키마 이름이나 프롬프트의 "type" 값으로 콘텐츠 유형을 찾습니다."""
+    response_format = body.get("response_format") or {}
+    name = (response_format.get("json_schema") or {}).get("name", "")
+    if name.endswith("_content"):
+        return name[:-len("_content")]
+
+    values = {t.value for t in TemplateType}
+    for message in reversed(body.get("messages", [])):
+        for match in re.finditer(r'"type"\s*:\s*"([a-z_]+)"', message.get("content") or ""):
+            if match.group(1) in values:
+                return match.group(1)
+    return TemplateType.DIALOGUE.value
+
+
+def sample_content(content_type: str, rng: random.Random) -> Dict[str, Any]:
+    """콘텐츠 유형에 맞는 그럴듯한 응답 객체를 만듭니다."""
+    topic = rng.choice(TOPICS)
+    content: Dict[str, Any] = {
+        "type": content_type,
+        "topic": topic,
+        "place": rng.choice(PLACES),
+        "keywords": rng.sample(["신청", "예약", "안내", "변경", "확인", "일정", "참여", "방법", "이용", "문의"], 5),
+    }
+    script = " ".join(rng.choice(SENTENCES) for _ in range(rng.randint(4, 8)))
+
+    if content_type in (TemplateType.DIALOGUE.value, TemplateType.IMAGE_LISTENING.value):
+        dialogue = []
+        for _ in range(rng.randint(1, 3)):
+            question, answer = rng.choice(DIALOGUE_LINES)
+            dialogue += [f"A: {question}", f"B: {answer}"]
+        content["dialogue"] = dialogue
+        if content_type == TemplateType.DIALOGUE.value:
+            content["situation"] = f"{content['place']}에서 {topic}에 대해 이야기하는 상황"
+        else:
+            content["choices"] = [f"{place}에서 이야기하는 그림" for place in rng.sample(PLACES, 4)]
+            content["answer_index"] = rng.randrange(4)
+    elif content_type == TemplateType.MONOLOGUE.value:
+        content["situation"] = f"{topic}에 대해 설명하는 상황"
+        content["script"] = script
+    elif content_type in (TemplateType.SHORT_READING.value, TemplateType.LONG_READING.value):
+        content["title"] = f"{topic} 안내"
+        content["text"] = script
+    elif content_type == TemplateType.IMAGE_READING.value:
+        content["description"] = script
+    else:
+        content["script"] = script
+
+    content["tokens"] = count_text_tokens(json.dumps(content, ensure_ascii=False))
+    return content
+
+
+def render_content(content: Dict[str, Any], malformed: bool, rng: random.Random) -> str:
+    """응답 객체를 텍스트로 만듭니다. malformed면 모델이 흔히 내놓는 잘못된 형식으로 만듭니다."""
+    text = json.dumps(content, ensure_ascii=False, indent=2)
+    if not malformed:
+        return text
+    kind = rng.choice(["fence", "prose", "trailing_comma", "single_quote_keys"])
+    if kind == "fence":
+        return f"```json\n{text}\n```"
+    if kind == "prose":
+        return f"요청하신 콘텐츠입니다.\n\n{text}\n\n수정이 필요하면 말씀해 주세요."
+    if kind == "trailing_comma":
+        return text[:-2] + ",\n}"
+    return re.sub(r'"(\w+)":', r"'\1':", text)
+
+
+def truncate_completion(completion: str, max_tokens: Optional[int]) -> str:
+    """응답을 max_tokens 토큰까지만 남깁니다. (추정 토큰 수 기준)"""
+    if not max_tokens or count_text_tokens(completion) <= max_tokens:
+        return completion
+    low, high = 0, len(completion)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if count_text_tokens(completion[:middle]) <= max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    return completion[:low]
+
+
+def usage_for(messages: List[Dict[str, Any]], *completions: str) -> Dict[str, Any]:
+    """요청과 응답(후보가 여러 개면 전체 합)의 추정 토큰 사용량을 만듭니다."""
+    prompt_tokens = sum(count_text_tokens(message.get("content") or "") + 4 for message in messages)
+    completion_tokens = sum(count_text_tokens(completion) for completion in completions)
+    return {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "prompt_tokens_details": {"cached_tokens": 0},
+    }
+
+
+def error_response(status: int, message: str, error_type: str, param: Optional[str] = None,
+                   headers: Optional[Dict[str, str]] = None) -> JSONResponse:
+    """OpenAI 형식의 오류 응답을 만듭니다."""
+    return JSONResponse(
+        {"error": {"message": message, "type": error_type, "param": param, "code": None}},
+        status_code=status,
+        headers=headers,
+    )
+
+
+def create_stub_app(settings: Optional[StubSettings] = None) -> FastAPI:
+    """
+    스텁 서버 애플리케이션을 생성합니다.
+
+    Args:
+        settings: 스텁 동작 설정 (기본값: 지연 0.5초, 오류/잘못된 JSON 없음)
+
+    Returns:
+        FastAPI 애플리케이션 (app.state.stats에 요청 통계 기록)
+    """
+    settings = settings or StubSettings()
+    app = FastAPI(title="OpenAI 호환 스텁")
+    app.state.settings = settings
+    app.state.stats = {"requests": 0, "streams": 0, "ok": 0, "malformed": 0,
+                       "rate_limited": 0, "server_errors": 0, "rejected_format": 0, "truncated": 0}
+
+    @app.get("/v1/models")
+    async def list_models():
+        return {"object": "list", "data": [{"id": "stub-model", "object": "model", "owned_by": "stub"}]}
+
+    @app.get("/stats")
+    async def stats():
+        return app.state.stats
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        rng = settings.random
+        counters = app.state.stats
+        counters["requests"] += 1
+
+        response_format = body.get("response_format")
+        if response_format and not settings.structured_output:
+            counters["rejected_format"] += 1
+            return error_response(400, f"Invalid parameter: 'response_format' of type "
+                                       f"'{response_format.get('type')}' is not supported with this model.",
+                                  "invalid_request_error", param="response_format")
+
+        roll = rng.random()
+        if roll < settings.error_429_rate:
+            counters["rate_limited"] += 1
+            await asyncio.sleep(0.01)
+            return error_response(429, "Rate limit reached for requests (stub)", "rate_limit_error",
+                                  headers={"retry-after-ms": str(settings.retry_after_ms)})
+        if roll < settings.error_429_rate + settings.error_500_rate:
+            counters["server_errors"] += 1
+            await asyncio.sleep(settings.latency() / 2)
+            return error_response(500, "The server had an error while processing your request (stub)",
+                                  "server_error")
+
+        # 구조화된 출력(json_schema)을 요청하면 항상 올바른 JSON 반환
+        structured = (response_format or {}).get("type") == "json_schema"
+        malformed = not structured and rng.random() < settings.malformed_rate
+        counters["malformed"] += int(malformed)
+        content_type = detect_content_type(body)
+        # 후보 n개 (스트리밍은 첫 번째 후보만 사용)
+        candidates = []
+        for _ in range(1 if body.get("stream") else max(1, int(body.get("n") or 1))):
+            completion = render_content(sample_content(content_type, rng), malformed, rng)
+            # max_tokens를 넘는 응답은 잘라서 finish_reason "length"로 반환
+            truncated = truncate_completion(completion, body.get("max_tokens"))
+            finish_reason = "length" if truncated != completion else "stop"
+            counters["truncated"] += int(finish_reason == "length")
+            candidates.append((truncated, finish_reason))
+        completion, finish_reason = candidates[0]
+        usage = usage_for(body.get("messages", []), *(text for text, _ in candidates))
+        model = body.get("model", "stub-model")
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:24]}"
+        latency = settings.latency()
+
+        if body.get("stream"):
+            counters["streams"] += 1
+            include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+            return StreamingResponse(
+                stream_chunks(completion_id, model, completion, usage if include_usage else None,
+                              latency, settings.stream_chunk_chars, counters, finish_reason),
+                media_type="text/event-stream",
+            )
+
+        await asyncio.sleep(latency)
+        counters["ok"] += 1
+        return {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": index,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": reason,
+            } for index, (text, reason) in enumerate(candidates)],
+            "usage": usage,
+        }
+
+    return app
+
+
+async def stream_chunks(completion_id: str, model: str, completion: str, usage: Optional[Dict[str, Any]],
+                        latency: float, chunk_chars: int, counters: Dict[str, int],
+                        finish_reason: str = "stop") -> AsyncIterator[str]:
+    """응답을 chat.completion.chunk SSE 이벤트로 나누어 지연 시간에 걸쳐 보냅니다."""
+    created = int(time.time())
+
+    def event(choices: List[Dict[str, Any]], **extra: Any) -> str:
+        chunk = {"id": completion_id, "object": "chat.completion.chunk", "created": created,
+                 "model": model, "choices": choices, **extra}
+        return f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n"
+
+    pieces = [completion[i:i + chunk_chars] for i in range(0, len(completion), chunk_chars)]
+    # 첫 조각까지의 대기(TTFT)는 지연 시간의 1/4, 나머지는 조각마다 나누어 대기
+    await asyncio.sleep(latency / 4)
+    yield event([{"index": 0, "delta": {"role": "assistant", "content": ""}, "finish_reason": None}])
+    step = (latency * 3 / 4) / max(1, len(pieces))
+    for piece in pieces:
+        await asyncio.sleep(step)
+        yield event([{"index": 0, "delta": {"content": piece}, "finish_reason": None}])
+    yield event([{"index": 0, "delta": {}, "finish_reason": finish_reason}])
+    if usage is not None:
+        yield event([], usage=usage)
+    yield "data: [DONE]\n\n"
+    counters["ok"] += 1
+
+
+def parse_arguments():
+    """명령행 인수를 파싱합니다."""
+    parser = argparse.ArgumentParser(description="OpenAI 호환 chat.completions 스텁 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="서버 호스트 주소 (기본값: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8001, help="서버 포트 (기본값: 8001)")
+    parser.add_argument("--latency-median", type=float, default=0.5, help="지연 시간 중앙값(초) (기본값: 0.5)")
+    parser.add_argument("--latency-sigma", type=float, default=0.4,
+                        help="지연 시간 로그 정규분포 표준편차 (기본값: 0.4, 0이면 고정)")
+    parser.add_argument("--malformed-rate", type=float, default=0.0, help="잘못된 JSON 비율 (기본값: 0)")
+    parser.add_argument("--error-429-rate", type=float, default=0.0, help="429 오류 비율 (기본값: 0)")
+    parser.add_argument("--error-500-rate", type=float, default=0.0, help="500 오류 비율 (기본값: 0)")
+    parser.add_argument("--retry-after-ms", type=int, default=500, help="429 응답의 retry-after-ms (기본값: 500)")
+    parser.add_argument("--no-structured-output", action="store_true",
+                        help="response_format이 있는 요청을 400으로 거부")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_arguments()
+    settings = StubSettings(
+        latency_median=args.latency_median,
+        latency_sigma=args.latency_sigma,
+        malformed_rate=args.malformed_rate,
+        error_429_rate=args.error_429_rate,
+        error_500_rate=args.error_500_rate,
+        retry_after_ms=args.retry_after_ms,
+        structured_output=not args.no_structured_output,
+        seed=args.seed,
+    )
+    print(f"스텁 서버: http://{args.host}:{args.port}/v1 "
+          f"(OPENAI_BASE_URL=http://{args.host}:{args.port}/v1 OPENAI_API_KEY=stub)")
+    uvicorn.run(create_stub_app(settings), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -37,6 +37,101 @@ document.addEventListener('DOMContentLoaded', function () {
         });
     }
 
+    // 스트리밍 생성 (Server-Sent Events) - 도착하는 대로 미리보기에 표시
+    const generateForm = document.getElementById('generate-form');
+    if (generateForm && window.EventSource) {
+        generateForm.addEventListener('submit', function (e) {
+            e.preventDefault();
+            startStreamingGeneration(new URLSearchParams(new FormData(generateForm)));
+        });
+    }
+
+    // 스트리밍 생성 시작 함수
+    function startStreamingGeneration(params) {
+        const preview = document.getElementById('stream-preview');
+        const submitBtn = generateForm.querySelector('button[type="submit"]');
+        if (!preview) {
+            generateForm.submit();
+            return;
+        }
+
+        renderStreamPreview({});
+        document.getElementById('stream-error').classList.add('hidden');
+        document.getElementById('stream-spinner').classList.add('fa-spin');
+        preview.classList.remove('hidden');
+        if (submitBtn) submitBtn.disabled = true;
+
+        const source = new EventSource('/generate/stream?' + params.toString());
+        let finished = false;
+
+        source.addEventListener('delta', function (e) {
+            const data = JSON.parse(e.data);
+            if (data.content) {
+                renderStreamPreview(data.content);
+            }
+        });
+
+        source.addEventListener('done', function (e) {
+            finished = true;
+            source.close();
+
+            const data = JSON.parse(e.data);
+            if (data.validation_error) {
+                console.warn('생성된 콘텐츠 검증 경고:', data.validation_error);
+            }
+
+            // 완성된 콘텐츠를 편집 화면으로 표시
+            document.getElementById('stream-result-content').value = JSON.stringify(data.content);
+            document.getElementById('stream-result-form').submit();
+        });
+
+        source.onerror = function () {
+            source.close();
+            if (finished) return;
+
+            console.error('스트리밍 생성 연결 오류');
+            if (submitBtn) submitBtn.disabled = false;
+            document.getElementById('stream-spinner').classList.remove('fa-spin');
+            const errorBox = document.getElementById('stream-error');
+            errorBox.textContent = '생성 중 연결이 끊어졌습니다. 다시 시도해주세요.';
+            errorBox.classList.remove('hidden');
+        };
+    }
+
+    // 부분 콘텐츠로 스트리밍 미리보기 갱신 함수
+    function renderStreamPreview(content) {
+        document.getElementById('stream-title').textContent = content.topic || content.title || '생성 중...';
+
+        const keywordsBox = document.getElementById('stream-keywords');
+        keywordsBox.replaceChildren();
+        (Array.isArray(content.keywords) ? content.keywords : []).forEach(keyword => {
+            const tag = document.createElement('span');
+            tag.className = 'tag';
+            tag.textContent = keyword;
+            keywordsBox.appendChild(tag);
+        });
+
+        const situationGroup = document.getElementById('stream-situation-group');
+        document.getElementById('stream-situation').textContent = content.situation || '';
+        situationGroup.classList.toggle('hidden', !content.situation);
+
+        const dialogueBox = document.getElementById('stream-dialogue');
+        dialogueBox.replaceChildren();
+        (Array.isArray(content.dialogue) ? content.dialogue : []).forEach(line => {
+            const msg = document.createElement('div');
+            const speaker = String(line).trim().startsWith('B:') ? 'b' : 'a';
+            msg.className = 'msg ' + speaker;
+            msg.textContent = String(line).replace(/^\s*[AB]:\s*/, '');
+            dialogueBox.appendChild(msg);
+        });
+        dialogueBox.classList.toggle('hidden', dialogueBox.children.length === 0);
+
+        const textBox = document.getElementById('stream-text');
+        const text = content.text || content.script || content.description || '';
+        textBox.textContent = text;
+        textBox.classList.toggle('hidden', !text);
+    }
+
     // 인라인 편집 기능 구현
     const editableFields = document.querySelectorAll('.editable-script, .editable-msg');
     const jsonEditor = document.getElementById('json-editor');